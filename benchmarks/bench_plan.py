@@ -0,0 +1,95 @@
+"""
+┌────────────────────────────────────────────────────┐
+│ Benchmark: plan execution vs. tuple interpretation │
+└────────────────────────────────────────────────────┘
+
+ October 2026
+
+ Runs the same procedure with Procedure_Context.procedure_run and
+ Procedure_Context.plan_run, using steps doing nothing, so that only
+ the execution overhead is measured.
+
+ Usage: PYTHONPATH=src python benchmarks/bench_plan.py
+"""
+
+import timeit
+import logging
+
+from pyrouet.maestro.procedure.ctx  import Procedure_Context
+from pyrouet.maestro.procedure.plan import Procedure_Plan
+
+from pyrouet.maestro.procedure.step import (
+    Step_Action,
+    Step_Measure,
+    Step_Measure_Transform
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Above
+)
+
+# ┌────────────────────────────────────────┐
+# │ Benchmark steps                        │
+# └────────────────────────────────────────┘
+
+class Bench_Action(Step_Action):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def _impl(self, ctx, path_stack):
+        pass
+
+
+class Bench_Measure(Step_Measure):
+    def __init__(self, value, constraint, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+
+    def _measure(self, ctx, path_stack, values):
+        return self.value
+
+
+class Bench_Transform(Step_Measure_Transform):
+    def __init__(self, value_from, constraint, unit = "", **kwargs):
+        super().__init__(value_from, constraint, unit, **kwargs)
+
+
+def bench_procedure(n_subprocs, n_steps):
+    """
+    Builds a procedure with n_subprocs subprocedures of
+    3*n_steps steps each.
+    """
+
+    subproc = tuple()
+    for i in range(n_steps):
+        subproc += (
+            (f"action{i}",    Bench_Action,    {}),
+            (f"measure{i}",   Bench_Measure,   {"value": 1.0, "constraint": Constraint_Above(0.0), "save_value": True}),
+            (f"transform{i}", Bench_Transform, {"value_from": f"^measure{i}", "constraint": Constraint_Above(0.0)}),
+        )
+
+    return tuple( (f"sub{i}", subproc) for i in range(n_subprocs) )
+
+# ┌────────────────────────────────────────┐
+# │ Main                                   │
+# └────────────────────────────────────────┘
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+
+    ctx = Procedure_Context()
+
+    for n_subprocs, n_steps in ((1, 10), (10, 10), (20, 50)):
+        proc   = bench_procedure(n_subprocs, n_steps)
+        n_runs = max(10, 3000 // (n_subprocs*n_steps))
+
+        t_compile = timeit.timeit(lambda: Procedure_Plan(proc), number=n_runs) / n_runs
+        plan      = Procedure_Plan(proc)
+
+        t_interp  = min(timeit.repeat(lambda: ctx.procedure_run(proc), number=n_runs, repeat=5)) / n_runs
+        t_plan    = min(timeit.repeat(lambda: ctx.plan_run(plan),      number=n_runs, repeat=5)) / n_runs
+
+        print(f"{n_subprocs:3d} subprocs x {3*n_steps:3d} steps: "
+              f"interpreted {t_interp*1e3:8.3f} ms, "
+              f"plan {t_plan*1e3:8.3f} ms ({t_interp/t_plan:4.2f}x), "
+              f"compile {t_compile*1e3:8.3f} ms")
@@ -0,0 +1,95 @@
+"""
+┌─────────────────────────────────────────────────┐
+│ Benchmark: memory footprint of kept run results │
+└─────────────────────────────────────────────────┘
+
+ October 2026
+
+ Runs a procedure of actions and measures many times, keeping all the
+ results in memory as a shift dashboard does, and reports the memory
+ allocated per run and per step result (tracemalloc).
+
+ Usage: PYTHONPATH=src python benchmarks/bench_results_memory.py
+"""
+
+import gc
+import logging
+import tracemalloc
+
+from pyrouet.maestro.procedure.ctx import Procedure_Context
+
+from pyrouet.maestro.procedure.step import (
+    Step_Action,
+    Step_Measure
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Range
+)
+
+# ┌────────────────────────────────────────┐
+# │ Benchmark steps                        │
+# └────────────────────────────────────────┘
+
+class Bench_Action(Step_Action):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def _impl(self, ctx, path_stack):
+        pass
+
+
+class Bench_Measure(Step_Measure):
+    def __init__(self, value, constraint, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+
+    def _measure(self, ctx, path_stack, values):
+        return self.value
+
+
+def bench_procedure(n_subprocs, n_steps):
+    """
+    Builds a procedure with n_subprocs subprocedures of
+    2*n_steps steps each.
+    """
+
+    subproc = tuple()
+    for i in range(n_steps):
+        subproc += (
+            (f"action{i}",  Bench_Action,  {}),
+            (f"measure{i}", Bench_Measure, {"value": 1.5, "unit": "V",
+                                            "constraint": Constraint_Range(ref_min=1.0, ref_max=2.0)}),
+        )
+
+    return tuple( (f"sub{i}", subproc) for i in range(n_subprocs) )
+
+# ┌────────────────────────────────────────┐
+# │ Main                                   │
+# └────────────────────────────────────────┘
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+
+    ctx = Procedure_Context()
+
+    for n_subprocs, n_steps, n_runs in ((1, 10, 1000), (10, 30, 200)):
+        proc    = bench_procedure(n_subprocs, n_steps)
+        n_steps = n_subprocs*(2*n_steps + 1)
+
+        ctx.procedure_run(proc) # Warm up the interned options
+
+        gc.collect()
+        tracemalloc.start()
+
+        results = [ctx.procedure_run(proc)[0] for i in range(n_runs)]
+
+        gc.collect()
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{n_runs:5d} runs of {n_steps:4d} results: "
+              f"{size/n_runs/1024:8.1f} KiB per run, "
+              f"{size/(n_runs*n_steps):6.0f} bytes per result")
+
+        del results
@@ -57,3 +57,21 @@ from .numeric import (
     Constraint_Range
 )
 
+
+
+# ┌────────────────────────────────────────┐
+# │ Array constraints                      │
+# └────────────────────────────────────────┘
+
+from .array import (
+    Constraint_Array_Range,
+    Constraint_Envelope,
+    Constraint_Mask
+)
+
+
+# ┌────────────────────────────────────────┐
+# │ Limit tables                           │
+# └────────────────────────────────────────┘
+
+from .table import Limit_Table
@@ -0,0 +1,188 @@
+"""
+┌────────────────────────────────┐
+│ Array constraints for measures │
+└────────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import hashlib
+
+from pyrouet.maestro.objects.constraints import Constraint_Object
+from dataclasses                         import dataclass
+from typing                              import List, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+
+# ┌────────────────────────────────────────┐
+# │ Base array constraint                  │
+# └────────────────────────────────────────┘
+
+@dataclass
+class Constraint_Array(Constraint_Object):
+    """
+    Constraint evaluated on all the elements of an array value at once (NumPy
+    required). Each element gets a margin to its limits, negative if it fails.
+    The failing indices and the worst margin are reported in the measure
+    result options.
+    """
+
+    report_max_indices = 32 # Maximum count of reported failing indices
+
+    def _margins(self, v):
+        """
+        Returns the margin of each element, negative for failing ones
+        """
+        pass # pragma: no cover
+
+    def _array(self, v):
+        if np is None:
+            raise ImportError("NumPy is required for array constraints")
+
+        return np.asarray(v, dtype=float)
+
+    def _validate(self, v):
+        return bool(np.all(self._margins(self._array(v)) >= 0))
+
+    def validate_report(self, v):
+        if v is None:
+            return False, None
+
+        margins = self._margins(self._array(v))
+        failed  = np.flatnonzero(margins < 0)
+        worst   = int(np.argmin(margins)) if margins.size else None
+
+        details = {
+            "failed_count":   int(failed.size),
+            "failed_indices": failed[:self.report_max_indices].tolist(),
+            "worst_index":    worst,
+            "worst_margin":   float(margins.flat[worst]) if (worst is not None) else None
+        }
+
+        return (failed.size == 0), details
+
+    def options_get(self):
+        # Arrays are summarized to keep the description compact
+        return {k: _option_compact(v) for k, v in super().options_get().items()}
+
+
+def _option_compact(v):
+    """
+    Returns a compact description of a limit: scalars and short lists
+    are kept, large arrays are summarized with a digest of their content.
+    """
+
+    if (np is None) or (v is None) or np.isscalar(v):
+        return v
+
+    arr = np.asarray(v, dtype=float)
+    if arr.size <= 16:
+        return arr.tolist()
+
+    return {
+        "size":   int(arr.size),
+        "min":    float(arr.min()),
+        "max":    float(arr.max()),
+        "sha1":   hashlib.sha1(np.ascontiguousarray(arr).tobytes()).hexdigest()
+    }
+
+
+# ┌────────────────────────────────────────┐
+# │ Array constraints                      │
+# └────────────────────────────────────────┘
+
+@dataclass
+class Constraint_Array_Range(Constraint_Array):
+    """
+    Per-element range: ref_min and ref_max are scalars,
+    or arrays giving a limit curve for each element.
+    """
+
+    constraint_class = "array_range"
+
+    ref_min: Union[float, List[float]] = None
+    ref_max: Union[float, List[float]] = None
+
+    def _margins(self, v):
+        margins = np.full(v.shape, np.inf)
+
+        if self.ref_min is not None:
+            margins = np.minimum(margins, v - np.asarray(self.ref_min, dtype=float))
+
+        if self.ref_max is not None:
+            margins = np.minimum(margins, np.asarray(self.ref_max, dtype=float) - v)
+
+        return margins
+
+
+@dataclass
+class Constraint_Envelope(Constraint_Array):
+    """
+    Per-element tolerance around a reference curve: absolute
+    tolerance, and/or tolerance in percent of the reference.
+    """
+
+    constraint_class = "envelope"
+
+    ref_value:       List[float]
+    tolerance:       float = 0.0
+    tolerance_pcent: float = 0.0
+
+    def _margins(self, v):
+        ref = np.asarray(self.ref_value, dtype=float)
+        tol = self.tolerance + np.abs(ref)*(self.tolerance_pcent/100.0)
+
+        return tol - np.abs(v - ref)
+
+
+@dataclass
+class Constraint_Mask(Constraint_Array):
+    """
+    Upper and/or lower mask given as (x, limit) breakpoints, linearly
+    interpolated over the elements. The x coordinate of element i is
+    x_start + i*x_step (frequency of FFT bin i, for example).
+    """
+
+    constraint_class = "mask"
+
+    upper:   List[Tuple[float, float]] = None
+    lower:   List[Tuple[float, float]] = None
+    x_start: float                     = 0.0
+    x_step:  float                     = 1.0
+
+    def _limit(self, points, x):
+        points = np.asarray(points, dtype=float)
+        return np.interp(x, points[:, 0], points[:, 1])
+
+    def _margins(self, v):
+        x       = self.x_start + np.arange(v.size)*self.x_step
+        v       = v.ravel()
+        margins = np.full(v.shape, np.inf)
+
+        if self.upper is not None:
+            margins = np.minimum(margins, self._limit(self.upper, x) - v)
+
+        if self.lower is not None:
+            margins = np.minimum(margins, v - self._limit(self.lower, x))
+
+        return margins
@@ -24,6 +24,8 @@
  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """
 
+import math
+
 from pyrouet.maestro.objects.constraints import Constraint_Object
 from dataclasses                         import dataclass,field,asdict
 
@@ -35,6 +37,9 @@ class Constraint_Below(Constraint_Object):
     def _validate(self,v):
         return v <= self.ref_value
 
+    def interval(self):
+        return (-math.inf, self.ref_value)
+
 
 @dataclass
 class Constraint_Above(Constraint_Object):
@@ -44,6 +49,9 @@ class Constraint_Above(Constraint_Object):
     def _validate(self,v):
         return v >= self.ref_value
 
+    def interval(self):
+        return (self.ref_value, math.inf)
+
 
 @dataclass
 class Constraint_Tolerance(Constraint_Object):
@@ -55,6 +63,10 @@ class Constraint_Tolerance(Constraint_Object):
     def _validate(self,v):
         return abs(v-self.ref_value)/(self.ref_value) < (self.tolerance_pcent/100.0)
 
+    def interval(self):
+        delta = abs(self.ref_value)*(self.tolerance_pcent/100.0)
+        return (self.ref_value - delta, self.ref_value + delta)
+
 
 @dataclass
 class Constraint_Range(Constraint_Object):
@@ -65,3 +77,6 @@ class Constraint_Range(Constraint_Object):
 
     def _validate(self,v):
         return (v >= self.ref_min) and (v <= self.ref_max)
+
+    def interval(self):
+        return (self.ref_min, self.ref_max)
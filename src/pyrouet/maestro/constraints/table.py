@@ -0,0 +1,221 @@
+"""
+┌────────────────────────────────────────────────┐
+│ Limit tables: constraints indexed by step path │
+└────────────────────────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import csv
+import math
+
+from typing import Dict, Iterable
+
+from pyrouet.maestro.objects.constraints import Constraint_Object
+from pyrouet.maestro.objects.results     import (
+    Result_Procedure,
+    Result_Container,
+    Result_Measure
+)
+
+from .numeric import (
+    Constraint_Below,
+    Constraint_Above,
+    Constraint_Tolerance,
+    Constraint_Range
+)
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+try:
+    import tomllib
+except ImportError: # pragma: no cover
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+# ┌────────────────────────────────────────┐
+# │ Supported constraints                  │
+# └────────────────────────────────────────┘
+
+# Constraint class → (kind code, constraint object class, option of a column, option of b column)
+LIMIT_KINDS = {
+    "below":     (0, Constraint_Below,     "ref_value", None             ),
+    "above":     (1, Constraint_Above,     "ref_value", None             ),
+    "range":     (2, Constraint_Range,     "ref_min",   "ref_max"        ),
+    "tolerance": (3, Constraint_Tolerance, "ref_value", "tolerance_pcent"),
+}
+
+
+# ┌────────────────────────────────────────┐
+# │ Limit table                            │
+# └────────────────────────────────────────┘
+
+class Limit_Table:
+    """
+    Scalar limits of a product, indexed by step path. Limits are stored in
+    columns (kind, a, b), so that all the measures of a run can be graded
+    in one vectorized pass (see regrade).
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, any]]):
+        """
+        Each row gives the step path, the constraint class, its options
+        and an optional unit: {"path": "audio.rms", "constraint": "range",
+        "ref_min": 0.1, "ref_max": 0.2, "unit": "V"}
+        """
+
+        self.paths       = list()
+        self.index       = dict() # path → row
+        self.units       = list()
+        self.constraints = list() # Constraint object of each row
+
+        kinds, a, b      = list(), list(), list()
+
+        for row in rows:
+            path = row["path"]
+            if path in self.index:
+                raise ValueError(f"Duplicate limit for step {path}")
+
+            try:
+                kind, cnst_class, opt_a, opt_b = LIMIT_KINDS[row["constraint"]]
+            except KeyError:
+                raise ValueError(f"Unsupported constraint for step {path}: {row['constraint']}")
+
+            options = {opt: float(row[opt]) for opt in (opt_a, opt_b) if opt is not None}
+
+            self.index[path] = len(self.paths)
+            self.paths.append(path)
+            self.units.append(row.get("unit", None) or None)
+            self.constraints.append(cnst_class(**options))
+
+            kinds.append(kind)
+            a.append(options[opt_a])
+            b.append(options[opt_b] if (opt_b is not None) else math.nan)
+
+        if np is not None:
+            self.kinds = np.asarray(kinds, dtype=np.int8)
+            self.a     = np.asarray(a,     dtype=float)
+            self.b     = np.asarray(b,     dtype=float)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __contains__(self, path):
+        return path in self.index
+
+    # ──────────────── Loading ─────────────── #
+
+    @classmethod
+    def from_csv(cls, path: str):
+        """
+        Loads a CSV table, with path, constraint, unit and constraint
+        options (ref_value, ref_min, ref_max, tolerance_pcent) columns.
+        Unused option cells are left empty.
+        """
+
+        with open(path, newline="") as fhandle:
+            return cls(list(csv.DictReader(fhandle)))
+
+    @classmethod
+    def from_toml(cls, path: str):
+        """
+        Loads a TOML table, as an array of limits tables:
+
+        [[limits]]
+        path       = "audio.rms"
+        constraint = "range"
+        ref_min    = 0.1
+        ref_max    = 0.2
+        """
+
+        if tomllib is None:
+            raise ImportError("tomllib (Python ≥ 3.11) or tomli is required to load TOML limit tables")
+
+        with open(path, "rb") as fhandle:
+            return cls(tomllib.load(fhandle).get("limits", list()))
+
+    # ──────────────── Lookup ──────────────── #
+
+    def constraint_get(self, path: str) -> Constraint_Object:
+        """
+        Returns the constraint of a step, None if not in the table
+        """
+
+        row = self.index.get(path)
+        return self.constraints[row] if (row is not None) else None
+
+    def unit_get(self, path: str) -> str:
+        row = self.index.get(path)
+        return self.units[row] if (row is not None) else None
+
+    # ─────────────── Regrading ────────────── #
+
+    def regrade(self, res: Result_Procedure) -> Dict[str, bool]:
+        """
+        Grades the scalar measures of a run result against the table. Returns
+        the verdict of each measure found in the table, by step path. The
+        run results are not modified.
+        """
+
+        measures = dict(self._measures(res, list()))
+
+        if np is None:
+            return {path: self.constraint_get(path).validate(v) for path, v in measures.items()}
+
+        rows   = np.fromiter((self.index[p] for p in measures), dtype=np.intp, count=len(measures))
+        v      = np.fromiter(measures.values(), dtype=float, count=len(measures))
+
+        kinds  = self.kinds[rows]
+        a      = self.a[rows]
+        b      = self.b[rows]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            passed = np.select(
+                [ kinds == 0, kinds == 1, kinds == 2, kinds == 3 ],
+                [ v <= a,
+                  v >= a,
+                  (v >= a) & (v <= b),
+                  (np.abs(v-a)/a) < (b/100.0) ],
+                default = False
+            )
+
+        return dict(zip(measures.keys(), passed.tolist()))
+
+    def _measures(self, res, path):
+        """
+        Yields the path and value of the scalar measures in the table
+        """
+
+        for r in res.tests:
+            if isinstance(r, Result_Container):
+                yield from self._measures(r, path + [r.step_id])
+
+            elif isinstance(r, Result_Measure):
+                if isinstance(r.value, bool) or not isinstance(r.value, (int, float)):
+                    continue
+
+                step_path = ".".join(path + [r.step_id])
+                if step_path in self.index:
+                    yield step_path, r.value
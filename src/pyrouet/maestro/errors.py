@@ -45,11 +45,30 @@ class Procedure_Abort_Error(Procedure_Error):
     def __init__(self, path_stack=None):
         super().__init__("Procedure aborted", path_stack)
 
+class Procedure_Timeout_Error(Procedure_Abort_Error):
+    def __init__(self, timeout, path_stack=None):
+        super().__init__(path_stack)
+        self.msg     = f"Timeout after {timeout} s"
+        self.timeout = timeout
+
 class Procedure_Stop_Error(Procedure_Error):
     def __init__(self, path_stack=None):
         super().__init__("Procedure stopped", path_stack)
 
 class Procedure_Constraint_Error(Procedure_Error):
     def __init__(self, constraint, value, path_stack=None):
-        super().__init__(f"Constraint '{constraint.constraint_class}' with options '{constraint.options}' failed for value '{value}'", path_stack)
-        self.value = value
+        super().__init__(None, path_stack)
+        self.constraint = constraint # Shared Constraint_Description
+        self.value      = value
+
+    @property
+    def msg(self):
+        # Formatted on demand: most failed measure errors are never printed
+        if self._msg is None:
+            self._msg = f"Constraint '{self.constraint.constraint_class}' with options '{self.constraint.options}' failed for value '{self.value}'"
+
+        return self._msg
+
+    @msg.setter
+    def msg(self, msg):
+        self._msg = msg
@@ -27,7 +27,14 @@
 
 from abc         import ABC,abstractmethod
 from dataclasses import dataclass, field, asdict
+from threading   import Lock
 from typing      import Dict
+from weakref     import WeakValueDictionary
+
+from .options    import (
+    frozen_key,
+    options_intern
+)
 
 
 # ┌────────────────────────────────────────┐
@@ -42,6 +49,47 @@ class Constraint_Object:
         if v is None: return False
         else        : return bool(self._validate(v))
 
+    def validate_report(self,v):
+        """
+        Validates v, returning the result and the validation details
+        to store in the measure result options (None if no details).
+        """
+        return self.validate(v), None
+
+    def interval(self):
+        """
+        Returns the (low, high) bounds of the accepted values, or None if the
+        constraint is not an interval. Used by streaming measures to end early.
+        """
+        return None
+
+    def options_get(self):
+        """
+        Returns the constraint options, stored in the constraint description
+        """
+        cnst_dict = asdict(self)
+        del cnst_dict["constraint_class"]
+
+        return cnst_dict
+
+    def description_get(self):
+        """
+        Returns the immutable description of the constraint, computed once and
+        shared by the measure results. Setting an attribute invalidates it, but
+        in-place modifications of mutable limits (lists) are not detected.
+        """
+
+        desc = self.__dict__.get("_description")
+        if desc is None:
+            desc = Constraint_Description.interned(self.constraint_class, self.options_get())
+            self.__dict__["_description"] = desc
+
+        return desc
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        self.__dict__.pop("_description", None)
+
     @abstractmethod
     def _validate(self,v): pass
 
@@ -51,21 +99,40 @@ class Constraint_Object:
 # └────────────────────────────────────────┘
 
 # constraint description object: Read/write from results
-# file
+# file. Descriptions are immutable, and shared by all the
+# results of equal constraints. Interned descriptions are
+# dropped with the last constraint or result using them.
 
-@dataclass
+_descriptions      = WeakValueDictionary() # (constraint class, frozen options key) → description
+_descriptions_lock = Lock()
+
+@dataclass(frozen=True)
 class Constraint_Description:
     constraint_class: str
     options: Dict[str, any]
 
     @classmethod
     def from_constraint(cls, c: Constraint_Object):
-        cnst_dict  = asdict(c)
-        cnst_class = cnst_dict["constraint_class"]
+        return c.description_get()
 
-        del cnst_dict["constraint_class"]
+    @classmethod
+    def none(cls):
+        return cls.interned("none", dict())
 
-        return cls(
-            constraint_class=cnst_class,
-            options         = cnst_dict
-        )
+    @classmethod
+    def interned(cls, constraint_class: str, options: Dict[str, any]):
+        """
+        Returns the shared description for the constraint class and options
+        """
+
+        try:
+            key = (constraint_class, frozen_key(options))
+        except TypeError:
+            return cls(constraint_class, options_intern(options)) # Not shareable
+
+        with _descriptions_lock:
+            desc = _descriptions.get(key)
+            if desc is None:
+                desc = _descriptions[key] = cls(constraint_class, options_intern(options))
+
+        return desc
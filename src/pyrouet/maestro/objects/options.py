@@ -0,0 +1,124 @@
+"""
+┌──────────────────────────┐
+│ Shared immutable options │
+└──────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+from threading import Lock
+from typing    import Dict
+from weakref   import WeakValueDictionary
+
+
+# ┌────────────────────────────────────────┐
+# │ Frozen options dictionary              │
+# └────────────────────────────────────────┘
+
+class Frozen_Options(dict):
+    """
+    Read-only options dictionary, shared by the results of the same step or
+    constraint (see options_intern). Mutating methods raise TypeError: copy
+    it to a plain dict to add per-run options.
+    """
+
+    __slots__ = ("__weakref__",) # Interning table holds weak references
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Shared options are read-only, copy them to a dict first")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__     = _readonly
+    clear       = _readonly
+    pop         = _readonly
+    popitem     = _readonly
+    setdefault  = _readonly
+    update      = _readonly
+
+    def __reduce__(self):
+        # Unpickled and copied objects are rebuilt from their items
+        return (type(self), (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+# ┌────────────────────────────────────────┐
+# │ Interning                              │
+# └────────────────────────────────────────┘
+
+# Entries are dropped with the last result or description using them
+_interned      = WeakValueDictionary() # Frozen key → Frozen_Options
+_interned_lock = Lock()
+
+def frozen_key(v):
+    """
+    Returns a hashable key of a value. The types are part of the
+    key, so that equal values of different types (1, 1.0 and True)
+    are not interned together.
+    """
+
+    if isinstance(v, dict):
+        return (dict,) + tuple((k, frozen_key(x)) for k, x in v.items())
+
+    elif isinstance(v, (list, tuple)):
+        return (type(v),) + tuple(frozen_key(x) for x in v)
+
+    hash(v) # TypeError for other unhashable values
+    return (type(v), v)
+
+def _frozen(v):
+    """
+    Returns a read-only copy of a nested option value: lists become
+    tuples, and dictionaries Frozen_Options.
+    """
+
+    if isinstance(v, dict):
+        return Frozen_Options((k, _frozen(x)) for k, x in v.items())
+
+    elif isinstance(v, (list, tuple)):
+        return tuple(_frozen(x) for x in v)
+
+    return v
+
+def options_intern(dd: Dict[str, any]) -> Frozen_Options:
+    """
+    Returns the shared Frozen_Options instance equal to dd, with read-only
+    nested values. Options with unhashable values (arrays...) are frozen
+    without sharing.
+    """
+
+    if isinstance(dd, Frozen_Options):
+        return dd
+
+    try:
+        key = frozen_key(dd)
+    except TypeError:
+        return _frozen(dd)
+
+    with _interned_lock:
+        options = _interned.get(key)
+        if options is None:
+            options = _interned[key] = _frozen(dd)
+
+    return options
@@ -25,7 +25,7 @@
  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing      import (
     ClassVar,
     List,
@@ -40,10 +40,38 @@ from .constraints import (
 
 from copy         import deepcopy
 
+# ┌────────────────────────────────────────┐
+# │ Slotted dataclasses                    │
+# └────────────────────────────────────────┘
+
+def _slotted(cls):
+    """
+    Returns a slotted copy of a result dataclass, as results are kept by the
+    thousands. Only the fields added by the class get slots (dataclass(slots=True)
+    repeats the slots of the base classes before Python 3.11). Fields with
+    init=False, like step_class, stay class attributes.
+    """
+
+    inherited = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(getattr(base, "__slots__", tuple()))
+
+    names    = tuple(f.name for f in fields(cls) if f.init and (f.name not in inherited))
+    cls_dict = dict(cls.__dict__)
+
+    for name in names + ("__dict__", "__weakref__"):
+        cls_dict.pop(name, None) # Defaults are kept by the dataclass __init__
+
+    cls_dict["__slots__"] = names
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
 # ┌────────────────────────────────────────┐
 # │ Base result object                     │
 # └────────────────────────────────────────┘
 
+@_slotted
 @dataclass
 class Result_Object:
     err:       Optional[Exception]     = None # Exception object
@@ -57,16 +85,31 @@ class Result_Object:
 # │ Procedure result object                │
 # └────────────────────────────────────────┘
 
+@_slotted
 @dataclass
 class Result_Procedure(Result_Object):
     tests: List[Result_Object] = field(default_factory=list)
     result: bool = None
 
 
+# ┌────────────────────────────────────────┐
+# │ Panel result object                    │
+# └────────────────────────────────────────┘
+
+@_slotted
+@dataclass
+class Result_Panel(Result_Object):
+    duts:   Dict[str, Result_Procedure] = field(default_factory=dict) # Result for each DUT
+    passed: List[str]                   = field(default_factory=list) # IDs of passed DUTs
+    failed: List[str]                   = field(default_factory=list) # IDs of failed DUTs
+    result: bool = None
+
+
 # ┌────────────────────────────────────────┐
 # │ Identifiable result object             │
 # └────────────────────────────────────────┘
 
+@_slotted
 @dataclass
 class Result_ID_Object(Result_Object):
     step_class: str = field(default="", init=False)
@@ -77,6 +120,7 @@ class Result_ID_Object(Result_Object):
 # │ Container result object                │
 # └────────────────────────────────────────┘
 
+@_slotted
 @dataclass
 class Result_Container(Result_ID_Object):
     step_class = "container"
@@ -88,6 +132,7 @@ class Result_Container(Result_ID_Object):
 # │ Action result object                   │
 # └────────────────────────────────────────┘
 
+@_slotted
 @dataclass
 class Result_Action(Result_ID_Object):
     step_class             = "action"
@@ -98,11 +143,12 @@ class Result_Action(Result_ID_Object):
 # │ Measure result object                  │
 # └────────────────────────────────────────┘
 
+@_slotted
 @dataclass
 class Result_Measure(Result_ID_Object):
     step_class = "measure"
 
-    constraint: Constraint_Description = Constraint_Description(constraint_class="none", options=dict())
+    constraint: Constraint_Description = field(default_factory=Constraint_Description.none)
     unit: str = ""
     result: bool = False
 
@@ -110,6 +156,24 @@ class Result_Measure(Result_ID_Object):
     value: Optional[any] = None
 
 
+# ┌────────────────────────────────────────┐
+# │ Skipped step result object             │
+# └────────────────────────────────────────┘
+
+@_slotted
+@dataclass
+class Result_Skipped(Result_ID_Object):
+    """
+    Step not executed by decision of a skip policy. It doesn't
+    change the verdict of its procedure (result is True).
+    """
+
+    step_class = "skipped"
+
+    result: bool = True
+    reason: str  = ""
+
+
 # ┌────────────────────────────────────────┐
 # │ Construct from dict                    │
 # └────────────────────────────────────────┘
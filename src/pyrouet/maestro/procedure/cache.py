@@ -0,0 +1,134 @@
+"""
+┌──────────────────────────────────────────────┐
+│ Step result cache: skip already passed steps │
+└──────────────────────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+ 
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+ 
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+ 
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import shelve
+import logging
+
+from threading   import Lock
+from typing      import Dict, List
+
+from pyrouet.maestro.objects.constraints import (
+    Constraint_Description
+)
+
+# ┌────────────────────────────────────────┐
+# │ Result cache                           │
+# └────────────────────────────────────────┘
+
+class Procedure_Result_Cache:
+    def __init__(self, path: str, dut_id: str, version: str,
+                 fingerprint: Dict[str, any] = None):
+        """
+        Persistent cache of the passed step results, for a given DUT and
+        procedure version. When the DUT is tested again, the non-phony steps
+        that already passed are not executed: their result and saved value
+        are restored instead.
+
+        - path:        Path of the cache file (shelve database)
+        - dut_id:      DUT identity, for instance its serial number
+        - version:     Procedure version
+        - fingerprint: Invalidation keys (firmware version, limits file revision, etc.).
+                       Results recorded with another fingerprint are dropped.
+
+        Measure results are also dropped if the constraint of the step changed.
+        """
+
+        self.log         = logging.getLogger(__file__)
+
+        self.path        = path
+        self.dut_id      = dut_id
+        self.version     = version
+        self.fingerprint = dict(fingerprint or dict())
+
+        self.lock        = Lock()
+        self.db          = shelve.open(path)
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    # ──────────────── Access ──────────────── #
+
+    def key(self, path_stack: List[str]):
+        return f"{self.dut_id}|{self.version}|{'.'.join(path_stack)}"
+
+    def get(self, path_stack: List[str], step):
+        """
+        Returns the cached entry for the step, as a dict with the
+        "result" and the saved "value" if any. Returns None if the step
+        was not cached or the cached entry is no longer valid.
+        """
+
+        key = self.key(path_stack)
+
+        with self.lock:
+            entry = self.db.get(key, None)
+
+            if entry is None:
+                return None
+
+            if (entry["fingerprint"] != self.fingerprint) or \
+               (entry["constraint"]  != self._constraint(step)):
+                self.log.info(f"Invalidated cached result for {key}")
+                del self.db[key]
+                return None
+
+        return entry
+
+    def set(self, path_stack: List[str], step, result, value_saved: bool = False, value: any = None):
+        """
+        Records a passed step result, and the value saved by the step if any
+        """
+
+        entry = {
+            "fingerprint": self.fingerprint,
+            "constraint":  self._constraint(step),
+            "result":      result,
+            "value_saved": value_saved,
+            "value":       value
+        }
+
+        with self.lock:
+            self.db[self.key(path_stack)] = entry
+
+    def invalidate(self, path_prefix: List[str] = None):
+        """
+        Drops the cached results of the DUT for the current procedure version.
+        If path_prefix is given, only the results of the corresponding
+        step or subprocedure are dropped.
+        """
+
+        base   = self.key(path_prefix or list())
+        prefix = (base + ".") if path_prefix else base
+
+        with self.lock:
+            for key in [k for k in self.db.keys() if (k == base) or k.startswith(prefix)]:
+                del self.db[key]
+
+    # ─────────────── Internals ────────────── #
+
+    @staticmethod
+    def _constraint(step):
+        constraint = getattr(step, "constraint", None)
+        return Constraint_Description.from_constraint(constraint) if constraint is not None else None
@@ -0,0 +1,167 @@
+"""
+┌─────────────────────────────────────────┐
+│ Checkpoint and resume of procedure runs │
+└─────────────────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+ 
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+ 
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+ 
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import os
+import io
+import time
+import pickle
+import logging
+
+from threading   import Lock
+from typing      import List
+
+# ┌────────────────────────────────────────┐
+# │ Procedure checkpoint                   │
+# └────────────────────────────────────────┘
+
+class Procedure_Checkpoint:
+    def __init__(self, path: str, interval: float = 0, sync: bool = False):
+        """
+        Records each executed step (result, saved value, and registered errors)
+        to a local file, as appended pickle frames. An interrupted run can then
+        be resumed with Procedure_Context.procedure_resume: recorded steps are
+        restored instead of executed.
+
+        - path:     Path of the checkpoint file
+        - interval: Minimum time between two writes to the file, in seconds.
+                    0 writes each step as soon as it is done.
+        - sync:     Force the write to disk (fsync) after each write
+        """
+
+        self.log         = logging.getLogger(__file__)
+
+        self.path        = path
+        self.interval    = interval
+        self.sync        = sync
+
+        self.lock        = Lock()
+        self.buffer      = io.BytesIO()
+        self.t_write     = 0
+
+        self.resuming    = False
+        self.restored    = dict() # Step path → record, for resumed runs
+
+    # ───────────── Run lifecycle ──────────── #
+
+    def begin(self):
+        """
+        Called when the root procedure starts. Starts a new checkpoint
+        file, unless the run is being resumed.
+        """
+
+        with self.lock:
+            if not self.resuming:
+                open(self.path, "wb").close()
+
+            self.t_write = time.time()
+
+    def end(self):
+        """
+        Called when the root procedure ends. Writes the pending records.
+        """
+
+        with self.lock:
+            self._write()
+
+            self.resuming = False
+            self.restored = dict()
+
+    def load(self):
+        """
+        Loads the records of the interrupted run, to resume it.
+        Returns the number of loaded records.
+        """
+
+        records = list()
+
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as fhandle:
+                while True:
+                    try:
+                        records.append(pickle.load(fhandle))
+
+                    except EOFError:
+                        break
+
+                    except Exception as exc:
+                        # Last record was partially written
+                        self.log.warning(f"Truncated checkpoint file {self.path}: {exc}")
+                        break
+
+        with self.lock:
+            self.resuming = True
+            self.restored = { tuple(rec["path"]): rec for rec in records }
+
+        return len(records)
+
+    # ─────────────── Records ──────────────── #
+
+    def record(self, path_stack: List[str], result, value_saved: bool, value: any, errors: List):
+        """
+        Records an executed step
+        """
+
+        rec = {
+            "path":        tuple(path_stack),
+            "result":      result,
+            "value_saved": value_saved,
+            "value":       value,
+            "errors":      list(errors)
+        }
+
+        try:
+            frame = pickle.dumps(rec)
+
+        except Exception as exc:
+            # The step will be executed again on resume
+            self.log.warning(f"Cannot checkpoint step {'.'.join(path_stack)}: {exc}")
+            return
+
+        with self.lock:
+            self.buffer.write(frame)
+
+            if (time.time() - self.t_write) >= self.interval:
+                self._write()
+
+    def restore(self, path_stack: List[str]):
+        """
+        Returns the record of a step for a resumed run, None if the
+        step was not recorded.
+        """
+
+        with self.lock:
+            return self.restored.pop(tuple(path_stack), None)
+
+    def _write(self):
+        data = self.buffer.getvalue()
+        if data:
+            with open(self.path, "ab") as fhandle:
+                fhandle.write(data)
+                fhandle.flush()
+
+                if self.sync:
+                    os.fsync(fhandle.fileno())
+
+        self.buffer  = io.BytesIO()
+        self.t_write = time.time()
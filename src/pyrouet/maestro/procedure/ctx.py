@@ -28,16 +28,42 @@
 import traceback
 import time
 import logging
+import asyncio
 
 from typing      import List, Dict
 from collections import OrderedDict
 from dataclasses import dataclass, field
+from threading   import Event, Lock, Timer
+from contextlib  import contextmanager
+
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    wait,
+    FIRST_COMPLETED
+)
 
 from pyrouet.maestro.procedure.step import (
     Step_Base,
     Step_Action
 )
 
+from pyrouet.maestro.procedure.values import (
+    Procedure_Context_Values
+)
+
+from pyrouet.maestro.procedure.plan import (
+    Procedure_Plan,
+    entries_deps,
+    entries_consumers,
+    PLAN_STEP,
+    PLAN_ENTER
+)
+
+from pyrouet.maestro.objects.options import (
+    Frozen_Options,
+    options_intern
+)
+
 from pyrouet.maestro.objects.results import (
     Result_Procedure,
     Result_Container,
@@ -48,61 +74,195 @@ from pyrouet.maestro.objects.results import (
 from pyrouet.maestro.errors import (
     Procedure_Error,
     Procedure_Abort_Error,
+    Procedure_Timeout_Error,
     Procedure_Stop_Error
 )
 
 # ┌────────────────────────────────────────┐
-# │ Procedure context values               │
+# │ Procedure context errors               │
+# └────────────────────────────────────────┘
+
+@dataclass
+class Procedure_Context_Errors:
+    errors: List[Exception] = field(default_factory = list)
+    
+    def register(self, path_stack: List[str], err: Exception):
+        self.errors.append( (tuple(path_stack), err,) )
+
+
+# ┌────────────────────────────────────────┐
+# │ Procedure context step instances       │
 # └────────────────────────────────────────┘
 
-class Procedure_Context_Values:
+class Procedure_Context_Steps:
+    """
+    Keeps the instances of reusable steps across runs, keyed by
+    step path and step definition.
+    """
+
     def __init__(self):
-        self.values = dict()
+        self.instances = dict() # (path, step_def) → [step_args, instance, busy]
+        self.lock      = Lock()
 
-    def clear(self):
+    @staticmethod
+    def _args_match(kept_args, step_args):
+        try:
+            return bool(kept_args == step_args)
+        except Exception:
+            return kept_args is step_args # Arguments not comparable (arrays...)
+
+    @contextmanager
+    def instance(self, step_def, step_args, path):
         """
-        Clear the stored values
+        Gives the step instance to run. Reusable steps are built once, then reset
+        before each new run. A new instance is built if the kept one is already
+        running (concurrent runs of the same procedure), or replaces the kept one
+        if the step arguments changed.
         """
-        self.values = dict()
 
-    def set(self, path_stack, v):
+        if not step_args.get("reusable", False):
+            yield step_def(**step_args)
+            return
+
+        key  = (tuple(path), step_def)
+        slot = None
+        keep = True # Instance kept after the run
+
+        with self.lock:
+            kept = self.instances.get(key)
+
+            if (kept is not None) and (not kept[2]) and self._args_match(kept[0], step_args):
+                kept[2] = True
+                slot    = kept
+
+        if slot is not None:
+            slot[1].reset()
+
+        else:
+            step_instance = step_def(**step_args)
+            stale         = None
+
+            with self.lock:
+                kept = self.instances.get(key)
+                slot = [dict(step_args), step_instance, True]
+
+                # Replace an idle instance built with other arguments. A running
+                # one is kept, the new instance is then torn down after the run.
+                if (kept is None) or not (kept[2] or self._args_match(kept[0], step_args)):
+                    stale               = kept
+                    self.instances[key] = slot
+                else:
+                    keep                = False
+
+            if stale is not None:
+                stale[1].teardown()
+
+        try:
+            yield slot[1]
+
+        finally:
+            slot[2] = False
+
+            if not keep:
+                slot[1].teardown()
+
+    def teardown(self):
         """
-        Sets a stored value.
+        Releases all the kept step instances
         """
-        key = ".".join(path_stack)
-        self.values[key] = v
 
-    def get(self, key, path_stack):
+        with self.lock:
+            instances      = self.instances
+            self.instances = dict()
+
+        for step_args, step_instance, busy in instances.values():
+            step_instance.teardown()
+
+
+# ┌────────────────────────────────────────┐
+# │ Procedure context resources            │
+# └────────────────────────────────────────┘
+
+class Procedure_Context_Resources:
+    """
+    Named resources (serial ports, instruments, etc.) shared by the concurrently
+    running steps. Only the steps using the same resource are serialized. Locks
+    are always acquired in name order, so that steps using several resources
+    can't deadlock.
+    """
+
+    def __init__(self, poll_interval: float = 0.01):
+        self.locks         = dict() # name → Lock
+        self.stats         = dict() # name → acquisition statistics
+        self.lock          = Lock()
+        self.poll_interval = poll_interval
+
+    def _lock_get(self, name):
+        with self.lock:
+            lock = self.locks.get(name)
+            if lock is None:
+                lock             = Lock()
+                self.locks[name] = lock
+                self.stats[name] = {"acquired": 0, "contended": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+        return lock
+
+    def _stats_update(self, name, wait, contended):
+        with self.lock:
+            st                = self.stats[name]
+            st["acquired"]   += 1
+            st["contended"]  += int(contended)
+            st["wait_total"] += wait
+            st["wait_max"]    = max(st["wait_max"], wait)
+
+    def acquire(self, names, abort_event: Event = None):
+        """
+        Acquires the given resources. Returns the total wait time, or None if
+        abort_event was set while waiting (no resource is then held).
         """
-        Returns a stored value, returns KeyError if
-        not found.
 
-        A ^ in the key string is replaced by the 
-        current subprocedure path, suffixed with a separator.
-        For example, if the current step has a path corresponding
-        to audio.test_actuatorL.measure_rms,
-        a ^ in the key string will be replaced
-        by "audio.test_actuatorL." (WITH A DOT!!!).
-        So the initialization options for the measure could look like:
+        t_start = time.time()
+        held    = list()
+
+        for name in sorted(set(names)):
+            lock      = self._lock_get(name)
+            t_lock    = time.time()
+            contended = not lock.acquire(blocking=False)
+
+            if contended:
+                while not lock.acquire(timeout=self.poll_interval):
+                    if (abort_event is not None) and abort_event.is_set():
+                        self.release(held)
+                        return None
 
-        ("measure_rms", Signal_RMS_Measure, {"from": "^record"})
+            held.append(name)
+            self._stats_update(name, time.time() - t_lock, contended)
 
-        That will be expanded to:
+        # Aborted while the last resource was released
+        if (abort_event is not None) and abort_event.is_set():
+            self.release(held)
+            return None
 
-        ("measure_rms", Signal_RMS_Measure, {"from": "audio.test_actuatorL.record"})
+        return time.time() - t_start
 
-        if at the root procedure, no dot is put.
+    def release(self, names):
+        for name in names:
+            self.locks[name].release()
+
+    def stats_get(self):
+        """
+        Returns the acquisition statistics by resource: acquisitions count,
+        contended acquisitions count, total and maximum wait time in seconds.
+        The most waited for resources are the bottlenecks of the bench.
         """
-        path_subproc = ".".join(path_stack[:-1])
-        return self.values[key.replace("^", path_subproc + ("." if path_subproc else ""))]
 
+        with self.lock:
+            return {name: dict(st) for name, st in self.stats.items()}
 
-@dataclass
-class Procedure_Context_Errors:
-    errors: List[Exception] = field(default_factory = list)
-    
-    def register(self, path_stack: List[str], err: Exception):
-        self.errors.append( (tuple(path_stack), err,) )
+    def stats_clear(self):
+        with self.lock:
+            for st in self.stats.values():
+                st.update({"acquired": 0, "contended": 0, "wait_total": 0.0, "wait_max": 0.0})
 
 
 # ┌────────────────────────────────────────┐
@@ -110,8 +270,44 @@ class Procedure_Context_Errors:
 # └────────────────────────────────────────┘
 
 class Procedure_Context:
-    def __init__(self):
+    def __init__(self, params: Dict[str, any] = None,
+                       result_cache = None,
+                       checkpoint = None,
+                       transform_memo = None,
+                       history = None,
+                       skip_policy = None):
+        """
+        - params:       Bench/DUT specific parameters (serial port, fixture slot, etc.),
+                        accessible to the steps through ctx.params
+        - result_cache: Procedure_Result_Cache of the tested DUT. Non-phony steps
+                        that already passed are then restored instead of executed.
+        - checkpoint:   Procedure_Checkpoint recording each executed step, to
+                        resume interrupted runs with procedure_resume.
+        - transform_memo: Procedure_Transform_Memo caching the outputs of the pure
+                        transforms, shared by runs and contexts.
+        - history:      Procedure_History recording the step results, used to run
+                        the reorderable subprocedures in fail-fast order.
+        - skip_policy:  Procedure_Skip_Policy skipping the measures that never fail,
+                        except on audit runs. Skipped steps give Result_Skipped results.
+        """
+
         self.log                              = logging.getLogger(__file__)
+        self.params                           = dict(params or dict())
+        self.steps                            = Procedure_Context_Steps()
+        self.resources                        = Procedure_Context_Resources()
+        self.result_cache                     = result_cache
+        self.checkpoint                       = checkpoint
+        self.transform_memo                   = transform_memo
+        self.history                          = history
+        self.skip_policy                      = skip_policy
+        self.skip_audit                       = False # Current run executes all steps
+
+        # ───────────── Abort managment ────────── #
+
+        self.abort_event                      = Event()
+        self.abort_err                        = None
+        self.running_steps                    = dict() # step → cancel function
+        self.running_lock                     = Lock()
 
         # ───────────── Callback sets ──────────── #
 
@@ -121,6 +317,9 @@ class Procedure_Context:
         self.on_procedure_enter_callbacks     = set()
         self.on_procedure_leave_callbacks     = set()
 
+        if history is not None:
+            history.attach(self)
+
 
     # ┌────────────────────────────────────────┐
     # │ Callback managment                     │
@@ -139,6 +338,90 @@ class Procedure_Context:
         self.on_procedure_leave_callbacks.add(clbk)
 
 
+    # ┌────────────────────────────────────────┐
+    # │ Bench shutdown                         │
+    # └────────────────────────────────────────┘
+
+    def teardown(self):
+        """
+        Releases the resources held by the reusable step instances
+        """
+        self.steps.teardown()
+
+
+    # ┌────────────────────────────────────────┐
+    # │ Abort managment                        │
+    # └────────────────────────────────────────┘
+
+    def abort(self, err: Procedure_Abort_Error = None):
+        """
+        Aborts the running procedure, from any thread. The running steps
+        are aborted (see Step_Base.abort), and no other step is started.
+        The procedure result error is err, Procedure_Abort_Error by default.
+        """
+
+        self.abort_err = err or Procedure_Abort_Error()
+        self.abort_event.set()
+
+        self.log.warning(f"Aborting procedure: {self.abort_err}")
+
+        with self.running_lock:
+            running = list(self.running_steps.keys())
+
+        for step in running:
+            self._step_abort(step)
+
+    def _run_stop_err(self, stop_event):
+        """
+        Returns the error to store if the execution must stop before
+        the next step, None otherwise.
+        """
+
+        if self.abort_event.is_set():
+            return self.abort_err or Procedure_Abort_Error()
+
+        elif (stop_event is not None) and stop_event.is_set():
+            return Procedure_Stop_Error()
+
+        return None
+
+    def _watchdog(self, timeout, fn, *args):
+        """
+        Starts a timer calling fn after timeout, if any
+        """
+
+        if not timeout:
+            return None
+
+        watchdog        = Timer(timeout, fn, args)
+        watchdog.daemon = True
+        watchdog.start()
+
+        return watchdog
+
+    def _procedure_timeout(self, timeout, path_stack):
+        self.abort(Procedure_Timeout_Error(timeout, path_stack))
+
+    def _step_timeout(self, step):
+        step.timed_out = True
+        self._step_abort(step)
+
+    def _step_abort(self, step):
+        step.aborted = True
+
+        try:
+            step.abort()
+        except Exception as exc:
+            self.log.error(f"Error while aborting step: {exc}")
+
+        # Cancel asynchronous steps
+        with self.running_lock:
+            cancel = self.running_steps.get(step, None)
+
+        if cancel is not None:
+            cancel()
+
+
     # ┌────────────────────────────────────────┐
     # │ Run functions                          │
     # └────────────────────────────────────────┘
@@ -149,13 +432,389 @@ class Procedure_Context:
                       id_: str=None,
                       path_stack: List[str] = None,
                       errlist: Procedure_Context_Errors=None,
-                      values: Procedure_Context_Values=None):
+                      values: Procedure_Context_Values=None,
+                      parallel: bool = False,
+                      dataflow: bool = False,
+                      max_workers: int = None,
+                      timeout: float = None,
+                      reorderable: bool = False,
+                      stop_event: Event = None):
+        """
+        Runs a procedure, given as a tuple of entries:
+
+        - ("step_id", Step_Class, {kwargs})     → step
+        - ("subproc_id", (entries...))          → subprocedure
+        - ("subproc_id", (entries...), {opts})  → subprocedure with options
+
+        Available subprocedure options:
+        - parallel:    bool → Run the children concurrently in a thread pool
+        - dataflow:    bool → Run the children concurrently, as soon as the
+                              children they depend on are done
+        - max_workers: int  → Maximum number of concurrent children
+        - timeout:     float→ Maximum duration in seconds, the procedure is aborted after
+        - reorderable: bool → Children can be run in any order respecting their dependencies
+                              (see dataflow): with a history, the children most likely to
+                              fail quickly are run first. Results follow execution order.
+        - after:       list → Ids of the siblings to run before, for dataflow
+                              subprocedures (also available as step argument)
+
+        The dependencies of dataflow children are given by their value references
+        (value_from arguments) to the values saved by their previous siblings, and
+        by the explicit "after" ordering hints.
+
+        For parallel and dataflow subprocedures, results are still stored in declaration
+        order. Please note that step and procedure callbacks are then called
+        from the worker threads.
+        """
 
         # Init context objects
         path_stack = path_stack or list()
         errlist    = errlist    or Procedure_Context_Errors()
         values     = values     or Procedure_Context_Values()
 
+        # New run of the values store
+        if (id_ is None) and (values.memory_budget is not None):
+            values.run_begin(entries_consumers(proc, path_stack))
+
+        proc_res   = self._procedure_enter(id_, path_stack)
+        watchdog   = self._watchdog(timeout, self._procedure_timeout, timeout, tuple(path_stack))
+
+        try:
+            if parallel or dataflow:
+                deps = entries_deps(proc, path_stack) if dataflow else None
+                self._procedure_run_parallel(proc, proc_res, path_stack, errlist, values,
+                                             max_workers, stop_event or Event(), deps)
+
+            else:
+                if reorderable and (self.history is not None):
+                    proc = self.history.order(proc, path_stack)
+
+                for step in proc:
+                    # Abort, or stop requested by a failed sibling of a parallel subprocedure
+                    stop_err = self._run_stop_err(stop_event)
+                    if stop_err is not None:
+                        self._plan_stop(proc_res, stop_err)
+                        break
+
+                    res, step_instance = self._entry_run(step, path_stack, errlist, values, stop_event)
+                    if self._entry_result_process(proc_res, res, step_instance):
+                        break
+
+            # All steps where executed without error!
+            if proc_res.result is None:
+                proc_res.result = True
+
+        except Exception as exc:
+            self._procedure_err(proc_res, exc, path_stack, errlist)
+
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+
+            self._procedure_leave(id_, path_stack, proc_res)
+
+        return proc_res, errlist.errors
+
+
+    def _procedure_run_parallel(self, proc, proc_res, path_stack, errlist, values, max_workers, stop_event, deps=None):
+        """
+        Runs the procedure entries concurrently.
+        """
+
+        # Each child gets its own copy of the path stack
+        self._parallel_run(proc, lambda step: self._entry_run(step, list(path_stack), errlist, values, stop_event),
+                           proc_res, max_workers, stop_event, deps)
+
+
+    def _parallel_run(self, children, child_fn, proc_res, max_workers, stop_event, deps=None):
+        """
+        Runs child_fn for each child in a thread pool. child_fn returns
+        the child result, and the step instance (None for subprocedures).
+
+        deps gives for each child the set of indexes of the children to
+        run before. If None, all children are independant.
+
+        A failing critical step sets the stop event, so that siblings that
+        didn't start yet are cancelled, and running subprocedures stop before
+        their next step.
+        """
+
+        group_event = Event() # Cancels the siblings of this subprocedure only
+
+        def child_run(child):
+            if (self._run_stop_err(stop_event) is not None) or group_event.is_set():
+                return None, None # Cancelled before start
+
+            res, step_instance = child_fn(child)
+
+            if self._entry_result_failed(res):
+                if self._entry_result_stops(res, step_instance):
+                    stop_event.set() # Propagate to the whole procedure
+
+                elif (step_instance is not None) and step_instance.break_if_error:
+                    group_event.set()
+
+            return res, step_instance
+
+        results = [(None, None)] * len(children)
+        pending = list(range(len(children)))
+        done    = set()
+        running = dict() # future → child index
+
+        with ThreadPoolExecutor(max_workers=max_workers or max(len(children), 1)) as pool:
+            try:
+                while pending or running:
+                    # Don't start anything else if cancelled
+                    if (self._run_stop_err(stop_event) is not None) or group_event.is_set():
+                        pending = list()
+
+                    # Start ready children, in declaration order
+                    ready   = [idx for idx in pending if (deps is None) or (deps[idx] <= done)]
+                    pending = [idx for idx in pending if idx not in ready]
+
+                    for idx in ready:
+                        running[pool.submit(child_run, children[idx])] = idx
+
+                    if not running:
+                        break
+
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        idx          = running.pop(fut)
+                        results[idx] = fut.result()
+                        done.add(idx)
+
+            except Exception:
+                # Structure error in a child, don't start anything else
+                stop_event.set()
+                for fut in running: fut.cancel()
+                raise
+
+        # Store results in declaration order
+        for res, step_instance in results:
+            if res is not None:
+                self._entry_result_process(proc_res, res, step_instance)
+
+
+    # ─────────── Plan execution ───────────── #
+
+    def plan_run(self, plan: Procedure_Plan,
+                 errlist: Procedure_Context_Errors=None,
+                 values: Procedure_Context_Values=None,
+                 timeout: float = None):
+        """
+        Runs a compiled procedure plan. Gives the same results as
+        procedure_run for the source procedure definition, without walking
+        and validating the procedure tree on each run.
+        """
+
+        # Init context objects
+        path_stack = list()
+        errlist    = errlist    or Procedure_Context_Errors()
+        values     = values     or Procedure_Context_Values()
+
+        # New run of the values store
+        if values.memory_budget is not None:
+            values.run_begin(plan.consumers)
+
+        proc_res   = self._procedure_enter(None, path_stack)
+        watchdog   = self._watchdog(timeout, self._procedure_timeout, timeout, tuple())
+
+        try:
+            self._plan_exec(plan.instructions, 0, len(plan.instructions), proc_res,
+                            path_stack, errlist, values, None)
+
+            # All steps where executed without error!
+            if proc_res.result is None:
+                proc_res.result = True
+
+        except Exception as exc:
+            self._procedure_err(proc_res, exc, path_stack, errlist)
+
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+
+            self._procedure_leave(None, path_stack, proc_res)
+
+        return proc_res, errlist.errors
+
+
+    # ──────────── Resumed execution ───────── #
+
+    def procedure_resume(self, proc,
+                         errlist: Procedure_Context_Errors=None,
+                         values: Procedure_Context_Values=None):
+        """
+        Resumes an interrupted run of the procedure (definition or compiled
+        plan), from the context checkpoint. The recorded steps are restored
+        with their results, saved values and errors, and the execution continues
+        from the first unfinished step.
+        """
+
+        if self.checkpoint is None:
+            raise ValueError("No checkpoint to resume from")
+
+        n_records = self.checkpoint.load()
+        self.log.info(f"Resuming procedure, {n_records} recorded steps")
+
+        if isinstance(proc, Procedure_Plan):
+            return self.plan_run(proc, errlist=errlist, values=values)
+        else:
+            return self.procedure_run(proc, errlist=errlist, values=values)
+
+
+    def _plan_exec(self, instrs, start, end, proc_res, path_stack, errlist, values, stop_event):
+        """
+        Executes the instructions in the [start;end) range, storing
+        the results in proc_res. Breaking from a subprocedure jumps
+        to its PLAN_LEAVE instruction.
+        """
+
+        stack     = [proc_res] # Results of the entered subprocedures
+        watchdogs = dict()     # Subprocedure timeouts, by PLAN_ENTER index
+        pc        = start
+
+        while pc < end:
+            instr    = instrs[pc]
+            err_jump = instr.leave # Where to go on error
+
+            try:
+                if instr.op == PLAN_STEP:
+                    # Abort, or stop requested by a failed sibling of a parallel subprocedure
+                    stop_err = self._run_stop_err(stop_event)
+                    if stop_err is not None:
+                        self._plan_stop(stack[-1], stop_err)
+                        pc = instr.leave
+                        continue
+
+                    self.log.debug(instr.path_str)
+
+                    with self.steps.instance(instr.step_def, instr.step_args, instr.path) as step_instance:
+                        res,_ = self.step_run(instr.step_id, step_instance, path_stack, errlist, values)
+
+                    if self._entry_result_process(stack[-1], res, step_instance):
+                        pc = instr.leave
+                        continue
+
+                elif instr.op == PLAN_ENTER:
+                    stop_err = self._run_stop_err(stop_event)
+                    if stop_err is not None:
+                        self._plan_stop(stack[-1], stop_err)
+                        pc = instr.leave
+                        continue
+
+                    stack.append(self._procedure_enter(instr.step_id, path_stack))
+                    err_jump = instr.jump
+
+                    timeout       = instr.options.get("timeout", None)
+                    watchdogs[pc] = self._watchdog(timeout, self._procedure_timeout, timeout, instr.path)
+
+                    if instr.entries is not None:
+                        if self.history is not None:
+                            self._plan_exec_reordered(instrs, instr, stack[-1], path_stack, errlist, values,
+                                                      stop_event)
+                            pc = instr.jump # Go to PLAN_LEAVE
+                            continue
+
+                    elif instr.children is not None:
+                        self._plan_exec_parallel(instrs, instr, stack[-1], path_stack, errlist, values,
+                                                 stop_event or Event())
+                        pc = instr.jump # Go to PLAN_LEAVE
+                        continue
+
+                else: # PLAN_LEAVE
+                    watchdog = watchdogs.pop(instr.jump, None)
+                    if watchdog is not None:
+                        watchdog.cancel()
+
+                    res = stack.pop()
+
+                    # All steps where executed without error!
+                    if res.result is None:
+                        res.result = True
+
+                    self._procedure_leave(instr.step_id, path_stack, res)
+
+                    if self._entry_result_process(stack[-1], res, None):
+                        pc = instr.leave
+                        continue
+
+            except Exception as exc:
+                # Global error for the current subprocedure
+                self._procedure_err(stack[-1], exc, path_stack, errlist)
+
+                pc = err_jump
+                continue
+
+            pc += 1
+
+
+    def _plan_exec_child(self, instrs, idx, path_stack, errlist, values, stop_event):
+        """
+        Executes a single child entry of a subprocedure. Returns the
+        result object, and the step instance (None for subprocedures).
+        """
+
+        child = instrs[idx]
+
+        if child.op == PLAN_STEP:
+            with self.steps.instance(child.step_def, child.step_args, child.path) as step_instance:
+                res,_ = self.step_run(child.step_id, step_instance, path_stack, errlist, values)
+
+            return res, step_instance
+
+        else:
+            holder = Result_Container()
+            self._plan_exec(instrs, idx, child.jump+1, holder, path_stack, errlist, values, stop_event)
+
+            if not holder.tests: # Global error in the child
+                raise holder.err
+
+            return holder.tests[0], None
+
+
+    def _plan_exec_parallel(self, instrs, instr, proc_res, path_stack, errlist, values, stop_event):
+        def child_fn(idx):
+            # Each child gets its own copy of the path stack
+            return self._plan_exec_child(instrs, idx, list(path_stack), errlist, values, stop_event)
+
+        self._parallel_run(instr.children, child_fn, proc_res,
+                           instr.options.get("max_workers", None), stop_event, instr.deps)
+
+
+    def _plan_exec_reordered(self, instrs, instr, proc_res, path_stack, errlist, values, stop_event):
+        """
+        Executes the children of a reorderable subprocedure in the
+        history order, like procedure_run.
+        """
+
+        for i in self.history.order_indices(instr.entries, list(instr.path)):
+            # Abort, or stop requested by a failed sibling of a parallel subprocedure
+            stop_err = self._run_stop_err(stop_event)
+            if stop_err is not None:
+                self._plan_stop(proc_res, stop_err)
+                break
+
+            res, step_instance = self._plan_exec_child(instrs, instr.children[i], path_stack,
+                                                       errlist, values, stop_event)
+            if self._entry_result_process(proc_res, res, step_instance):
+                break
+
+
+    def _plan_stop(self, proc_res, err):
+        proc_res.result = False
+        proc_res.err    = proc_res.err or err
+
+
+    # ────────── Procedure enter/leave ─────── #
+
+    def _procedure_enter(self, id_, path_stack):
+        """
+        Pushes the subprocedure on the path stack, and returns
+        a fresh result object.
+        """
+
         # Init result object
         proc_res = Result_Container(step_id=id_) if id_ else Result_Procedure()
 
@@ -172,99 +831,143 @@ class Procedure_Context:
         # Get checklist item
         # TODO #
 
+        # New checkpoint for root procedure
+        if (id_ is None) and (self.checkpoint is not None):
+            self.checkpoint.begin()
+
+        # New run for root procedure
+        if id_ is None:
+            self.abort_event.clear()
+            self.abort_err = None
+
+            if self.skip_policy is not None:
+                self.skip_audit = self.skip_policy.audit_draw()
+
         # Callback
         for clbk in self.on_procedure_enter_callbacks:
             clbk(path_stack)
 
-        try:
-            for step in proc:
-                # Get step info
-                step_id  = step[0]
-                step_def = step[1]
-                res      = None
-
-                self.log.debug(repr(step))
-
-                # Run subprocedure
-                if isinstance(step_def, tuple):
-                    # Run procedure, should not throw any exception
-                    res,_ = self.procedure_run( proc       = step_def,
-                                                id_        = step_id,
-                                                path_stack = path_stack,
-                                                errlist    = errlist,
-                                                values     = values )
-
-                    # Store result for subprocedure
-                    proc_res.tests.append(res)
-
-                    if (not res.result) or (res.err is not None):
-                        proc_res.result = False
-
-                        if isinstance(res.err, Procedure_Abort_Error) or \
-                            isinstance(res.err, Procedure_Stop_Error):
-                                proc_res.err = res.err
-                                break # Critical error
-
-                # Run step
-                elif issubclass(step_def, Step_Base):
-                    step_args     = step[2]
-                    step_instance = step_def(**step_args)
-
-                    res,_ = self.step_run(
-                        id_        = step_id,
-                        step       = step_instance,
-                        path_stack = path_stack,
-                        errlist    = errlist,
-                        values     = values
-                    )
-
-                    proc_res.tests.append(res)
-                    if (not res.result) or (res.err is not None):
-                        proc_res.result = False # Procedure is failed
-
-                        if isinstance(res.err, Procedure_Abort_Error) or \
-                            isinstance(res.err, Procedure_Stop_Error):
-                                proc_res.err = res.err
-                                break # Critical error
-                        # For other exceptions
-                        else:
-                            if step_instance.critical: # Must. stop. procedure.
-                                proc_res.err = Procedure_Stop_Error() # Request to stop procedure
-                                break                                 # Break from loop
-
-                            elif step_instance.break_if_error:
-                                break # Just break from loop without storing error
-                else:
-                    raise TypeError(f"Uknown step type for step {step_id}: {step_def}:{type(step_def)}, step={step}")
+        return proc_res
 
-            # All steps where executed without error!
-            if proc_res.result is None:
-                proc_res.result = True
+    def _procedure_err(self, proc_res, exc, path_stack, errlist):
+        proc_res.result = False # Execution error
 
-        except Exception as exc:
-            proc_res.result = False # Execution error
+        proc_res.err    = exc
+        errlist.register(path_stack, exc)
+        proc_res.tests  = list() # Empty tests result list
+        self.log.debug(traceback.format_exc())
 
-            proc_res.err    = exc
-            errlist.register(path_stack, exc)
-            proc_res.tests  = list() # Empty tests result list
-            self.log.debug(traceback.format_exc())
+    def _procedure_leave(self, id_, path_stack, proc_res):
+        # Procedure leave callback
+        for clbk in self.on_procedure_leave_callbacks:
+            clbk(path_stack, proc_res)
 
-        finally:
-            # Procedure leave callback
-            for clbk in self.on_procedure_leave_callbacks:
-                clbk(path_stack, proc_res)
+        # Some log
+        if id_:
+            self.log.info(f"Leaving subprocedure {'.'.join(path_stack)}")
+        else:
+            self.log.info(f"Leaving root procedure")
 
-            # Some log
-            if id_:
-                self.log.info(f"Leaving subprocedure {'.'.join(path_stack)}")
-            else:
-                self.log.info(f"Leaving root procedure")
+        # Remove id from path_stack if any
+        if id_:
+            path_stack.pop()
 
-            # Remove id from path_stack if any
-            if id_:
-                path_stack.pop()
+        # Write pending checkpoint records
+        if (id_ is None) and (self.checkpoint is not None):
+            self.checkpoint.end()
 
-        return proc_res, errlist.errors
+
+    # ───────────── Entry helpers ──────────── #
+
+    def _entry_run(self, step, path_stack, errlist, values, stop_event=None):
+        """
+        Runs a single procedure entry, step or subprocedure. Returns the
+        result object, and the step instance (None for subprocedures).
+        """
+
+        # Get step info
+        step_id  = step[0]
+        step_def = step[1]
+
+        self.log.debug(repr(step))
+
+        # Run subprocedure
+        if isinstance(step_def, tuple):
+            step_opts = step[2] if len(step) > 2 else dict()
+
+            # Run procedure, should not throw any exception
+            res,_ = self.procedure_run( proc        = step_def,
+                                        id_         = step_id,
+                                        path_stack  = path_stack,
+                                        errlist     = errlist,
+                                        values      = values,
+                                        parallel    = step_opts.get("parallel", False),
+                                        dataflow    = step_opts.get("dataflow", False),
+                                        max_workers = step_opts.get("max_workers", None),
+                                        timeout     = step_opts.get("timeout", None),
+                                        reorderable = step_opts.get("reorderable", False),
+                                        stop_event  = stop_event )
+
+            return res, None
+
+        # Run step
+        elif issubclass(step_def, Step_Base):
+            step_args = step[2]
+
+            with self.steps.instance(step_def, step_args, path_stack + [step_id]) as step_instance:
+                res,_ = self.step_run(
+                    id_        = step_id,
+                    step       = step_instance,
+                    path_stack = path_stack,
+                    errlist    = errlist,
+                    values     = values
+                )
+
+            return res, step_instance
+
+        else:
+            raise TypeError(f"Uknown step type for step {step_id}: {step_def}:{type(step_def)}, step={step}")
+
+
+    def _entry_result_failed(self, res):
+        return (not res.result) or (res.err is not None)
+
+
+    def _entry_result_stops(self, res, step_instance):
+        """
+        Returns True if the failed entry result must stop the whole procedure
+        """
+        return isinstance(res.err, Procedure_Abort_Error) or \
+               isinstance(res.err, Procedure_Stop_Error)  or \
+               ((step_instance is not None) and step_instance.critical)
+
+
+    def _entry_result_process(self, proc_res, res, step_instance):
+        """
+        Stores an entry result in the procedure result. Returns True
+        if the procedure execution must break.
+        """
+
+        proc_res.tests.append(res)
+
+        if self._entry_result_failed(res):
+            proc_res.result = False # Procedure is failed
+
+            if isinstance(res.err, Procedure_Abort_Error) or \
+                isinstance(res.err, Procedure_Stop_Error):
+                    proc_res.err = proc_res.err or res.err
+                    return True # Critical error
+
+            # For other exceptions
+            elif step_instance is not None:
+                if step_instance.critical: # Must. stop. procedure.
+                    proc_res.err = proc_res.err or Procedure_Stop_Error() # Request to stop procedure
+                    return True                                           # Break from loop
+
+                elif step_instance.break_if_error:
+                    return True # Just break from loop without storing error
+
+        return False
 
 
     # ──────────── Step execution ──────────── #
@@ -275,29 +978,445 @@ class Procedure_Context:
         errlist    = errlist    or Procedure_Context_Errors()
         values     = values     or Procedure_Context_Values()
 
+        self._step_enter(id_, path_stack)
+
+        res = None
+        try:
+            # Should not throw any exception: caught in step.run!
+            # If any exception is thrown by step.run, there will be caught
+            # by the parent procedure_run() function or directly by the caller.
+            res = self._step_restore(step, path_stack, errlist, values)
+            if res is None:
+                res = self._step_skip(step, path_stack)
+
+            if res is None:
+                wait = self._step_resources_acquire(step, path_stack)
+                if wait is not None:
+                    watchdog = self._step_run_begin(step, None)
+                    try:
+                        res = step.run(self, path_stack, errlist, values)
+                    finally:
+                        self._step_run_end(step, watchdog)
+                        self.resources.release(step.resources)
+
+                res = self._step_aborted(step, path_stack, errlist, res)
+                self._step_resources_wait(step, res, wait)
+                self._step_record(step, path_stack, errlist, values, res)
+
+            self._step_consume(step, path_stack, values)
+            self._step_leave(id_, step, path_stack, res)
+
+        finally:
+            path_stack.pop() # Remove name from queue
+            step.clean()     # Clean step data
+
+        return res, errlist.errors
+
+
+    def _step_enter(self, id_, path_stack):
         # Append id to current path stack
         path_stack.append(id_)
 
-        t_start = time.time()
-
         for clbk in self.on_step_enter_callbacks:
             clbk(path_stack)
 
-        res = None
+    def _step_leave(self, id_, step, path_stack, res):
+        # Add step flags to result. Results without per-run
+        # options share the interned step options.
+        if res is not None:
+            res.step_id = id_
+
+            if res.options and not isinstance(res.options, Frozen_Options):
+                res.options.update(step.options_get())
+            else:
+                res.options = options_intern({**res.options, **step.options_get()})
+
+        # TODO # Move in finally section with none result if error?
+        for clbk in self.on_step_leave_callbacks:
+            clbk(path_stack,res)
+
+    def _step_resources_acquire(self, step, path_stack):
+        """
+        Waits for the resources used by the step. Returns the wait time, or None
+        if the context was aborted while waiting (the step is then aborted).
+        """
+
+        if not step.resources:
+            return 0.0
+
+        wait = self.resources.acquire(step.resources, self.abort_event)
+
+        if wait is None:
+            step.aborted   = True
+            step.timed_out = False
+
+        elif wait > 0.0:
+            self.log.debug(f"Step {'.'.join(path_stack)} waited {wait:.3f} s for {', '.join(step.resources)}")
+
+        return wait
+
+    def _step_resources_wait(self, step, res, wait):
+        if step.resources and (res is not None) and (wait is not None):
+            res.options["resources_wait"] = wait
+
+    def _step_run_begin(self, step, cancel):
+        """
+        Registers a running step, so that it can be aborted, and starts its
+        timeout watchdog. cancel is called on abort for asynchronous steps.
+        """
+
+        step.aborted   = False
+        step.timed_out = False
+
+        with self.running_lock:
+            self.running_steps[step] = cancel
+
+        # Aborted before start
+        if self.abort_event.is_set():
+            self._step_abort(step)
+
+        return self._watchdog(step.timeout, self._step_timeout, step)
+
+    def _step_run_end(self, step, watchdog):
+        if watchdog is not None:
+            watchdog.cancel()
+
+        with self.running_lock:
+            self.running_steps.pop(step, None)
+
+    def _step_aborted(self, step, path_stack, errlist, res):
+        """
+        Overrides the result of an aborted step, whatever the step returned
+        after being released.
+        """
+
+        if not step.aborted:
+            return res
+
+        if step.timed_out:
+            err = Procedure_Timeout_Error(step.timeout, tuple(path_stack))
+        else:
+            err = self.abort_err or Procedure_Abort_Error(tuple(path_stack))
+
+        self.log.error(f"Step {'.'.join(path_stack)} aborted: {err}")
+
+        res        = res or step._result_new()
+        res.result = False
+        res.err    = err
+        errlist.register(path_stack, err)
+
+        return res
+
+    def _step_consume(self, step, path_stack, values):
+        """
+        Signals to the values store that the step is done with its input value,
+        so that it can be released after its last consumer.
+        """
+
+        if values.memory_budget is None:
+            return
+
+        value_from = getattr(step, "value_from", None)
+        if isinstance(value_from, str):
+            values.consume(values.ref_resolve(value_from, path_stack))
+
+    def _step_skip(self, step, path_stack):
+        """
+        Returns the skipped result of a step according to the skip
+        policy, or None if the step must be executed.
+        """
+
+        if self.skip_policy is None:
+            return None
+
+        return self.skip_policy.skip(step, path_stack, self.skip_audit)
+
+    def _step_restore(self, step, path_stack, errlist, values):
+        """
+        Returns the recorded result of a step for a resumed run, or the cached result
+        of an already passed step, restoring its saved value. Returns None if the
+        step must be executed.
+        """
+
+        # Resumed run
+        if self.checkpoint is not None:
+            rec = self.checkpoint.restore(path_stack)
+
+            if rec is not None:
+                self.log.info(f"Step {'.'.join(path_stack)} restored from checkpoint")
+
+                if rec["value_saved"]:
+                    values.set(path_stack, rec["value"])
+
+                errlist.errors.extend(rec["errors"])
+
+                res = rec["result"]
+                if res is not None:
+                    res.options = {**res.options, "restored": True}
+
+                return res
+
+        # Already passed step
+        if (self.result_cache is None) or step.phony:
+            return None
+
+        entry = self.result_cache.get(path_stack, step)
+        if entry is None:
+            return None
+
+        self.log.info(f"Step {'.'.join(path_stack)} already passed, restoring result")
+
+        if entry["value_saved"]:
+            values.set(path_stack, entry["value"])
+
+        res = entry["result"]
+        res.options = {**res.options, "cached": True}
+        return res
+
+    def _step_record(self, step, path_stack, errlist, values, res):
+        """
+        Records the result of an executed step in the checkpoint, and
+        the result of a passed non-phony step in the result cache. Aborted
+        steps are not recorded.
+        """
+
+        if (self.checkpoint is None) and (self.result_cache is None):
+            return
+
+        if step.aborted:
+            return # Aborted or timed out: executed again on resume
+
+        key         = values.key(path_stack)
+        value_saved = key in values.values
+        value       = values.export(key) if value_saved else None
+
+        if self.checkpoint is not None:
+            path   = tuple(path_stack)
+            errors = [err for err in errlist.errors if err[0] == path]
+
+            self.checkpoint.record(path_stack, res, value_saved, value, errors)
+
+        if (self.result_cache is None) or step.phony:
+            return
+
+        if (res is None) or (not res.result) or (res.err is not None):
+            return
+
+        self.result_cache.set(path_stack, step, res, value_saved, value)
+
+
+    # ┌────────────────────────────────────────┐
+    # │ Asynchronous run functions             │
+    # └────────────────────────────────────────┘
+
+    # These functions give the same results as their blocking
+    # counterparts. Steps that don't implement a native run_async()
+    # coroutine are executed in the event loop's default executor.
+
+    # ────────── Procedure execution ───────── #
+
+    async def procedure_run_async(self, proc: List[Step_Base],
+                                  id_: str=None,
+                                  path_stack: List[str] = None,
+                                  errlist: Procedure_Context_Errors=None,
+                                  values: Procedure_Context_Values=None,
+                                  parallel: bool = False,
+                                  dataflow: bool = False,
+                                  max_workers: int = None,
+                                  timeout: float = None,
+                                  reorderable: bool = False,
+                                  stop_event: Event = None):
+        """
+        Asynchronous version of procedure_run. Parallel subprocedures
+        are run as concurrent tasks of the current event loop.
+        """
+
+        # Init context objects
+        path_stack = path_stack or list()
+        errlist    = errlist    or Procedure_Context_Errors()
+        values     = values     or Procedure_Context_Values()
+
+        # New run of the values store
+        if (id_ is None) and (values.memory_budget is not None):
+            values.run_begin(entries_consumers(proc, path_stack))
+
+        proc_res   = self._procedure_enter(id_, path_stack)
+        watchdog   = self._watchdog(timeout, self._procedure_timeout, timeout, tuple(path_stack))
+
         try:
-            # Should not throw any exception: caught in step.run!
-            # If any exception is thrown by step.run, there will be caught
-            # by the parent procedure_run() function or directly by the caller.
-            res = step.run(self, path_stack, errlist, values)
+            if parallel or dataflow:
+                deps = entries_deps(proc, path_stack) if dataflow else None
+                await self._procedure_run_parallel_async(proc, proc_res, path_stack, errlist, values,
+                                                         max_workers, stop_event or Event(), deps)
+
+            else:
+                if reorderable and (self.history is not None):
+                    proc = self.history.order(proc, path_stack)
+
+                for step in proc:
+                    # Abort, or stop requested by a failed sibling of a parallel subprocedure
+                    stop_err = self._run_stop_err(stop_event)
+                    if stop_err is not None:
+                        self._plan_stop(proc_res, stop_err)
+                        break
+
+                    res, step_instance = await self._entry_run_async(step, path_stack, errlist, values, stop_event)
+                    if self._entry_result_process(proc_res, res, step_instance):
+                        break
+
+            # All steps where executed without error!
+            if proc_res.result is None:
+                proc_res.result = True
+
+        except Exception as exc:
+            self._procedure_err(proc_res, exc, path_stack, errlist)
+
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+
+            self._procedure_leave(id_, path_stack, proc_res)
+
+        return proc_res, errlist.errors
+
+
+    async def _procedure_run_parallel_async(self, proc, proc_res, path_stack, errlist, values, max_workers, stop_event, deps=None):
+        group_event = Event() # Cancels the siblings of this subprocedure only
+        semaphore   = asyncio.Semaphore(max_workers or max(len(proc), 1))
+        done_events = [asyncio.Event() for step in proc]
+
+        async def child_run(idx, step):
+            try:
+                # Wait for dependencies
+                if deps is not None:
+                    for dep in sorted(deps[idx]):
+                        await done_events[dep].wait()
+
+                async with semaphore:
+                    if (self._run_stop_err(stop_event) is not None) or group_event.is_set():
+                        return None, None # Cancelled before start
+
+                    # Each child gets its own copy of the path stack
+                    res, step_instance = await self._entry_run_async(step, list(path_stack), errlist, values, stop_event)
 
-            # Add step flags to result
+                    if self._entry_result_failed(res):
+                        if self._entry_result_stops(res, step_instance):
+                            stop_event.set() # Propagate to the whole procedure
+
+                        elif (step_instance is not None) and step_instance.break_if_error:
+                            group_event.set()
+
+                    return res, step_instance
+
+            finally:
+                done_events[idx].set()
+
+        tasks = [asyncio.ensure_future(child_run(idx, step)) for idx, step in enumerate(proc)]
+
+        try:
+            children = await asyncio.gather(*tasks)
+
+        except Exception:
+            # Structure error in a child, don't start anything else
+            stop_event.set()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        # Store results in declaration order
+        for res, step_instance in children:
             if res is not None:
-                res.step_id = id_
-                res.options.update(step.options_get())
+                self._entry_result_process(proc_res, res, step_instance)
+
+
+    async def _entry_run_async(self, step, path_stack, errlist, values, stop_event=None):
+        # Get step info
+        step_id  = step[0]
+        step_def = step[1]
+
+        self.log.debug(repr(step))
+
+        # Run subprocedure
+        if isinstance(step_def, tuple):
+            step_opts = step[2] if len(step) > 2 else dict()
+
+            # Run procedure, should not throw any exception
+            res,_ = await self.procedure_run_async( proc        = step_def,
+                                                    id_         = step_id,
+                                                    path_stack  = path_stack,
+                                                    errlist     = errlist,
+                                                    values      = values,
+                                                    parallel    = step_opts.get("parallel", False),
+                                                    dataflow    = step_opts.get("dataflow", False),
+                                                    max_workers = step_opts.get("max_workers", None),
+                                                    timeout     = step_opts.get("timeout", None),
+                                                    reorderable = step_opts.get("reorderable", False),
+                                                    stop_event  = stop_event )
+
+            return res, None
+
+        # Run step
+        elif issubclass(step_def, Step_Base):
+            step_args = step[2]
+
+            with self.steps.instance(step_def, step_args, path_stack + [step_id]) as step_instance:
+                res,_ = await self.step_run_async(
+                    id_        = step_id,
+                    step       = step_instance,
+                    path_stack = path_stack,
+                    errlist    = errlist,
+                    values     = values
+                )
+
+            return res, step_instance
+
+        else:
+            raise TypeError(f"Uknown step type for step {step_id}: {step_def}:{type(step_def)}, step={step}")
+
 
-            # TODO # Move in finally section with none result if error?
-            for clbk in self.on_step_leave_callbacks:
-                clbk(path_stack,res)
+    # ──────────── Step execution ──────────── #
+
+    async def step_run_async(self, id_, step, path_stack=None, errlist=None, values=None):
+        # Init context objects
+        path_stack = path_stack or list()
+        errlist    = errlist    or Procedure_Context_Errors()
+        values     = values     or Procedure_Context_Values()
+
+        self._step_enter(id_, path_stack)
+
+        res = None
+        try:
+            res = self._step_restore(step, path_stack, errlist, values)
+            if res is None:
+                res = self._step_skip(step, path_stack)
+
+            if res is None:
+                loop = asyncio.get_running_loop()
+
+                # Wait for the resources without blocking the event loop
+                if step.resources:
+                    wait = await loop.run_in_executor(None, self._step_resources_acquire, step, path_stack)
+                else:
+                    wait = 0.0
+
+                if wait is not None:
+                    task     = asyncio.ensure_future(step.run_async(self, path_stack, errlist, values))
+                    watchdog = self._step_run_begin(step, lambda: loop.call_soon_threadsafe(task.cancel))
+                    try:
+                        res = await task
+                    except asyncio.CancelledError:
+                        if not step.aborted:
+                            raise
+                        res = step._result_new()
+                    finally:
+                        self._step_run_end(step, watchdog)
+                        self.resources.release(step.resources)
+
+                res = self._step_aborted(step, path_stack, errlist, res)
+                self._step_resources_wait(step, res, wait)
+                self._step_record(step, path_stack, errlist, values, res)
+
+            self._step_consume(step, path_stack, values)
+            self._step_leave(id_, step, path_stack, res)
 
         finally:
             path_stack.pop() # Remove name from queue
@@ -0,0 +1,171 @@
+"""
+┌───────────────────────────────────────────────────────────┐
+│ Procedure history: step statistics and fail-fast ordering │
+└───────────────────────────────────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+
+from threading import Lock
+from typing    import List
+
+from pyrouet.maestro.objects.results import Result_Skipped
+from pyrouet.maestro.procedure.plan  import entries_deps
+
+# ┌────────────────────────────────────────┐
+# │ Procedure history                      │
+# └────────────────────────────────────────┘
+
+class Procedure_History:
+    def __init__(self, path: str = None):
+        """
+        Pass/fail counts and durations of the steps and subprocedures, by path,
+        recorded through the context callbacks (see attach). Used to run the
+        children of reorderable subprocedures in fail-fast order.
+
+        - path: JSON file the history is loaded from and saved to (see save)
+        """
+
+        self.log    = logging.getLogger(__file__)
+
+        self.path   = path
+        self.stats  = dict() # path key → {"runs": int, "fails": int, "duration": float (total, s)}
+        self.starts = dict() # (thread ident, path key) → start time
+        self.lock   = Lock()
+
+        if (path is not None) and os.path.exists(path):
+            with open(path, "r") as fhandle:
+                self.stats = json.load(fhandle)
+
+    def save(self):
+        with self.lock:
+            stats = json.dumps(self.stats, indent=1)
+
+        with open(self.path, "w") as fhandle:
+            fhandle.write(stats)
+
+    # ─────────────── Recording ────────────── #
+
+    def attach(self, ctx):
+        """
+        Registers the recording callbacks in the procedure context
+        """
+
+        ctx.register_step_enter_callback(self._enter)
+        ctx.register_step_leave_callback(self._leave)
+        ctx.register_procedure_enter_callback(self._enter)
+        ctx.register_procedure_leave_callback(self._leave)
+
+    def _enter(self, path_stack):
+        key = (threading.get_ident(), ".".join(path_stack))
+        self.starts[key] = time.time()
+
+    def _leave(self, path_stack, res):
+        path    = ".".join(path_stack)
+        t_start = self.starts.pop((threading.get_ident(), path), None)
+
+        if (not path) or (t_start is None) or (res is None):
+            return # Root procedure
+
+        if isinstance(res, Result_Skipped) or self._restored(res):
+            return # Not executed
+
+        self.record(path, bool(res.result) and (res.err is None), time.time() - t_start)
+
+    @classmethod
+    def _restored(cls, res):
+        """
+        Returns True for results restored from the result cache or a checkpoint,
+        and for subprocedures with only restored results.
+        """
+
+        if res.options.get("cached", False) or res.options.get("restored", False):
+            return True
+
+        tests = getattr(res, "tests", None)
+        return bool(tests) and all(cls._restored(r) for r in tests)
+
+    def record(self, path: str, passed: bool, duration: float):
+        with self.lock:
+            st              = self.stats.setdefault(path, {"runs": 0, "fails": 0, "duration": 0.0})
+            st["runs"]     += 1
+            st["fails"]    += int(not passed)
+            st["duration"] += duration
+
+    # ──────────────── Ordering ────────────── #
+
+    def fail_rate(self, path: str) -> float:
+        """
+        Returns the estimated failure probability of a step (Laplace
+        rule of succession: 1/2 for a step never run)
+        """
+
+        st = self.stats.get(path)
+        return ((st["fails"] + 1) / (st["runs"] + 2)) if st else 0.5
+
+    def duration(self, path: str) -> float:
+        st = self.stats.get(path)
+        return (st["duration"] / st["runs"]) if (st and st["runs"]) else 0.0
+
+    def score(self, path: str) -> float:
+        """
+        Expected cost of a step per failure found: running the
+        entries by increasing score minimizes the expected time
+        to the first failure.
+        """
+
+        return self.duration(path) / self.fail_rate(path)
+
+    def order(self, proc, path_stack: List[str]):
+        """
+        Returns the entries of a subprocedure sorted by increasing score. An entry
+        is never moved before the siblings it depends on (value_from references and
+        "after" hints, see entries_deps).
+        """
+
+        return tuple(proc[i] for i in self.order_indices(proc, path_stack))
+
+    def order_indices(self, proc, path_stack: List[str]) -> List[int]:
+        """
+        Returns the indices of the entries of a subprocedure in execution order (see order)
+        """
+
+        prefix = ".".join(path_stack)
+        prefix = prefix + "." if prefix else ""
+
+        deps   = entries_deps(proc, path_stack)
+        scores = [self.score(prefix + entry[0]) for entry in proc]
+
+        done   = set()
+        order  = list()
+
+        while len(order) < len(proc):
+            ready = [i for i in range(len(proc)) if (i not in done) and deps[i] <= done]
+            best  = min(ready, key=lambda i: (scores[i], i))
+
+            done.add(best)
+            order.append(best)
+
+        return order
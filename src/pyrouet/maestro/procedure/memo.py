@@ -0,0 +1,166 @@
+"""
+┌─────────────────────────────┐
+│ Transform memoization cache │
+└─────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import pickle
+import hashlib
+
+from threading   import Lock
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+
+# ┌────────────────────────────────────────┐
+# │ Source value keys                      │
+# └────────────────────────────────────────┘
+
+# Values kept as their own key: small, and hashable
+KEY_SCALARS = (type(None), bool, int, float, complex)
+KEY_STR_MAX = 256
+
+def value_key(v):
+    """
+    Returns a key identifying the content of a value: the value itself for
+    scalars and short strings, else a digest of its content (buffers, arrays,
+    containers), so that the memo never keeps large source values alive.
+    """
+
+    if (np is not None) and isinstance(v, np.ndarray):
+        digest = hashlib.sha1(np.ascontiguousarray(v).tobytes())
+        return ("ndarray", v.dtype.str, v.shape, digest.hexdigest())
+
+    elif isinstance(v, (bytes, bytearray, memoryview)):
+        return ("bytes", hashlib.sha1(v).hexdigest())
+
+    elif isinstance(v, KEY_SCALARS) or (isinstance(v, str) and len(v) <= KEY_STR_MAX):
+        return (type(v).__name__, v)
+
+    try:
+        return (type(v).__name__, hashlib.sha1(pickle.dumps(v)).hexdigest())
+
+    except Exception:
+        hash(v) # Not picklable: kept as its own key if hashable
+        return ("object", v)
+
+
+# Step attributes that don't change the transform output
+PARAMS_SKIP = {
+    "phony", "critical", "break_if_error", "store_timestamp", "store_duration",
+    "reusable", "timeout", "resources", "aborted", "timed_out",
+    "save_value", "value_from", "constraint", "unit", "pure"
+}
+
+def params_key(step):
+    """
+    Returns a key identifying the parameters of a transform step
+    """
+
+    key = list()
+
+    for name, v in sorted(vars(step).items()):
+        if name in PARAMS_SKIP:
+            continue
+
+        try:
+            key.append((name, value_key(v)))
+        except Exception:
+            key.append((name, repr(v))) # Not picklable
+
+    return tuple(key)
+
+
+# ┌────────────────────────────────────────┐
+# │ Transform memoization cache            │
+# └────────────────────────────────────────┘
+
+class Procedure_Transform_Memo:
+    def __init__(self, max_entries: int = 128):
+        """
+        In-memory cache of the outputs of pure transforms (see the pure attribute
+        of Step_Measure_Transform), keyed by transform class, transform parameters
+        and source value content. Least recently used entries are evicted
+        beyond max_entries.
+
+        Please note that a cached output is shared by all the hits: transforms
+        must not modify their input, and outputs must be treated as immutable
+        by the steps reading them. NumPy array outputs are made read-only to
+        catch modifications.
+        """
+
+        self.max_entries = max_entries
+        self.entries     = OrderedDict() # key → transform output
+        self.lock        = Lock()
+
+        self.hits        = 0
+        self.misses      = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_or_compute(self, step, value, fn):
+        """
+        Returns the memoized output of the step transform for the value,
+        computing it with fn() on miss. Values that can't be keyed (neither
+        picklable nor hashable) are computed without caching.
+        """
+
+        try:
+            key = (type(step), params_key(step), value_key(value))
+        except TypeError:
+            return fn()
+
+        with self.lock:
+            if key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return self.entries[key]
+
+            self.misses += 1
+
+        out = fn()
+
+        if (np is not None) and isinstance(out, np.ndarray):
+            out.flags.writeable = False # Shared by the next hits
+
+        with self.lock:
+            self.entries[key] = out
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        return out
+
+    def clear(self):
+        with self.lock:
+            self.entries = OrderedDict()
+            self.hits    = 0
+            self.misses  = 0
+
+    def stats(self):
+        with self.lock:
+            return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,125 @@
+"""
+┌────────────────────────────────────────────────────┐
+│ Panel runner: run a procedure against several DUTs │
+└────────────────────────────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+ 
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+ 
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+ 
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import time
+import logging
+
+from typing             import Dict
+from concurrent.futures import ProcessPoolExecutor
+
+from pyrouet.maestro.procedure.ctx import (
+    Procedure_Context,
+    Procedure_Context_Values,
+    Procedure_Context_Errors
+)
+
+from pyrouet.maestro.objects.results import (
+    Result_Procedure,
+    Result_Panel
+)
+
+# ┌────────────────────────────────────────┐
+# │ Worker function                        │
+# └────────────────────────────────────────┘
+
+def _panel_dut_run(ctx_class, proc, dut_id, params):
+    """
+    Runs the procedure for a single DUT. Executed in a worker
+    process, so all arguments must be picklable: step classes
+    must be defined at module level.
+    """
+
+    ctx     = ctx_class(params=params)
+    errlist = Procedure_Context_Errors()
+    values  = Procedure_Context_Values()
+
+    ctx.log.info(f"Running procedure for DUT {dut_id}")
+
+    return ctx.procedure_run(proc, errlist=errlist, values=values)
+
+
+# ┌────────────────────────────────────────┐
+# │ Panel runner                           │
+# └────────────────────────────────────────┘
+
+class Procedure_Panel:
+    def __init__(self, proc, max_workers: int = None,
+                             ctx_class = Procedure_Context,
+                             mp_context = None):
+        """
+        - proc:        Procedure to run against each DUT
+        - max_workers: Maximum number of worker processes, defaults to the number of DUTs
+        - ctx_class:   Procedure_Context class to instanciate in each worker
+        - mp_context:  multiprocessing context used to start the workers
+        """
+
+        self.log         = logging.getLogger(__file__)
+
+        self.proc        = proc
+        self.max_workers = max_workers
+        self.ctx_class   = ctx_class
+        self.mp_context  = mp_context
+
+    def run(self, duts: Dict[str, Dict[str, any]]):
+        """
+        Runs the procedure for each DUT, in a process pool. duts maps each
+        DUT ID to the parameters injected in its context (ctx.params).
+
+        Returns the panel result and the error list of each DUT.
+        """
+
+        panel_res = Result_Panel()
+        errlists  = dict()
+
+        t_start   = time.time()
+
+        with ProcessPoolExecutor(max_workers = self.max_workers or max(len(duts), 1),
+                                 mp_context  = self.mp_context) as pool:
+
+            futures = { dut_id: pool.submit(_panel_dut_run, self.ctx_class, self.proc, dut_id, params)
+                        for dut_id, params in duts.items() }
+
+            for dut_id, fut in futures.items():
+                try:
+                    res, errors = fut.result()
+
+                except Exception as exc:
+                    # Worker crashed, or objects could not be pickled
+                    self.log.error(f"Execution failed for DUT {dut_id}: {exc}")
+
+                    res    = Result_Procedure(err=exc, result=False)
+                    errors = [ ((dut_id,), exc,) ]
+
+                panel_res.duts[dut_id] = res
+                errlists[dut_id]       = errors
+
+                if res.result and (res.err is None):
+                    panel_res.passed.append(dut_id)
+                else:
+                    panel_res.failed.append(dut_id)
+
+        panel_res.duration = int((time.time()-t_start)*1000)
+        panel_res.result   = not panel_res.failed
+
+        return panel_res, errlists
@@ -0,0 +1,206 @@
+"""
+┌─────────────────────────────────────────────────────────┐
+│ Pipeline runner: overlap the stages of consecutive DUTs │
+└─────────────────────────────────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import time
+import logging
+
+from dataclasses import dataclass, field
+from typing      import List, Dict, Tuple
+from threading   import Thread, Event
+from queue       import Queue
+
+from pyrouet.maestro.procedure.ctx import (
+    Procedure_Context,
+    Procedure_Context_Values,
+    Procedure_Context_Errors
+)
+
+from pyrouet.maestro.objects.results import (
+    Result_Procedure
+)
+
+# ┌────────────────────────────────────────┐
+# │ Pipeline objects                       │
+# └────────────────────────────────────────┘
+
+@dataclass
+class Pipeline_Stage:
+    name:    str
+    entries: Tuple = field(default_factory=tuple) # Top-level procedure entries of the stage
+
+
+@dataclass
+class Pipeline_DUT:
+    dut_id:  str
+    params:  Dict[str, any]
+
+    values:  Procedure_Context_Values = field(default_factory=Procedure_Context_Values)
+    errlist: Procedure_Context_Errors = field(default_factory=Procedure_Context_Errors)
+    res:     Result_Procedure         = field(default_factory=Result_Procedure)
+
+    t_start: float = 0.0
+
+
+# ┌────────────────────────────────────────┐
+# │ Pipeline runner                        │
+# └────────────────────────────────────────┘
+
+class Procedure_Pipeline:
+    def __init__(self, proc, stages: Dict[str, List[str]] = None,
+                             ctx_class = Procedure_Context):
+        """
+        - proc:      Procedure to run against each DUT
+        - stages:    Stage name → IDs of the top-level entries of the stage, in
+                     procedure order. Defaults to one stage per top-level entry.
+        - ctx_class: Procedure_Context class to instanciate for each stage
+
+        Each stage runs in its own thread with its own context, so the stages
+        must use disjoint hardware: DUT N+1 enters the first stage while DUT N
+        is in the second one.
+        """
+
+        self.log       = logging.getLogger(__file__)
+
+        self.proc      = proc
+        self.ctx_class = ctx_class
+        self.stages    = self._stages_build(proc, stages)
+        self.contexts  = [ctx_class() for stage in self.stages]
+
+    def _stages_build(self, proc, stages):
+        entries = {entry[0]: entry for entry in proc}
+
+        if len(entries) != len(proc):
+            raise ValueError("Duplicate top-level entry IDs in procedure")
+
+        if stages is None:
+            return [Pipeline_Stage(name=id_, entries=(entry,)) for id_, entry in entries.items()]
+
+        # Check that stages cover the whole procedure, in order
+        ids = [id_ for stage_ids in stages.values() for id_ in stage_ids]
+        if ids != list(entries.keys()):
+            raise ValueError(f"Stages {ids} don't match the top-level entries {list(entries.keys())}")
+
+        return [Pipeline_Stage(name=name, entries=tuple(entries[id_] for id_ in stage_ids))
+                for name, stage_ids in stages.items()]
+
+    # ──────────── Stage execution ─────────── #
+
+    def _stage_run(self, stage, ctx, queue_in, queue_out, stop_event):
+        while True:
+            dut = queue_in.get()
+
+            if dut is None: # End of DUTs
+                queue_out.put(None)
+                return
+
+            if stop_event.is_set(): # Pipeline closed: pending DUTs are dropped
+                continue
+
+            if dut.res.err is None: # Skipped if a previous stage stopped the procedure
+                self.log.info(f"Stage {stage.name} for DUT {dut.dut_id}")
+
+                ctx.params = dict(dut.params)
+
+                try:
+                    stage_res, errors = ctx.procedure_run(stage.entries, errlist=dut.errlist, values=dut.values)
+
+                    dut.res.tests.extend(stage_res.tests)
+
+                    if not stage_res.result:
+                        dut.res.result = False
+                        dut.res.err    = stage_res.err
+
+                except Exception as exc:
+                    self.log.error(f"Stage {stage.name} failed for DUT {dut.dut_id}: {exc}")
+
+                    dut.res.result = False
+                    dut.res.err    = exc
+                    dut.errlist.register([stage.name], exc)
+
+            queue_out.put(dut)
+
+    def run(self, duts: Dict[str, Dict[str, any]]):
+        """
+        Runs the procedure for each DUT, overlapping the stages of consecutive DUTs.
+        duts maps each DUT ID to the parameters injected in the context (ctx.params)
+        of each stage.
+
+        Yields, in DUT order, the DUT ID, its procedure result and its error list
+        as soon as the DUT leaves the last stage. Each DUT gets its own values store,
+        so later stages can reference the values saved by the earlier ones.
+
+        Breaking from the loop (or closing the generator) stops the pipeline: the
+        running stages are aborted, and the pending DUTs are dropped.
+        """
+
+        stop    = Event()
+        done    = False
+        queues  = [Queue() for i in range(len(self.stages)+1)]
+        threads = [ Thread(target = self._stage_run,
+                           args   = (stage, ctx, queues[i], queues[i+1], stop),
+                           name   = f"pipeline-{stage.name}",
+                           daemon = True)
+                    for i, (stage, ctx) in enumerate(zip(self.stages, self.contexts)) ]
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            for dut_id, params in duts.items():
+                queues[0].put(Pipeline_DUT(dut_id=dut_id, params=params, t_start=time.time()))
+
+            queues[0].put(None)
+
+            while True:
+                dut = queues[-1].get()
+                if dut is None:
+                    done = True
+                    break
+
+                # All stages where executed without error!
+                if dut.res.result is None:
+                    dut.res.result = True
+
+                dut.res.duration = int((time.time()-dut.t_start)*1000)
+
+                yield dut.dut_id, dut.res, dut.errlist.errors
+
+        finally:
+            if not done:
+                self.log.info("Pipeline stopped, aborting the running stages")
+
+                stop.set()
+                for ctx in self.contexts:
+                    ctx.abort()
+
+            for thread in threads:
+                thread.join()
+
+    def teardown(self):
+        """
+        Releases the resources held by the reusable steps of each stage
+        """
+
+        for ctx in self.contexts:
+            ctx.teardown()
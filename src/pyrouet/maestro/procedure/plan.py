@@ -0,0 +1,332 @@
+"""
+┌───────────────────────────────────────────────┐
+│ Procedure plan: compiled procedure definition │
+└───────────────────────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+ 
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+ 
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+ 
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+from dataclasses import dataclass, field
+from typing      import List, Dict, Tuple, Set
+
+from pyrouet.maestro.procedure.step import (
+    Step_Base,
+    Step_Measure,
+    Step_Measure_Transform_Fused
+)
+
+# ┌────────────────────────────────────────┐
+# │ Plan instructions                      │
+# └────────────────────────────────────────┘
+
+PLAN_STEP  = 0 # Run a step
+PLAN_ENTER = 1 # Enter a subprocedure
+PLAN_LEAVE = 2 # Leave a subprocedure
+
+@dataclass
+class Plan_Instruction:
+    op:         int
+    step_id:    str
+    path:       Tuple[str]          # Full path of the step or subprocedure
+    path_str:   str                 # Dotted path
+
+    step_def:   type           = None # Step class (PLAN_STEP)
+    step_args:  Dict[str, any] = None # Step kwargs, with resolved value references (PLAN_STEP)
+
+    jump:       int            = 0    # Index of the matching PLAN_LEAVE/PLAN_ENTER instruction
+    leave:      int            = 0    # Index of the enclosing PLAN_LEAVE instruction
+
+    options:    Dict[str, any] = field(default_factory=dict) # Subprocedure options (PLAN_ENTER)
+    children:   List[int]      = None                         # Child instructions of parallel subprocedures
+    deps:       List[Set[int]] = None                         # Children dependencies of dataflow subprocedures
+    entries:    Tuple          = None                         # Children entries of reorderable subprocedures
+
+
+# ┌────────────────────────────────────────┐
+# │ Dataflow dependencies                  │
+# └────────────────────────────────────────┘
+
+def value_ref_resolve(key, path):
+    """
+    Resolves a relative value reference ("^" in key) against the
+    subprocedure path, the same way Procedure_Context_Values.get does.
+    """
+
+    path_subproc = ".".join(path)
+    return key.replace("^", path_subproc + ("." if path_subproc else ""))
+
+
+def _entry_refs(entry, path):
+    """
+    Yields the (resolved) value references used by the entry,
+    recursively for subprocedures.
+    """
+
+    step_def = entry[1]
+
+    if isinstance(step_def, tuple):
+        for child in step_def:
+            yield from _entry_refs(child, list(path) + [entry[0]])
+
+    elif (len(entry) > 2) and isinstance(entry[2], dict):
+        value_from = entry[2].get("value_from", None)
+        if isinstance(value_from, str):
+            yield value_ref_resolve(value_from, path)
+
+
+def entries_consumers(proc, path):
+    """
+    Returns the count of consumers (value_from references) of each value
+    saved by the procedure, recursively for subprocedures.
+    """
+
+    consumers = dict()
+
+    for entry in proc:
+        for ref in _entry_refs(entry, path):
+            consumers[ref] = consumers.get(ref, 0) + 1
+
+    return consumers
+
+
+def entries_deps(proc, path):
+    """
+    Computes the dependencies between the entries of a subprocedure, from
+    the value references (value_from arguments) and the explicit ordering hints
+    ("after" step argument or subprocedure option, giving the ids of siblings).
+
+    Returns for each entry the set of indexes of the entries it depends on. Only
+    the previous entries are considered, so that the sequential order always
+    stays a valid schedule.
+    """
+
+    prefix = ".".join(path)
+    prefix = prefix + "." if prefix else ""
+
+    ids    = [entry[0] for entry in proc]
+    deps   = list()
+
+    for idx, entry in enumerate(proc):
+        refs  = set(_entry_refs(entry, path))
+        hints = entry[2].get("after", tuple()) if (len(entry) > 2) and isinstance(entry[2], dict) else tuple()
+        hints = (hints,) if isinstance(hints, str) else hints
+
+        entry_deps = set()
+        for prev in range(idx):
+            prev_key = prefix + ids[prev]
+            if (ids[prev] in hints) or any((r == prev_key) or r.startswith(prev_key + ".") for r in refs):
+                entry_deps.add(prev)
+
+        deps.append(entry_deps)
+
+    return deps
+
+
+# ┌────────────────────────────────────────┐
+# │ Procedure plan                         │
+# └────────────────────────────────────────┘
+
+class Procedure_Plan:
+    def __init__(self, proc, path_stack: List[str] = None, limits = None):
+        """
+        Compiles the procedure definition into a flat list of instructions,
+        executed by Procedure_Context.plan_run. The procedure structure is validated
+        once: a TypeError or ValueError is raised for invalid definitions.
+
+        Relative value references ("^" in value_from arguments) are resolved
+        against the step path at compile time.
+
+        The measures without constraint argument get their constraint (and unit)
+        from the limits table (Limit_Table), if any.
+        """
+
+        self.proc         = proc
+        self.limits       = limits
+        self.instructions = list()
+
+        heads, patch = self._compile(proc, list(path_stack or list()))
+
+        # Consumers of the saved values, for the values store memory budget
+        self.consumers = entries_consumers(proc, list(path_stack or list()))
+
+        # Top level instructions leave the plan
+        for idx in patch:
+            self.instructions[idx].leave = len(self.instructions)
+
+    def __len__(self):
+        return len(self.instructions)
+
+    # ────────────── Compilation ───────────── #
+
+    def _compile(self, proc, path):
+        """
+        Compiles the procedure entries. Returns the indexes of the entry instructions,
+        and the indexes of the instructions to patch with the enclosing PLAN_LEAVE index.
+        """
+
+        if not isinstance(proc, tuple):
+            raise TypeError(f"Invalid procedure at {'.'.join(path)}: {proc}")
+
+        heads = list()
+        patch = list()
+        ids   = set()
+
+        for entry in proc:
+            if (not isinstance(entry, tuple)) or (len(entry) not in (2,3)):
+                raise TypeError(f"Invalid procedure entry at {'.'.join(path)}: {entry}")
+
+            step_id  = entry[0]
+            step_def = entry[1]
+
+            if not isinstance(step_id, str):
+                raise TypeError(f"Invalid step id at {'.'.join(path)}: {step_id}")
+
+            if step_id in ids:
+                raise ValueError(f"Duplicate step id at {'.'.join(path)}: {step_id}")
+            ids.add(step_id)
+
+            step_path     = tuple(path) + (step_id,)
+            step_path_str = ".".join(step_path)
+
+            # Subprocedure
+            if isinstance(step_def, tuple):
+                step_opts = entry[2] if len(entry) > 2 else dict()
+
+                i_enter = len(self.instructions)
+                self.instructions.append(Plan_Instruction(
+                    op       = PLAN_ENTER,
+                    step_id  = step_id,
+                    path     = step_path,
+                    path_str = step_path_str,
+                    options  = step_opts
+                ))
+
+                children, children_patch = self._compile(step_def, list(step_path))
+
+                i_leave = len(self.instructions)
+                self.instructions.append(Plan_Instruction(
+                    op       = PLAN_LEAVE,
+                    step_id  = step_id,
+                    path     = step_path,
+                    path_str = step_path_str,
+                    jump     = i_enter
+                ))
+
+                self.instructions[i_enter].jump = i_leave
+                if step_opts.get("parallel", False) or step_opts.get("dataflow", False):
+                    self.instructions[i_enter].children = children
+
+                if step_opts.get("dataflow", False):
+                    self.instructions[i_enter].deps     = entries_deps(step_def, list(step_path))
+
+                elif step_opts.get("reorderable", False) and not step_opts.get("parallel", False):
+                    self.instructions[i_enter].children = children
+                    self.instructions[i_enter].entries  = step_def
+
+                for idx in children_patch:
+                    self.instructions[idx].leave = i_leave
+
+                heads.append(i_enter)
+                patch.extend((i_enter, i_leave,))
+
+            # Step
+            elif isinstance(step_def, type) and issubclass(step_def, Step_Base):
+                if (len(entry) < 3) or (not isinstance(entry[2], dict)):
+                    raise TypeError(f"Missing step arguments for step {step_path_str}")
+
+                i_step = len(self.instructions)
+                self.instructions.append(Plan_Instruction(
+                    op        = PLAN_STEP,
+                    step_id   = step_id,
+                    path      = step_path,
+                    path_str  = step_path_str,
+                    step_def  = step_def,
+                    step_args = self._limits_apply(step_def, self._args_resolve(entry[2], path), step_path_str)
+                ))
+
+                heads.append(i_step)
+                patch.append(i_step)
+
+            else:
+                raise TypeError(f"Uknown step type for step {step_id}: {step_def}:{type(step_def)}, step={entry}")
+
+        return heads, patch
+
+    def _limits_apply(self, step_def, step_args, path_str):
+        """
+        Sets the constraint of a measure from the limits table
+        """
+
+        if self.limits is None:
+            return step_args
+
+        if issubclass(step_def, Step_Measure_Transform_Fused):
+            return self._limits_apply_outputs(step_args, path_str)
+
+        if not issubclass(step_def, Step_Measure):
+            return step_args
+
+        if step_args.get("constraint", None) is not None:
+            return step_args
+
+        constraint = self.limits.constraint_get(path_str)
+        if constraint is None:
+            return step_args
+
+        step_args = dict(step_args, constraint=constraint)
+
+        unit = self.limits.unit_get(path_str)
+        if (unit is not None) and (not step_args.get("unit", None)):
+            step_args["unit"] = unit
+
+        return step_args
+
+    def _limits_apply_outputs(self, step_args, path_str):
+        """
+        Sets the constraints of the fused transform outputs from the limits table
+        """
+
+        outputs = dict(step_args.get("outputs", dict()))
+
+        for name, out in outputs.items():
+            constraint, unit = out if isinstance(out, tuple) else (out, "")
+            if constraint is not None:
+                continue
+
+            out_path   = f"{path_str}.{name}"
+            constraint = self.limits.constraint_get(out_path)
+
+            if constraint is not None:
+                outputs[name] = (constraint, unit or self.limits.unit_get(out_path) or "")
+
+        return dict(step_args, outputs=outputs)
+
+    @staticmethod
+    def _args_resolve(step_args, path):
+        """
+        Resolves the relative value reference of the step arguments, the same
+        way Procedure_Context_Values.get does.
+        """
+
+        value_from = step_args.get("value_from", None)
+        if isinstance(value_from, str) and ("^" in value_from):
+            step_args  = dict(step_args)
+            step_args["value_from"] = value_ref_resolve(value_from, path)
+
+        return step_args
@@ -0,0 +1,143 @@
+"""
+┌────────────────────────────────────────────┐
+│ Adaptive step skipping with audit sampling │
+└────────────────────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import os
+import json
+import random
+import logging
+
+from threading import Lock
+from typing    import List
+
+from pyrouet.maestro.objects.results import Result_Skipped
+from pyrouet.maestro.procedure.step  import Step_Measure
+
+
+# ┌────────────────────────────────────────┐
+# │ Skip policy                            │
+# └────────────────────────────────────────┘
+
+class Procedure_Skip_Policy:
+    def __init__(self, history,
+                       min_runs: int         = 1000,
+                       audit_fraction: float = 0.05,
+                       exclude: List[str]    = None,
+                       seed: int             = None,
+                       path: str             = None):
+        """
+        Skips the measures that never failed, from the statistics of a
+        Procedure_History. A measure is skippable once it passed min_runs
+        times in a row since the last process change (see process_change).
+        Skippable measures are still run on the audit runs, drawn with the
+        audit_fraction probability for each DUT, so that the statistics
+        stay up to date: a failure on an audit run makes the measure
+        mandatory again.
+
+        Measures saving their value for other steps are never skipped.
+
+        - history:        Procedure_History of the procedure
+        - min_runs:       Count of passed runs before a measure can be skipped
+        - audit_fraction: Fraction of the runs executing all the measures
+        - exclude:        Paths (or path prefixes) of the steps that are never skipped
+        - seed:           Seed of the audit draws
+        - path:           JSON file the process change baseline is loaded from,
+                          and saved to on each process change. Without it, the
+                          process changes are forgotten when the station restarts.
+        """
+
+        self.log            = logging.getLogger(__file__)
+
+        self.history        = history
+        self.min_runs       = min_runs
+        self.audit_fraction = audit_fraction
+        self.exclude        = tuple(exclude or tuple())
+
+        self.path           = path
+        self.random         = random.Random(seed)
+        self.baseline       = dict() # path key → (runs, fails) at the last process change
+        self.lock           = Lock()
+
+        if (path is not None) and os.path.exists(path):
+            with open(path, "r") as fhandle:
+                self.baseline = {k: tuple(v) for k, v in json.load(fhandle).items()}
+
+    # ──────────── Process changes ─────────── #
+
+    def process_change(self):
+        """
+        Makes all the measures mandatory again after a process change
+        (new component lot, fixture repair, firmware update...), until
+        they requalify with min_runs passed runs.
+        """
+
+        with self.history.lock:
+            baseline = {path: (st["runs"], st["fails"]) for path, st in self.history.stats.items()}
+
+        with self.lock:
+            self.baseline = baseline
+
+        if self.path is not None:
+            with open(self.path, "w") as fhandle:
+                json.dump(baseline, fhandle, indent=1)
+
+        self.log.info("Process change, all measures are mandatory")
+
+    # ─────────────── Decisions ────────────── #
+
+    def audit_draw(self) -> bool:
+        """
+        Returns True if the next run is an audit run
+        """
+
+        with self.lock:
+            return self.random.random() < self.audit_fraction
+
+    def skippable(self, path: str) -> bool:
+        if any((path == p) or path.startswith(p + ".") for p in self.exclude):
+            return False
+
+        st = self.history.stats.get(path)
+        if st is None:
+            return False
+
+        with self.lock:
+            runs_0, fails_0 = self.baseline.get(path, (0, 0))
+
+        return ((st["runs"] - runs_0) >= self.min_runs) and (st["fails"] == fails_0)
+
+    def skip(self, step, path_stack: List[str], audit: bool):
+        """
+        Returns the skipped result of a step, None if the step must be run
+        """
+
+        if audit or (not isinstance(step, Step_Measure)) or step.save_value:
+            return None
+
+        path = ".".join(path_stack)
+        if not self.skippable(path):
+            return None
+
+        self.log.debug(f"Skipping step {path}")
+
+        return Result_Skipped(result=True, reason=f"no failure in the last {self.min_runs}+ runs")
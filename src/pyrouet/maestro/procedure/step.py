@@ -26,13 +26,17 @@
 
 import traceback
 import time
+import math
 import logging
+import asyncio
 
 from abc import (
     ABC,
     abstractmethod
 )
 
+from typing import Dict
+
 from ..objects.results import (
     Result_Action,
     Result_Measure,
@@ -48,6 +52,11 @@ from ..constraints import (
     Constraint_None
 )
 
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
 from ..errors import (
     Procedure_Error,
     Procedure_Constraint_Error,
@@ -63,8 +72,12 @@ class Step_Base(ABC):
     def __init__(self, **kwargs):
         """
         Available kwargs:
-        - phony:   bool → Execute even if already done
-        - critcal: bool → Stop procedure execution if error
+        - phony:    bool  → Execute even if already done
+        - critcal:  bool  → Stop procedure execution if error
+        - reusable: bool  → Keep the step instance across runs (see reset and teardown)
+        - timeout:  float → Maximum step duration in seconds, the step is aborted after
+        - resources: str or list → Named resources (serial port, instrument, etc.) used
+                     exclusively by the step when running concurrently with others
         """
 
         super().__init__()
@@ -75,6 +88,17 @@ class Step_Base(ABC):
         self.break_if_error  = kwargs.get("break_if_error" , False)
         self.store_timestamp = kwargs.get("store_timestamp", False)
         self.store_duration  = kwargs.get("store_duration" , False)
+        self.reusable        = kwargs.get("reusable"       , False)
+        self.timeout         = kwargs.get("timeout"        , None)
+
+        resources            = kwargs.get("resources"      , tuple())
+        if isinstance(resources, str):
+            resources = (resources,)
+        self.resources       = tuple(sorted(set(resources)))
+
+        # Set by the procedure context when the step is aborted
+        self.aborted         = False
+        self.timed_out       = False
 
     def options_get(self):
         dd = {
@@ -82,7 +106,10 @@ class Step_Base(ABC):
             "critical":       self.critical,
             "break_if_error": self.break_if_error,
             "store_timestamp": self.store_timestamp,
-            "store_duration": self.store_duration
+            "store_duration": self.store_duration,
+            "reusable":       self.reusable,
+            "timeout":        self.timeout,
+            "resources":      self.resources
         }
 
         return dd
@@ -91,12 +118,57 @@ class Step_Base(ABC):
     def run(self, ctx, path_stack, errlist, values):
         pass # pragma: no cover
 
+    async def run_async(self, ctx, path_stack, errlist, values):
+        """
+        Asynchronous run. By default, the blocking run() function
+        is executed in the event loop's default executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.run, ctx, path_stack, errlist, values)
+
     def clean(self):
         pass # pragma: no cover
 
     def abort(self):
+        """
+        Called by the procedure context, from another thread, when the running
+        step is aborted (timeout or context abort). Must release the blocking
+        calls of the step (close serial port, etc.). The step can also check
+        the aborted flag.
+        """
         pass # pragma: no cover
 
+    def reset(self):
+        """
+        Called before each new run of a reusable step instance.
+        """
+        pass # pragma: no cover
+
+    def teardown(self):
+        """
+        Releases the resources held by a reusable step instance,
+        when the bench shuts down (see Procedure_Context.teardown).
+        """
+        pass # pragma: no cover
+
+    # ────────── Result construction ───────── #
+
+    def _result_new(self):
+        return Result_Action(result=False) # Default result is False
+
+    def _result_err(self, r, e, path_stack, errlist):
+        r.result = False
+        r.err    = e                       # Store error
+        errlist.register(path_stack, e)    # Register in errlist
+
+    def _result_timing(self, r, t_start, t_end):
+        # Store timing information
+        if self.store_timestamp:
+            r.timestamp = int(t_start*1000)
+
+        if self.store_duration:
+            r.duration  = int((t_end-t_start)*1000)
+
     @classmethod
     def path_str(cls, path_stack):
         return ".".join(path_stack)
@@ -118,7 +190,7 @@ class Step_Action(Step_Base):
         log     = logging.getLogger(self.path_str(path_stack))
 
         id_     = path_stack[-1]              # ID of action is tail of stack
-        r       = Result_Action(result=False) # Default result is False
+        r       = self._result_new()          # Default result is False
 
         t_start = time.time()
 
@@ -127,21 +199,13 @@ class Step_Action(Step_Base):
             r.result = True                 # No exception, action did go sucessfully
 
         except Exception as e:
-            r.err = e                       # Store error
-            errlist.register(path_stack, e) # Register in errlist
+            self._result_err(r, e, path_stack, errlist)
 
             # Print traceback if unknown error
             if not isinstance(e, Procedure_Error):
                 log.error(traceback.format_exc())
         finally:
-            t_end = time.time()
-
-            # Store timing information
-            if self.store_timestamp:
-                r.timestamp = int(t_start*1000)
-
-            if self.store_duration:
-                r.duration  = int((t_end-t_start)*1000)
+            self._result_timing(r, t_start, time.time())
 
         return r
 
@@ -176,58 +240,82 @@ class Step_Measure(Step_Base):
         id_ = path_stack[-1] # ID of action is tail of stack
 
         # Construct result object
-        r   = Result_Measure(
-            constraint = Constraint_Description.from_constraint(self.constraint),
-            unit       = self.unit,
-        )
+        r   = self._result_new()
 
         # Start timestamp
         t_start = time.time()
 
         try:
-            # Get and store value
-            value   = self._measure(ctx, path_stack, values) # Measure value
-            r.value = value                                  # Store in result
-
-            # Store in saved values if needed
-            if self.save_value:
-                values.set(path_stack, r.value)
-
-            # Compare against constraint
-            if not self.constraint.validate(r.value):
-                raise Procedure_Constraint_Error(r.constraint, r.value, path_stack)
-
-            # Measure and constraint validated without error, result is True
-            r.result = True
+            # Get, store and validate value
+            self._result_value(r, self._measure(ctx, path_stack, values), path_stack, values)
 
         except Exception as e:
-            r.result = False
-            r.err    = e # Store error
-            errlist.register(path_stack, e) # Register exception in error list
+            self._result_err(r, e, path_stack, errlist)
 
             # Print traceback if uknown error
             if not isinstance(e, Procedure_Error):
                 log.debug(traceback.format_exc())
         finally:
-            t_end = time.time()
-
-            # Store timing information
-            if self.store_timestamp:
-                r.timestamp = int(t_start*1000)
-            if self.store_duration:
-                r.duration  = int((t_end-t_start)*1000)
+            self._result_timing(r, t_start, time.time())
 
         return r
 
     def clean(self):
         pass # pragma: no cover
 
+    # ────────── Result construction ───────── #
+
+    def _result_new(self):
+        return Result_Measure(
+            constraint = Constraint_Description.from_constraint(self.constraint),
+            unit       = self.unit,
+        )
+
+    def _result_value(self, r, value, path_stack, values):
+        r.value = value # Store in result
+
+        # Store in saved values if needed
+        if self.save_value:
+            values.set(path_stack, r.value)
+
+        # Compare against constraint
+        passed, details = self.constraint.validate_report(r.value)
+
+        if details is not None:
+            r.options.update(details)
+
+        if not passed:
+            raise Procedure_Constraint_Error(r.constraint, r.value, path_stack)
+
+        # Measure and constraint validated without error, result is True
+        r.result = True
+
 
 # ┌────────────────────────────────────────┐
 # │ Class for Measure transforms           │
 # └────────────────────────────────────────┘
 
+def _transform_memoized(step, ctx, path_stack, value):
+    """
+    Runs the transform of the step, through the transforms
+    memoization cache of the context for pure transforms.
+    """
+
+    memo = getattr(ctx, "transform_memo", None)
+
+    if (memo is None) or (not step.pure):
+        return step._transform(ctx, path_stack, value)
+
+    return memo.get_or_compute(step, value, lambda: step._transform(ctx, path_stack, value))
+
+
 class Step_Measure_Transform(Step_Measure):
+    # Pure transforms only depend on their parameters and input value: their
+    # output is memoized by the context transform_memo, if any, and shared by
+    # the hits: it must be treated as immutable. Can be overriden with the
+    # 'pure' kwarg.
+    pure = False
+
     def __init__(self,
         value_from: str,
         constraint: Constraint_Object = None,
@@ -242,11 +330,12 @@ class Step_Measure_Transform(Step_Measure):
         )
 
         self.value_from = value_from
+        self.pure       = kwargs.get("pure", type(self).pure)
 
     def _measure(self, ctx, path_stack, values):
         # Get value from ctx values
         vv = values.get(self.value_from, path_stack)
-        return self._transform(ctx, path_stack, vv)
+        return _transform_memoized(self, ctx, path_stack, vv)
 
     def _transform(self, ctx, path_stack, value):
         """
@@ -257,3 +346,435 @@ class Step_Measure_Transform(Step_Measure):
         # To be implemeted
         return value
 
+
+# ┌────────────────────────────────────────┐
+# │ Class for fused Measure transforms     │
+# └────────────────────────────────────────┘
+
+class Step_Measure_Transform_Fused(Step_Base):
+    pure = False # See Step_Measure_Transform
+
+    def __init__(self,
+        value_from: str,
+        outputs: Dict[str, any],
+        **kwargs
+    ):
+        """
+        Computes several named measures from the same source value in one pass,
+        so that shared intermediates (FFT of a capture, etc.) are computed once.
+        outputs maps each output name to its constraint, or to a (constraint, unit)
+        tuple:
+
+        {"rms": (Constraint_Range(0.1, 0.2), "V"), "thd": Constraint_Below(1.0)}
+
+        The step result is a container with a Result_Measure for each output, at
+        the step path suffixed with the output name. With the 'save_value' option,
+        each output is saved at this path.
+        """
+
+        super().__init__(**kwargs)
+
+        # Kwargs options
+        self.save_value = kwargs.get("save_value", False)
+
+        # Other parameters
+        self.value_from = value_from
+        self.outputs    = {name: self._output_def(out) for name, out in outputs.items()}
+        self.pure       = kwargs.get("pure", type(self).pure)
+
+    @staticmethod
+    def _output_def(out):
+        constraint, unit = out if isinstance(out, tuple) else (out, "")
+        return (constraint or Constraint_None(), unit)
+
+    def _transform(self, ctx, path_stack, value):
+        """
+        Computes the outputs from the value argument input,
+        and returns them in a dict, by output name.
+        """
+        pass # pragma: no cover
+
+    def run(self, ctx, path_stack, errlist, values):
+        log = logging.getLogger(self.path_str(path_stack))
+
+        # Construct result object
+        r   = self._result_new()
+
+        # Start timestamp
+        t_start = time.time()
+
+        try:
+            vv      = values.get(self.value_from, path_stack)
+            outputs = _transform_memoized(self, ctx, path_stack, vv)
+
+            r.result = True
+            for name, (constraint, unit) in self.outputs.items():
+                m = self._output_result(name, constraint, unit, outputs, path_stack + [name], errlist, values)
+                r.tests.append(m)
+                r.result = r.result and m.result
+
+        except Exception as e:
+            self._result_err(r, e, path_stack, errlist)
+
+            # Print traceback if uknown error
+            if not isinstance(e, Procedure_Error):
+                log.debug(traceback.format_exc())
+        finally:
+            self._result_timing(r, t_start, time.time())
+
+        return r
+
+    def clean(self):
+        pass # pragma: no cover
+
+    # ────────── Result construction ───────── #
+
+    def _result_new(self):
+        return Result_Container(result=False)
+
+    def _output_result(self, name, constraint, unit, outputs, out_path, errlist, values):
+        m = Result_Measure(
+            step_id    = name,
+            constraint = Constraint_Description.from_constraint(constraint),
+            unit       = unit
+        )
+
+        try:
+            if name not in outputs:
+                raise Procedure_Error(f"Missing transform output {name}", out_path)
+
+            m.value = outputs[name]
+
+            # Store in saved values if needed
+            if self.save_value:
+                values.set(out_path, m.value)
+
+            # Compare against constraint
+            passed, details = constraint.validate_report(m.value)
+
+            if details is not None:
+                m.options.update(details)
+
+            if not passed:
+                raise Procedure_Constraint_Error(m.constraint, m.value, out_path)
+
+            m.result = True
+
+        except Exception as e:
+            self._result_err(m, e, out_path, errlist)
+
+        return m
+
+
+
+# ┌────────────────────────────────────────┐
+# │ Streaming Measure step                 │
+# └────────────────────────────────────────┘
+
+class Stream_Aggregate:
+    """
+    Running aggregate of a stream of samples
+    """
+
+    KINDS = ("mean", "rms", "min", "max")
+
+    def __init__(self, kind: str = "mean"):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown stream aggregate: {kind}")
+
+        self.kind = kind
+        self.n    = 0
+        self.s1   = 0.0       # Sum of samples
+        self.s2   = 0.0       # Sum of squared samples
+        self.s4   = 0.0       # Sum of samples to the fourth power
+        self.min  = math.inf
+        self.max  = -math.inf
+
+    def update(self, chunk):
+        """
+        Adds a chunk of samples (scalar or array-like)
+        """
+
+        if np is not None:
+            arr = np.asarray(chunk, dtype=float).ravel()
+            if not arr.size:
+                return
+
+            sq       = arr*arr
+            self.n  += arr.size
+            self.s1 += float(arr.sum())
+            self.s2 += float(sq.sum())
+            self.s4 += float((sq*sq).sum())
+            self.min = min(self.min, float(arr.min()))
+            self.max = max(self.max, float(arr.max()))
+
+        else:
+            for x in (chunk if hasattr(chunk, "__iter__") else (chunk,)):
+                x        = float(x)
+                self.n  += 1
+                self.s1 += x
+                self.s2 += x*x
+                self.s4 += x*x*x*x
+                self.min = min(self.min, x)
+                self.max = max(self.max, x)
+
+    def value(self):
+        if not self.n:
+            return None
+
+        if   self.kind == "mean": return self.s1/self.n
+        elif self.kind == "rms" : return math.sqrt(self.s2/self.n)
+        elif self.kind == "min" : return self.min
+        else                    : return self.max
+
+    def bounds(self, z: float):
+        """
+        Returns the (low, high) bounds of the final aggregate value: confidence
+        interval for mean and RMS, known bound for min and max.
+        """
+
+        if self.kind == "min":
+            return (-math.inf, self.min) # Can only decrease
+
+        elif self.kind == "max":
+            return (self.max, math.inf)  # Can only increase
+
+        # Confidence interval of the mean (of squared samples for RMS)
+        if self.kind == "mean":
+            m, m2 = self.s1/self.n, self.s2/self.n
+        else:
+            m, m2 = self.s2/self.n, self.s4/self.n
+
+        delta  = z*math.sqrt(max(m2 - m*m, 0.0)/self.n)
+        lo, hi = m - delta, m + delta
+
+        if self.kind == "rms":
+            lo, hi = math.sqrt(max(lo, 0.0)), math.sqrt(hi)
+
+        return (lo, hi)
+
+    def settled(self, interval, z: float):
+        """
+        Returns "pass" or "fail" if the verdict against the accepted interval
+        can't change anymore (statistically for mean and RMS), None otherwise.
+        """
+
+        lo, hi = self.bounds(z)
+
+        if (lo > interval[1]) or (hi < interval[0]):
+            return "fail"
+
+        elif (lo >= interval[0]) and (hi <= interval[1]):
+            return "pass"
+
+        return None
+
+
+class Step_Measure_Stream(Step_Measure):
+    def __init__(self,
+        constraint: Constraint_Object = None,
+        unit: str                     = "",
+        **kwargs
+    ):
+        """
+        Measure whose implementation yields chunks of samples. The measured value
+        is a running aggregate of the samples, and the acquisition ends early as
+        soon as the verdict against the constraint is settled.
+
+        Available kwargs:
+        - aggregate:   str   → mean, rms, min or max (default: mean)
+        - early_exit:  bool  → End acquisition when the verdict is settled (default: True)
+        - min_samples: int   → Samples before considering early exit (default: 10)
+        - confidence:  float → Width of the mean/RMS confidence interval, in standard
+                               errors (default: 3.0)
+        """
+
+        super().__init__(constraint, unit, **kwargs)
+
+        self.aggregate   = kwargs.get("aggregate",   "mean")
+        self.early_exit  = kwargs.get("early_exit",  True)
+        self.min_samples = kwargs.get("min_samples", 10)
+        self.confidence  = kwargs.get("confidence",  3.0)
+
+        self.stream_info = dict() # Samples count and early exit verdict of the last run
+
+    def _measure_stream(self, ctx, path_stack, values):
+        """
+        Generator yielding the measured samples, by chunks. Acquisition
+        must be stopped in a finally clause if the generator is closed
+        early.
+        """
+        pass # pragma: no cover
+
+    def _measure(self, ctx, path_stack, values):
+        agg      = Stream_Aggregate(self.aggregate)
+        interval = self.constraint.interval() if self.early_exit else None
+        verdict  = None
+
+        stream   = self._measure_stream(ctx, path_stack, values)
+        try:
+            for chunk in stream:
+                agg.update(chunk)
+
+                if self.aborted:
+                    break
+
+                if (interval is not None) and (agg.n >= self.min_samples):
+                    verdict = agg.settled(interval, self.confidence)
+                    if verdict is not None:
+                        break
+        finally:
+            stream.close()
+
+        self.stream_info = {"samples": agg.n, "early_exit": verdict}
+
+        # Confidence interval of the result
+        if (self.aggregate in ("mean", "rms")) and agg.n:
+            self.stream_info["interval"] = list(agg.bounds(self.confidence))
+
+        return agg.value()
+
+    def _result_value(self, r, value, path_stack, values):
+        r.options.update(self.stream_info)
+        super()._result_value(r, value, path_stack, values)
+
+    def clean(self):
+        self.stream_info = dict()
+
+
+class Step_Measure_Averaged(Step_Measure_Stream):
+    def __init__(self,
+        constraint: Constraint_Object = None,
+        unit: str                     = "",
+        **kwargs
+    ):
+        """
+        Measure averaging noisy readings. Readings are taken until the confidence
+        interval of their mean is fully inside or outside the constraint interval,
+        with at most max_samples readings (default: 100). The readings count and
+        the confidence interval are stored in the result options.
+
+        See Step_Measure_Stream for the other kwargs (aggregate is always mean).
+        """
+
+        super().__init__(constraint, unit, **dict(kwargs, aggregate="mean"))
+
+        self.max_samples = kwargs.get("max_samples", 100)
+        self.min_samples = kwargs.get("min_samples", 5)
+
+    def _sample(self, ctx, path_stack, values):
+        """
+        Returns a single reading
+        """
+        pass # pragma: no cover
+
+    def _measure_stream(self, ctx, path_stack, values):
+        for i in range(self.max_samples):
+            yield self._sample(ctx, path_stack, values)
+
+
+# ┌────────────────────────────────────────┐
+# │ Asynchronous steps                     │
+# └────────────────────────────────────────┘
+
+# These steps implement a native coroutine, to be run with
+# Procedure_Context.procedure_run_async. They can still be run
+# by the blocking procedure_run: a new event loop is then created
+# for the step execution.
+
+class Step_Action_Async(Step_Action):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    # user-implemented
+    async def _impl(self, ctx, path_stack):
+        pass # pragma: no cover
+
+    def run(self, ctx, path_stack, errlist, values):
+        return asyncio.run(self.run_async(ctx, path_stack, errlist, values))
+
+    async def run_async(self, ctx, path_stack, errlist, values):
+        log     = logging.getLogger(self.path_str(path_stack))
+        r       = self._result_new()          # Default result is False
+
+        t_start = time.time()
+
+        try:
+            await self._impl(ctx, path_stack) # Run action implementation
+            r.result = True                   # No exception, action did go sucessfully
+
+        except Exception as e:
+            self._result_err(r, e, path_stack, errlist)
+
+            # Print traceback if unknown error
+            if not isinstance(e, Procedure_Error):
+                log.error(traceback.format_exc())
+        finally:
+            self._result_timing(r, t_start, time.time())
+
+        return r
+
+
+class Step_Measure_Async(Step_Measure):
+    def __init__(self,
+        constraint: Constraint_Object = None,
+        unit: str                     = "",
+        **kwargs
+    ):
+        super().__init__(constraint, unit, **kwargs)
+
+    # user-implemented
+    async def _measure(self, ctx, path_stack, values):
+        pass # pragma: no cover
+
+    def run(self, ctx, path_stack, errlist, values):
+        return asyncio.run(self.run_async(ctx, path_stack, errlist, values))
+
+    async def run_async(self, ctx, path_stack, errlist, values):
+        log     = logging.getLogger(self.path_str(path_stack))
+        r       = self._result_new()
+
+        t_start = time.time()
+
+        try:
+            self._result_value(r, await self._measure(ctx, path_stack, values), path_stack, values)
+
+        except Exception as e:
+            self._result_err(r, e, path_stack, errlist)
+
+            # Print traceback if uknown error
+            if not isinstance(e, Procedure_Error):
+                log.debug(traceback.format_exc())
+        finally:
+            self._result_timing(r, t_start, time.time())
+
+        return r
+
+
+class Step_Measure_Transform_Async(Step_Measure_Async):
+    def __init__(self,
+        value_from: str,
+        constraint: Constraint_Object = None,
+        unit: str = "",
+        **kwargs
+    ):
+
+        super().__init__(
+            constraint = constraint,
+            unit       = unit,
+            **kwargs
+        )
+
+        self.value_from = value_from
+
+    async def _measure(self, ctx, path_stack, values):
+        # Get value from ctx values
+        vv = values.get(self.value_from, path_stack)
+        return await self._transform(ctx, path_stack, vv)
+
+    async def _transform(self, ctx, path_stack, value):
+        """
+        Asynchronous version of Step_Measure_Transform._transform
+        """
+        # To be implemeted
+        return value
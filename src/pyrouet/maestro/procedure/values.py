@@ -0,0 +1,680 @@
+"""
+┌──────────────────────────────────────────────┐
+│ Procedure context values: saved values store │
+└──────────────────────────────────────────────┘
+
+ October 2026
+
+ Copyright (C) 2026, the Pyrouet project core team.
+
+ This program is free software; you can redistribute it and/or modify
+ it under the terms of the GNU General Public License as published by
+ the Free Software Foundation; either version 2 of the License, or
+ (at your option) any later version.
+
+ This program is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU General Public License for more details.
+
+ You should have received a copy of the GNU General Public License along
+ with this program; if not, write to the Free Software Foundation, Inc.,
+ 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import os
+import sys
+import pickle
+import weakref
+import tempfile
+
+from typing      import List, Dict
+from threading   import Lock
+from collections import OrderedDict
+
+from concurrent.futures import Future, Executor
+
+from multiprocessing.shared_memory import SharedMemory
+
+from pyrouet.maestro.procedure.plan import value_ref_resolve
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+
+# ┌────────────────────────────────────────┐
+# │ Shared buffers                         │
+# └────────────────────────────────────────┘
+
+def _buffer_size(v):
+    """
+    Returns the size in bytes of a buffer value (bytes-like object or
+    NumPy array), None for other values.
+    """
+
+    if (np is not None) and isinstance(v, np.ndarray):
+        return v.nbytes if (v.dtype != object) else None
+
+    elif isinstance(v, (bytes, bytearray)):
+        return len(v)
+
+    elif isinstance(v, memoryview):
+        return v.nbytes
+
+    return None
+
+
+class Value_Buffer:
+    """
+    Large buffer value copied once in a shared memory segment. Readers get
+    read-only views of the segment. Pickling only transfers the segment name,
+    so the worker processes of the host map the same data without copy.
+    """
+
+    def __init__(self, shm: SharedMemory, nbytes: int, shape=None, dtype=None, owner=False, segments=None):
+        self.shm      = shm
+        self.nbytes   = nbytes
+        self.shape    = shape    # NumPy array shape, None for bytes
+        self.dtype    = dtype    # NumPy dtype string, None for bytes
+        self.owner    = owner    # Segment is unlinked on release by its owner
+        self.segments = segments # Segments of the owning store, name → SharedMemory
+
+    @classmethod
+    def from_value(cls, v, segments: Dict[str, SharedMemory] = None):
+        """
+        Copies the value in a new segment, registered in segments
+        until released (see Procedure_Context_Values).
+        """
+
+        nbytes = _buffer_size(v)
+        shm    = SharedMemory(create=True, size=max(nbytes, 1))
+
+        if segments is not None:
+            segments[shm.name] = shm
+
+        if (np is not None) and isinstance(v, np.ndarray):
+            buf    = cls(shm, nbytes, v.shape, v.dtype.str, owner=True, segments=segments)
+            arr    = np.ndarray(v.shape, dtype=v.dtype, buffer=shm.buf)
+            arr[:] = v
+            del arr
+
+        else:
+            buf = cls(shm, nbytes, owner=True, segments=segments)
+            shm.buf[:nbytes] = v
+
+        return buf
+
+    @classmethod
+    def _attach(cls, name, nbytes, shape, dtype):
+        try:
+            shm = SharedMemory(name=name, track=False) # Python ≥ 3.13: owner is tracked
+        except TypeError:
+            shm = SharedMemory(name=name)
+
+        return cls(shm, nbytes, shape, dtype)
+
+    def __reduce__(self):
+        return (Value_Buffer._attach, (self.shm.name, self.nbytes, self.shape, self.dtype))
+
+    def view(self):
+        """
+        Returns a read-only view of the buffer: a NumPy array
+        for arrays, a memoryview for bytes.
+        """
+
+        if self.dtype is not None:
+            arr                 = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=self.shm.buf)
+            arr.flags.writeable = False
+            return arr
+
+        return self.shm.buf[:self.nbytes].toreadonly()
+
+    def export(self):
+        """
+        Returns a private copy of the buffer value
+        """
+
+        if self.dtype is not None:
+            return self.view().copy()
+
+        return bytes(self.shm.buf[:self.nbytes])
+
+    def release(self):
+        try:
+            self.shm.close()
+        except BufferError:
+            pass # Views still in use: mapping is released with them
+
+        if self.owner:
+            self.owner = False
+            self.shm.unlink()
+
+            if self.segments is not None:
+                self.segments.pop(self.shm.name, None)
+
+
+def _segments_unlink(segments):
+    """
+    Unlinks the segments left by a store dropped without clear
+    """
+
+    for shm in list(segments.values()):
+        try:
+            shm.close()
+        except BufferError:
+            pass # Views still in use
+
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    segments.clear()
+
+
+# ┌────────────────────────────────────────┐
+# │ Spilled values                         │
+# └────────────────────────────────────────┘
+
+def _value_size(v):
+    """
+    Returns the (estimated) resident size of a value in bytes
+    """
+
+    if isinstance(v, Value_Buffer):
+        return v.nbytes
+
+    size = _buffer_size(v)
+    return size if (size is not None) else sys.getsizeof(v)
+
+
+class Value_Spilled:
+    """
+    Value evicted from memory to a file of the spill directory
+    """
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+
+    def load(self):
+        with open(self.path, "rb") as fhandle:
+            return pickle.load(fhandle)
+
+    def release(self):
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+# ┌────────────────────────────────────────┐
+# │ Deferred values                        │
+# └────────────────────────────────────────┘
+
+class Value_Deferred:
+    """
+    Value computed on first access, then memoized. The producer is either a
+    callable without arguments, or a Future (computation already started in
+    the background).
+    """
+
+    def __init__(self, producer):
+        self.producer = producer
+        self.lock     = Lock()
+        self.done     = False
+        self.value    = None
+
+    def result(self):
+        with self.lock: # Computed once, even for concurrent readers
+            if not self.done:
+                if isinstance(self.producer, Future):
+                    self.value = self.producer.result()
+                else:
+                    self.value = self.producer()
+
+                self.done     = True
+                self.producer = None
+
+        return self.value
+
+
+# ┌────────────────────────────────────────┐
+# │ Procedure context values               │
+# └────────────────────────────────────────┘
+
+class Procedure_Context_Values:
+    """
+    Values saved by the steps, keyed by step path ("audio.record").
+
+    Path keys are interned, and relative references ("^") are resolved
+    once per subprocedure, so repeated lookups don't do any string work.
+    Each key is also indexed under all its parent subprocedures, for
+    prefix iteration and subtree clear.
+
+    Buffer values (bytes-like objects, NumPy arrays) of at least buffer_threshold
+    bytes are stored in shared memory (see Value_Buffer): get then returns
+    read-only views instead of the saved object.
+
+    With a memory_budget (in bytes), the resident values are tracked: the least
+    recently used ones are spilled to spill_dir (a temporary directory by default)
+    when the budget is exceeded, and transparently reloaded by get. Values whose
+    declared consumers (see consumers_declare) are all done are released.
+
+    Deferred values (see defer) are only computed when first read.
+    """
+
+    def __init__(self, buffer_threshold: int = None,
+                       memory_budget: int = None,
+                       spill_dir: str = None):
+        self.values           = dict() # path key → value
+        self.buffer_threshold = buffer_threshold
+        self.memory_budget    = memory_budget
+        self.spill_dir        = spill_dir
+
+        self._keys      = dict()        # tuple(path_stack) → path key
+        self._refs      = dict()        # (reference, subprocedure path) → path key
+        self._tree      = dict()        # subprocedure path key → set of path keys
+        self._lock      = Lock()
+
+        # Shared memory segments of the buffer values, unlinked
+        # when the store is garbage collected
+        self._segments  = dict()        # segment name → SharedMemory
+        weakref.finalize(self, _segments_unlink, self._segments)
+
+        # ──────────── Memory budget ───────────── #
+
+        self._lru       = OrderedDict() # path key → resident size, least recently used first
+        self._consumers = dict()        # path key → count of consumers not done yet
+        self._spill_n   = 0
+        self.stats      = self._stats_new()
+
+    # ──────────────── Path keys ───────────── #
+
+    def key(self, path_stack: List[str]) -> str:
+        """
+        Returns the interned key for a step path
+        """
+
+        path = tuple(path_stack)
+        key  = self._keys.get(path)
+
+        if key is None:
+            key = self._keys.setdefault(path, ".".join(path))
+
+        return key
+
+    def ref_resolve(self, key: str, path_stack: List[str]) -> str:
+        """
+        Resolves a value reference for the step at path_stack. A ^ in the key
+        string is replaced by the current subprocedure path, suffixed with a
+        separator (see get).
+        """
+
+        if "^" not in key:
+            return key
+
+        ref      = (key, tuple(path_stack[:-1]))
+        resolved = self._refs.get(ref)
+
+        if resolved is None:
+            resolved = self._refs.setdefault(ref, value_ref_resolve(key, ref[1]))
+
+        return resolved
+
+    # ────────────── Value access ──────────── #
+
+    def set(self, path_stack, v):
+        """
+        Sets a stored value.
+        """
+
+        self._store(self.key(path_stack), v)
+
+    def defer(self, path_stack, producer, *args, executor: Executor = None):
+        """
+        Sets a deferred value: producer(*args) is only called on the first get,
+        and its result is then stored as a regular value. With an executor, the
+        computation is started right away in the background. Steps can so publish
+        optional derived data (spectrum of a capture, etc.) without cost if unused.
+        """
+
+        if executor is not None:
+            producer = executor.submit(producer, *args)
+
+        elif args:
+            fn       = producer
+            producer = lambda: fn(*args)
+
+        self._store(self.key(path_stack), Value_Deferred(producer))
+
+    def _resolve(self, key, deferred):
+        v = deferred.result()
+
+        # Replace by the computed value, unless set again meanwhile
+        if self.values.get(key) is deferred:
+            self._store(key, v)
+
+        v = self.values.get(key, v)
+        return v if not isinstance(v, Value_Deferred) else v.result()
+
+    def _store(self, key, v):
+        if self.buffer_threshold is not None:
+            size = _buffer_size(v)
+            if (size is not None) and (size >= self.buffer_threshold):
+                v = Value_Buffer.from_value(v, self._segments)
+
+        old = self.values.get(key)
+        if old is None:
+            self._index(key)
+
+        self.values[key] = v
+
+        if self.memory_budget is not None:
+            with self._lock:
+                self._forget(key)
+                if not isinstance(v, Value_Deferred): # Not resident yet
+                    self._resident_add(key, v)
+
+        if isinstance(old, (Value_Buffer, Value_Spilled)):
+            old.release()
+
+    def get(self, key, path_stack):
+        """
+        Returns a stored value, returns KeyError if
+        not found.
+
+        A ^ in the key string is replaced by the
+        current subprocedure path, suffixed with a separator.
+        For example, if the current step has a path corresponding
+        to audio.test_actuatorL.measure_rms,
+        a ^ in the key string will be replaced
+        by "audio.test_actuatorL." (WITH A DOT!!!).
+        So the initialization options for the measure could look like:
+
+        ("measure_rms", Signal_RMS_Measure, {"from": "^record"})
+
+        That will be expanded to:
+
+        ("measure_rms", Signal_RMS_Measure, {"from": "audio.test_actuatorL.record"})
+
+        if at the root procedure, no dot is put.
+        """
+
+        return self._value(self.ref_resolve(key, path_stack))
+
+    def _value(self, key):
+        v = self.values[key]
+
+        if isinstance(v, Value_Deferred):
+            v = self._resolve(key, v)
+
+        if self.memory_budget is not None:
+            if isinstance(v, Value_Spilled):
+                v = self._reload(key, v)
+            else:
+                with self._lock:
+                    if key in self._lru:
+                        self._lru.move_to_end(key)
+
+        return v.view() if isinstance(v, Value_Buffer) else v
+
+    def export(self, key):
+        """
+        Returns a stored value by path key, with a private copy of
+        shared buffers (to be persisted, for example).
+        """
+
+        v = self.values[key]
+
+        if isinstance(v, Value_Deferred): # Computed to be persisted
+            v = self._resolve(key, v)
+
+        if isinstance(v, Value_Spilled):
+            return v.load()
+
+        return v.export() if isinstance(v, Value_Buffer) else v
+
+    def __contains__(self, key):
+        return key in self.values
+
+    # ─────────────── Subtrees ─────────────── #
+
+    def _index(self, key):
+        parts = key.split(".")
+
+        with self._lock:
+            for i in range(1, len(parts)):
+                self._tree.setdefault(".".join(parts[:i]), set()).add(key)
+
+    def keys(self, prefix: str = None):
+        """
+        Returns the keys of the values saved under the prefix subprocedure,
+        or all the keys if no prefix is given.
+        """
+
+        if not prefix:
+            return list(self.values.keys())
+
+        with self._lock:
+            keys = list(self._tree.get(prefix, ()))
+
+        return [key for key in keys if key in self.values]
+
+    def items(self, prefix: str = None):
+        """
+        Iterates over the (key, value) pairs saved under the prefix subprocedure
+        """
+
+        for key in self.keys(prefix):
+            try:
+                yield key, self._value(key)
+            except KeyError:
+                pass # Cleared meanwhile
+
+    def clear(self, prefix: str = None):
+        """
+        Clear the stored values, or only the values saved
+        under the prefix subprocedure.
+        """
+
+        if not prefix:
+            values      = self.values
+            self.values = dict()
+
+            with self._lock:
+                self._tree              = dict()
+                self._lru               = OrderedDict()
+                self.stats["resident"]  = 0
+
+            self._release(values.values())
+            return
+
+        keys = self.keys(prefix)
+
+        with self._lock:
+            for key in keys:
+                self._forget(key)
+
+        self._release([self.values.pop(key, None) for key in keys])
+
+    def _release(self, values):
+        for v in values:
+            if isinstance(v, (Value_Buffer, Value_Spilled)):
+                v.release()
+
+    # ───────────── Memory budget ──────────── #
+
+    @staticmethod
+    def _stats_new():
+        return {
+            "resident": 0, # Current resident size
+            "peak":     0, # Peak resident size
+            "spilled":  0, # Values spilled to disk
+            "reloaded": 0, # Values reloaded from disk
+            "released": 0  # Values released after their last consumer
+        }
+
+    def stats_clear(self):
+        """
+        Resets the statistics for a new run, the peak being the current resident size
+        """
+
+        with self._lock:
+            resident               = self.stats["resident"]
+            self.stats             = self._stats_new()
+            self.stats["resident"] = resident
+            self.stats["peak"]     = resident
+
+    def run_begin(self, consumers: Dict[str, int]):
+        """
+        Starts a new run: resets the statistics, and declares the consumers
+        of the values saved by the run.
+        """
+
+        self.stats_clear()
+        self.consumers_declare(consumers)
+
+    def consumers_declare(self, consumers: Dict[str, int]):
+        """
+        Declares the count of consumers of each value, by path key. A value
+        is released when all its consumers are done (see consume).
+        """
+
+        with self._lock:
+            self._consumers = dict(consumers)
+
+    def consume(self, key: str):
+        """
+        Signals that a consumer of the value is done
+        """
+
+        with self._lock:
+            count = self._consumers.get(key)
+            if count is None:
+                return
+
+            if count > 1:
+                self._consumers[key] = count - 1
+                return
+
+            del self._consumers[key]
+
+            v = self.values.pop(key, None)
+            self._forget(key)
+            self.stats["released"] += 1
+
+        if v is not None:
+            self._release([v])
+
+    def _resident_add(self, key, v):
+        """
+        Tracks a new resident value, and spills the least recently used
+        ones if the budget is exceeded. Lock must be held.
+        """
+
+        size                    = _value_size(v)
+        self._lru[key]          = size
+        self.stats["resident"] += size
+        self.stats["peak"]      = max(self.stats["peak"], self.stats["resident"])
+
+        while (self.stats["resident"] > self.memory_budget) and (len(self._lru) > 1):
+            lru_key = next(iter(self._lru))
+            if lru_key == key:
+                break
+
+            self._spill(lru_key)
+
+    def _forget(self, key):
+        """
+        Stops tracking a value. Lock must be held.
+        """
+
+        size = self._lru.pop(key, None)
+        if size is not None:
+            self.stats["resident"] -= size
+
+    def _spill(self, key):
+        """
+        Moves a resident value to the spill directory. Lock must be held.
+        """
+
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="pyrouet-values-")
+
+        v    = self.values[key]
+        path = os.path.join(self.spill_dir, f"value-{os.getpid()}-{id(self)}-{self._spill_n}.pkl")
+
+        self._spill_n += 1
+
+        with open(path, "wb") as fhandle:
+            pickle.dump(v.export() if isinstance(v, Value_Buffer) else v, fhandle)
+
+        size              = self._lru.pop(key)
+        self.values[key]  = Value_Spilled(path, size)
+
+        self.stats["resident"] -= size
+        self.stats["spilled"]  += 1
+
+        if isinstance(v, Value_Buffer):
+            v.release()
+
+    def _reload(self, key, spilled):
+        v = spilled.load()
+
+        with self._lock:
+            reloaded = self.values.get(key) is not spilled
+            if not reloaded:
+                self.stats["reloaded"] += 1
+
+        if reloaded:
+            return self._value(key) # Reloaded meanwhile
+
+        self._store(key, v)
+        return self.values[key]
+
+    def scope(self, path_stack: List[str]):
+        """
+        Returns a view of the values saved under a subprocedure
+        """
+
+        return Procedure_Context_Values_View(self, self.key(path_stack))
+
+
+# ┌────────────────────────────────────────┐
+# │ Scoped values view                     │
+# └────────────────────────────────────────┘
+
+class Procedure_Context_Values_View:
+    """
+    Values of a subprocedure, accessed by keys relative to it
+    """
+
+    def __init__(self, values: Procedure_Context_Values, prefix: str):
+        self.values  = values
+        self.prefix  = prefix
+        self._prefix = (prefix + ".") if prefix else ""
+
+    def get(self, key):
+        return self.values._value(self._prefix + key)
+
+    def set(self, key, v):
+        path = [self.prefix, key] if self.prefix else [key]
+        self.values.set(path, v)
+
+    def keys(self):
+        n = len(self._prefix)
+        return [key[n:] for key in self.values.keys(self.prefix)]
+
+    def items(self):
+        n = len(self._prefix)
+        for key, v in self.values.items(self.prefix):
+            yield key[n:], v
+
+    def clear(self):
+        self.values.clear(self.prefix)
+
+    def __contains__(self, key):
+        return (self._prefix + key) in self.values
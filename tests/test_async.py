@@ -0,0 +1,176 @@
+"""
+┌──────────────────────────────────┐
+│ Asynchronous procedure execution │
+└──────────────────────────────────┘
+
+ October 2026
+"""
+
+from pyrouet.maestro.procedure.ctx import Procedure_Context
+
+from pyrouet.maestro.procedure.step import (
+    Step_Action,
+    Step_Action_Async,
+    Step_Measure_Async,
+    Step_Measure_Transform_Async
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Above
+)
+
+from pyrouet.maestro.errors import (
+    Procedure_Error,
+    Procedure_Stop_Error,
+    Procedure_Constraint_Error
+)
+
+from dataclasses import asdict
+from pprint      import pprint
+
+import asyncio
+import time
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+class My_Async_Step(Step_Action_Async):
+    def __init__(self, msg, fail=False, delay=0, **kwargs):
+        super().__init__(**kwargs)
+
+        self.msg   = msg
+        self.fail  = fail
+        self.delay = delay
+
+    async def _impl(self, ctx, path_stack):
+        print("Msg : {}".format(self.msg))
+
+        if self.delay:
+            await asyncio.sleep(self.delay/1000)
+
+        if self.fail: raise Procedure_Error("I must fail!", path_stack)
+
+
+class My_Async_Measure(Step_Measure_Async):
+    def __init__(self, value, constraint, unit="", delay=0, **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+        self.delay = delay
+
+    async def _measure(self, ctx, path_stack, values):
+        if self.delay:
+            await asyncio.sleep(self.delay/1000)
+
+        return self.value
+
+
+class My_Async_Transform(Step_Measure_Transform_Async):
+    def __init__(self, value_from, constraint, unit = "", **kwargs):
+        super().__init__(value_from, constraint, unit, **kwargs)
+
+    async def _transform(self, ctx, path_stack, value):
+        return value+1
+
+
+class My_Sync_Step(Step_Action):
+    def __init__(self, delay=0, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+
+    def _impl(self, ctx, path_stack):
+        time.sleep(self.delay/1000)
+
+# ┌────────────────────────────────────────┐
+# │ Async procedure tests                  │
+# └────────────────────────────────────────┘
+
+def test_async_procedure():
+    proc = (
+        ("step",      My_Async_Step,      {"msg": "Hello world !", "store_duration": True}),
+        ("sync",      My_Sync_Step,       {"delay": 10}),
+        ("measure",   My_Async_Measure,   {"value": 2, "constraint": None, "save_value": True}),
+        ("transform", My_Async_Transform, {"value_from": "^measure", "constraint": Constraint_Above(3)})
+    )
+
+    ctx = Procedure_Context()
+
+    for i in range(2):
+        res, errlist = asyncio.run(ctx.procedure_run_async(proc))
+
+        pprint(asdict(res))
+
+        assert res.result == True
+        assert res.err is None
+        assert len(res.tests) == 4
+        assert res.tests[3].value == 3
+        assert res.tests[0].options["store_duration"] == True
+
+
+def test_async_same_results():
+    proc = (
+        ("step",    My_Async_Step,    {"msg": "Hello world !", "fail": True}),
+        ("measure", My_Async_Measure, {"value": -1.0, "constraint": Constraint_Above(ref_value=0.0)}),
+        ("sync",    My_Sync_Step,     {}),
+    )
+
+    ctx = Procedure_Context()
+
+    res_sync,  errlist_sync  = ctx.procedure_run(proc)
+    res_async, errlist_async = asyncio.run(ctx.procedure_run_async(proc))
+
+    assert res_sync.result == res_async.result == False
+    assert [r.result for r in res_sync.tests] == [r.result for r in res_async.tests]
+    assert str(res_async.tests[1].err) == str(res_sync.tests[1].err)
+    assert isinstance(res_async.tests[1].err, Procedure_Constraint_Error)
+    assert [p for p,e in errlist_sync] == [p for p,e in errlist_async]
+
+
+def test_async_parallel():
+    channel = ( ("test1", My_Async_Step,    {"msg": "Channel test 1", "delay": 200}),
+                ("test2", My_Async_Measure, {"value": 1, "constraint": None, "delay": 100}) )
+
+    proc    = ( ("channels", tuple( (f"ch{i}", channel) for i in range(16) ), {"parallel": True}), )
+
+    ctx     = Procedure_Context()
+
+    t_start      = time.time()
+    res, errlist = asyncio.run(ctx.procedure_run_async(proc))
+    t_end        = time.time()
+
+    assert res.result == True
+    assert (t_end - t_start) < 0.6 # Channels did run concurrently
+    assert [r.step_id for r in res.tests[0].tests] == [f"ch{i}" for i in range(16)]
+
+
+def test_async_critical():
+    slow = ( ("test1", My_Async_Step, {"msg": "Slow 1", "delay": 200}),
+             ("test2", My_Async_Step, {"msg": "Slow 2"}) )
+
+    fast = ( ("test1", My_Async_Step, {"msg": "Fast 1", "fail": True, "critical": True}), )
+
+    proc = ( ("channels", ( ("slow", slow),
+                            ("fast", fast) ), {"parallel": True}),
+             ("after", My_Async_Step, {"msg": "After"}) )
+
+    ctx = Procedure_Context()
+
+    res, errlist = asyncio.run(ctx.procedure_run_async(proc))
+
+    assert res.result == False
+    assert isinstance(res.err, Procedure_Stop_Error)
+    assert len(res.tests) == 1
+    assert len(res.tests[0].tests[0].tests) == 1 # Slow sibling was stopped
+
+
+def test_async_step_in_sync_procedure():
+    proc = (
+        ("step",    My_Async_Step,    {"msg": "Hello world !"}),
+        ("measure", My_Async_Measure, {"value": 2, "constraint": Constraint_Above(1)}),
+    )
+
+    ctx          = Procedure_Context()
+    res, errlist = ctx.procedure_run(proc)
+
+    assert res.result == True
+    assert res.tests[1].value == 2
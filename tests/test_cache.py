@@ -0,0 +1,154 @@
+"""
+┌─────────────────────────┐
+│ Step result cache tests │
+└─────────────────────────┘
+
+ October 2026
+"""
+
+from pyrouet.maestro.procedure.ctx   import Procedure_Context
+from pyrouet.maestro.procedure.cache import Procedure_Result_Cache
+
+from pyrouet.maestro.procedure.step import (
+    Step_Action,
+    Step_Measure,
+    Step_Measure_Transform
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Above,
+    Constraint_Below
+)
+
+from pyrouet.maestro.errors import (
+    Procedure_Error
+)
+
+from collections import Counter
+from pprint      import pprint
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+RUNS = Counter()
+
+class Counted_Step(Step_Action):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def _impl(self, ctx, path_stack):
+        RUNS[".".join(path_stack)] += 1
+
+        if path_stack[-1] in ctx.params.get("fail", tuple()):
+            raise Procedure_Error("Final test failed", path_stack)
+
+
+class Counted_Measure(Step_Measure):
+    def __init__(self, value, constraint, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+
+    def _measure(self, ctx, path_stack, values):
+        RUNS[".".join(path_stack)] += 1
+        return self.value
+
+
+class Counted_Transform(Step_Measure_Transform):
+    def __init__(self, value_from, constraint, unit = "", **kwargs):
+        super().__init__(value_from, constraint, unit, **kwargs)
+
+    def _transform(self, ctx, path_stack, value):
+        RUNS[".".join(path_stack)] += 1
+        return value*2
+
+
+def make_proc(limit=10.0):
+    return (
+        ("flash",     Counted_Step,      {}),
+        ("power",     Counted_Step,      {"phony": True}),
+        ("calib",     ( ("offset",    Counted_Measure,   {"value": 1.5, "constraint": Constraint_Below(limit), "save_value": True}),
+                        ("corrected", Counted_Transform, {"value_from": "^offset", "constraint": Constraint_Above(3.0)}) )),
+        ("final",     Counted_Step,      {}),
+    )
+
+# ┌────────────────────────────────────────┐
+# │ Result cache tests                     │
+# └────────────────────────────────────────┘
+
+def test_result_cache(tmp_path):
+    RUNS.clear()
+    cache = Procedure_Result_Cache(str(tmp_path / "cache"), dut_id="SN0001", version="1.0")
+    proc  = make_proc()
+
+    # First run: final step fails
+    ctx          = Procedure_Context(params={"fail": ("final",)}, result_cache=cache)
+    res, errlist = ctx.procedure_run(proc)
+    assert res.result == False
+    assert RUNS["final"] == 1
+
+    # Re-test: only phony and previously failed steps are executed
+    ctx          = Procedure_Context(params={"fail": tuple()}, result_cache=cache)
+    res, errlist = ctx.procedure_run(proc)
+
+    pprint(res)
+
+    assert res.result == True
+    assert RUNS == Counter({"flash": 1, "power": 2, "calib.offset": 1, "calib.corrected": 1, "final": 2})
+
+    # Restored results are the recorded ones
+    assert res.tests[0].options["cached"] == True
+    assert res.tests[2].tests[1].value    == 3.0
+    assert res.tests[2].tests[1].step_id  == "corrected"
+    assert "cached" not in res.tests[1].options
+
+    cache.close()
+
+
+def test_result_cache_restores_values(tmp_path):
+    RUNS.clear()
+    cache = Procedure_Result_Cache(str(tmp_path / "cache"), dut_id="SN0001", version="1.0")
+
+    ctx   = Procedure_Context(result_cache=cache)
+    ctx.procedure_run(make_proc())
+
+    # The transform is not cached anymore, and reads the restored value
+    cache.invalidate(["calib", "corrected"])
+    res, errlist = ctx.procedure_run(make_proc())
+
+    assert res.result == True
+    assert RUNS["calib.offset"]    == 1
+    assert RUNS["calib.corrected"] == 2
+
+    cache.close()
+
+
+def test_result_cache_invalidation(tmp_path):
+    RUNS.clear()
+    cache = Procedure_Result_Cache(str(tmp_path / "cache"), dut_id="SN0001", version="1.0", fingerprint={"firmware": "1.2.0"})
+    ctx   = Procedure_Context(result_cache=cache)
+    ctx.procedure_run(make_proc())
+    cache.close()
+
+    # Limits changed → measure is executed again
+    cache = Procedure_Result_Cache(str(tmp_path / "cache"), dut_id="SN0001", version="1.0", fingerprint={"firmware": "1.2.0"})
+    ctx   = Procedure_Context(result_cache=cache)
+    ctx.procedure_run(make_proc(limit=5.0))
+    assert RUNS["flash"] == 1
+    assert RUNS["calib.offset"] == 2
+    cache.close()
+
+    # Firmware changed → everything is executed again
+    cache = Procedure_Result_Cache(str(tmp_path / "cache"), dut_id="SN0001", version="1.0", fingerprint={"firmware": "1.3.0"})
+    ctx   = Procedure_Context(result_cache=cache)
+    ctx.procedure_run(make_proc(limit=5.0))
+    assert RUNS["flash"] == 2
+    assert RUNS["calib.offset"] == 3
+    cache.close()
+
+    # Other DUT → nothing cached
+    cache = Procedure_Result_Cache(str(tmp_path / "cache"), dut_id="SN0002", version="1.0", fingerprint={"firmware": "1.3.0"})
+    ctx   = Procedure_Context(result_cache=cache)
+    ctx.procedure_run(make_proc(limit=5.0))
+    assert RUNS["flash"] == 3
+    cache.close()
@@ -0,0 +1,178 @@
+"""
+┌──────────────────────────────────┐
+│ Checkpoint and resume tests      │
+└──────────────────────────────────┘
+
+ October 2026
+"""
+
+from pyrouet.maestro.procedure.ctx        import Procedure_Context
+from pyrouet.maestro.procedure.plan       import Procedure_Plan
+from pyrouet.maestro.procedure.checkpoint import Procedure_Checkpoint
+
+from pyrouet.maestro.procedure.step import (
+    Step_Action,
+    Step_Measure,
+    Step_Measure_Transform
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Above
+)
+
+from pyrouet.maestro.errors import (
+    Procedure_Error
+)
+
+from collections import Counter
+from pprint      import pprint
+from threading   import Event, Timer
+
+import pytest
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+RUNS = Counter()
+
+class Bench_Crash(KeyboardInterrupt):
+    pass
+
+
+class Burn_Step(Step_Action):
+    def __init__(self, fail=False, **kwargs):
+        super().__init__(**kwargs)
+        self.fail = fail
+
+    def _impl(self, ctx, path_stack):
+        if path_stack[-1] == ctx.params.get("crash_at", None):
+            raise Bench_Crash() # Not caught by the procedure
+
+        RUNS[".".join(path_stack)] += 1
+
+        if self.fail:
+            raise Procedure_Error("Burn-in failed", path_stack)
+
+
+class Blocking_Step(Step_Action):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.release = Event()
+
+    def _impl(self, ctx, path_stack):
+        RUNS[".".join(path_stack)] += 1
+        self.release.wait(ctx.params.get("block", 0))
+
+    def abort(self):
+        self.release.set()
+
+
+class Capture_Measure(Step_Measure):
+    def __init__(self, value, constraint, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+
+    def _measure(self, ctx, path_stack, values):
+        RUNS[".".join(path_stack)] += 1
+        return self.value
+
+
+class Double_Transform(Step_Measure_Transform):
+    def __init__(self, value_from, constraint, unit = "", **kwargs):
+        super().__init__(value_from, constraint, unit, **kwargs)
+
+    def _transform(self, ctx, path_stack, value):
+        return value*2
+
+
+PROC = (
+    ("burn", ( ("cycle1", Burn_Step, {}),
+               ("cycle2", Burn_Step, {"fail": True}),
+               ("cycle3", Burn_Step, {}) )),
+    ("capture",  Capture_Measure,  {"value": 2, "constraint": None, "save_value": True}),
+    ("final",    Burn_Step,        {}),
+    ("double",   Double_Transform, {"value_from": "^capture", "constraint": Constraint_Above(4)}),
+)
+
+# ┌────────────────────────────────────────┐
+# │ Checkpoint tests                       │
+# └────────────────────────────────────────┘
+
+@pytest.mark.parametrize("interval", [0, 3600])
+@pytest.mark.parametrize("use_plan", [False, True])
+def test_checkpoint_resume(tmp_path, interval, use_plan):
+    RUNS.clear()
+    proc       = Procedure_Plan(PROC) if use_plan else PROC
+    run        = (lambda ctx: ctx.plan_run(proc)) if use_plan else (lambda ctx: ctx.procedure_run(proc))
+
+    checkpoint = Procedure_Checkpoint(str(tmp_path / "run.ckpt"), interval=interval)
+
+    # Interrupted run
+    ctx        = Procedure_Context(params={"crash_at": "final"}, checkpoint=checkpoint)
+    with pytest.raises(Bench_Crash):
+        run(ctx)
+
+    assert sum(RUNS.values()) == 4
+
+    # Resumed run, with a fresh context
+    checkpoint   = Procedure_Checkpoint(str(tmp_path / "run.ckpt"))
+    ctx          = Procedure_Context(checkpoint=checkpoint)
+    res, errlist = ctx.procedure_resume(proc)
+
+    pprint(res)
+
+    assert RUNS == Counter({"burn.cycle1": 1, "burn.cycle2": 1, "burn.cycle3": 1, "capture": 1, "final": 1})
+
+    # Results, values and errors were restored
+    assert res.result == False
+    assert [r.step_id for r in res.tests]          == ["burn", "capture", "final", "double"]
+    assert [r.result  for r in res.tests[0].tests] == [True, False, True]
+    assert res.tests[3].value == 4
+    assert [p for p,e in errlist] == [("burn", "cycle2")]
+    assert str(res.tests[0].tests[1].err) == "Burn-in failed"
+    assert res.tests[0].tests[0].options["restored"] == True
+    assert "restored" not in res.tests[2].options
+
+    # A new run starts from scratch
+    res, errlist = run(ctx)
+    assert RUNS["burn.cycle1"] == 2
+
+
+def test_checkpoint_nothing_to_resume(tmp_path):
+    ctx = Procedure_Context()
+    with pytest.raises(ValueError):
+        ctx.procedure_resume(PROC)
+
+    # Missing checkpoint file → Everything is executed
+    RUNS.clear()
+    ctx          = Procedure_Context(checkpoint=Procedure_Checkpoint(str(tmp_path / "missing.ckpt")))
+    res, errlist = ctx.procedure_resume(PROC)
+
+    assert RUNS["final"] == 1
+
+
+def test_checkpoint_resume_aborted(tmp_path):
+    RUNS.clear()
+    proc = (
+        ("prepare", Burn_Step,     {}),
+        ("burnin",  Blocking_Step, {}),
+        ("final",   Burn_Step,     {}),
+    )
+
+    # Operator abort during the burn-in
+    ctx   = Procedure_Context(params={"block": 5}, checkpoint=Procedure_Checkpoint(str(tmp_path / "run.ckpt")))
+    timer = Timer(0.2, ctx.abort)
+    timer.start()
+
+    res, errlist = ctx.procedure_run(proc)
+    assert res.result == False
+    assert RUNS == Counter({"prepare": 1, "burnin": 1})
+
+    # The aborted step is run again on resume
+    ctx          = Procedure_Context(checkpoint=Procedure_Checkpoint(str(tmp_path / "run.ckpt")))
+    res, errlist = ctx.procedure_resume(proc)
+
+    assert res.result == True
+    assert RUNS == Counter({"prepare": 1, "burnin": 2, "final": 1})
+    assert res.tests[0].options["restored"] == True
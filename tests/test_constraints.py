@@ -18,9 +18,18 @@ from pyrouet.maestro.constraints import (
     Constraint_Below,
     Constraint_Above,
     Constraint_Tolerance,
-    Constraint_Range
+    Constraint_Range,
+
+    Constraint_Array_Range,
+    Constraint_Envelope,
+    Constraint_Mask
 )
 
+import pytest
+
+from dataclasses import FrozenInstanceError
+
+
 def test_constraint_none():
     cnstr_none = Constraint_None()
 
@@ -80,3 +89,68 @@ def test_constraint_description():
     assert cnstr_desc.options["ref_max"] == 3.0
 
 
+def test_constraint_description_cached():
+    cnstr_range = Constraint_Range(ref_min=2.0, ref_max=3.0)
+    cnstr_desc  = cnstr_range.description_get()
+
+    assert Constraint_Description.from_constraint(cnstr_range) is cnstr_desc
+    assert Constraint_Range(ref_min=2.0, ref_max=3.0).description_get() is cnstr_desc # Shared
+
+    # Invalidated on mutation
+    cnstr_range.ref_max = 4.0
+    assert cnstr_range.description_get().options["ref_max"] == 4.0
+    assert cnstr_desc.options["ref_max"]                    == 3.0
+
+    with pytest.raises(FrozenInstanceError):
+        cnstr_desc.constraint_class = "other"
+
+
+
+
+def test_constraint_array_range():
+    np    = pytest.importorskip("numpy")
+    cnstr = Constraint_Array_Range(ref_min=0.0, ref_max=np.linspace(1.0, 2.0, 100))
+
+    assert     cnstr.validate(np.full(100, 0.5))
+    assert not cnstr.validate(np.full(100, 1.5))
+
+    passed, details = cnstr.validate_report(np.full(100, 1.5))
+    assert not passed
+    assert details["failed_count"]   == 50
+    assert details["failed_indices"] == list(range(32)) # Truncated
+    assert details["worst_index"]    == 0
+    assert details["worst_margin"]   == pytest.approx(-0.5)
+
+    # Limit curve is summarized in description
+    desc = Constraint_Description.from_constraint(cnstr)
+    assert desc.options["ref_min"]         == 0.0
+    assert desc.options["ref_max"]["size"] == 100
+    assert desc.options["ref_max"]["max"]  == 2.0
+
+
+def test_constraint_envelope():
+    pytest.importorskip("numpy")
+    cnstr = Constraint_Envelope(ref_value=[1.0, 2.0, 4.0], tolerance=0.1, tolerance_pcent=10)
+
+    assert     cnstr.validate([1.15, 1.75, 4.4])
+    assert not cnstr.validate([1.25, 2.0,  4.0])
+
+
+def test_constraint_mask():
+    np    = pytest.importorskip("numpy")
+    cnstr = Constraint_Mask(upper=[(0, -10.0), (1000, -10.0), (2000, -40.0)],
+                            lower=[(0, -100.0), (4000, -100.0)],
+                            x_step=10.0)
+
+    spectrum = np.full(400, -50.0)
+    assert cnstr.validate(spectrum)
+
+    spectrum[150] = -20.0 # 1500 Hz, mask at -25 dB
+    passed, details = cnstr.validate_report(spectrum)
+
+    assert not passed
+    assert details["failed_indices"] == [150]
+    assert details["worst_margin"]   == pytest.approx(-5.0)
+
+    desc = Constraint_Description.from_constraint(cnstr)
+    assert desc.options["upper"] == ((0, -10.0), (1000, -10.0), (2000, -40.0)) # Read-only
@@ -8,6 +8,7 @@
 """
 
 from pyrouet.maestro.procedure.ctx import Procedure_Context
+from pyrouet.maestro.procedure.values import Procedure_Context_Values
 from pyrouet.maestro.errors import ( Procedure_Error,
     Procedure_Abort_Error,
     Procedure_Stop_Error,
@@ -25,8 +26,13 @@ from pyrouet.maestro.constraints import (
     Constraint_Boolean
 )
 
+import gc
 import logging
-from threading import Event
+import pickle
+import pytest
+from threading import Event, Barrier
+from multiprocessing.shared_memory import SharedMemory
+from concurrent.futures import ThreadPoolExecutor
 
 from pprint import pprint
 
@@ -92,6 +98,176 @@ def test_values_clear():
 
     assert res.result == True
 
+
+def test_values_subtree():
+    values = Procedure_Context_Values()
+
+    values.set(["audio", "left", "record"], 1)
+    values.set(["audio", "left", "rms"], 2)
+    values.set(["audio", "right", "record"], 3)
+    values.set(["flash"], 4)
+
+    assert values.get("^record", ["audio", "left", "rms"]) == 1
+    assert values.get("^record", ["audio", "right", "rms"]) == 3
+    assert values.get("flash", ["audio", "left", "rms"]) == 4
+    assert values.key(["audio", "left", "rms"]) is values.key(["audio", "left", "rms"]) # Interned
+
+    assert sorted(values.keys("audio")) == ["audio.left.record", "audio.left.rms", "audio.right.record"]
+    assert dict(values.items("audio.left")) == {"audio.left.record": 1, "audio.left.rms": 2}
+
+    left = values.scope(["audio", "left"])
+    assert left.get("rms") == 2
+    left.set("peak", 5)
+    assert values.get("audio.left.peak", []) == 5
+    assert sorted(left.keys()) == ["peak", "record", "rms"]
+
+    left.clear()
+    assert sorted(values.values.keys()) == ["audio.right.record", "flash"]
+
+    values.clear()
+    assert not values.values
+    assert values.keys("audio") == []
+
+
+def test_values_buffers():
+    values = Procedure_Context_Values(buffer_threshold=1024)
+
+    values.set(["capture"], bytes(range(256))*16)
+    values.set(["small"], b"small")
+
+    view = values.get("^capture", ["transform"])
+    assert isinstance(view, memoryview) and view.readonly
+    assert view[:4].tobytes() == bytes([0, 1, 2, 3])
+    assert values.get("small", []) == b"small"
+
+    # Only the segment name is pickled
+    buf = pickle.loads(pickle.dumps(values.values["capture"]))
+    assert len(pickle.dumps(values.values["capture"])) < 1024
+    assert buf.view()[255] == 255
+    assert values.export("capture") == bytes(range(256))*16
+
+    del view
+    buf.release()
+    values.clear()
+
+
+def test_values_buffers_dropped():
+    values = Procedure_Context_Values(buffer_threshold=1024)
+    values.set(["capture"], bytes(4096))
+
+    name = values.values["capture"].shm.name
+
+    # Store dropped without clear: its segments are unlinked
+    del values
+    gc.collect()
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
+
+
+def test_values_buffers_numpy():
+    np     = pytest.importorskip("numpy")
+    values = Procedure_Context_Values(buffer_threshold=1024)
+
+    values.set(["capture"], np.arange(4096, dtype=np.float32))
+
+    arr = values.get("capture", [])
+    assert arr[100] == 100.0
+    with pytest.raises(ValueError):
+        arr[0] = 1.0 # Read-only view
+
+    del arr
+    values.clear()
+
+
+def test_values_spill(tmp_path):
+    values = Procedure_Context_Values(memory_budget=2500, spill_dir=str(tmp_path))
+
+    for i in range(4):
+        values.set([f"capture{i}"], bytes([i])*1000)
+
+    assert values.stats["spilled"]  == 2
+    assert values.stats["resident"] <= 2500
+    assert values.stats["peak"]     == 3000
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # Spilled values are reloaded on get
+    assert values.get("capture0", []) == bytes([0])*1000
+    assert values.stats["reloaded"] == 1
+    assert values.export("capture1") == bytes([1])*1000
+
+    # Scoped views reload spilled values too
+    values.set(["sub", "capture"], bytes([9])*1000)
+    values.set(["sub", "other0"],  bytes([0])*1000)
+    values.set(["sub", "other1"],  bytes([1])*1000)
+
+    reloaded = values.stats["reloaded"]
+    assert values.scope(["sub"]).get("capture") == bytes([9])*1000
+    assert values.stats["reloaded"] == reloaded + 1
+
+    values.clear()
+    assert values.stats["resident"] == 0
+    assert not list(tmp_path.iterdir())
+
+
+def test_values_consumers_release():
+    class Test_Measure(Step_Measure):
+        def __init__(self, value, constraint, unit="", **kwargs):
+            super().__init__(constraint, unit, **kwargs)
+            self.value = value
+
+        def _measure(self, ctx, path_stack, values):
+            return self.value
+
+    class Test_Transform(Step_Measure_Transform):
+        def __init__(self, value_from, constraint, unit="", **kwargs):
+            super().__init__(value_from, constraint, unit, **kwargs)
+
+    proc = (
+        ("audio", (
+            ("capture", Test_Measure,   {"value": 1.0, "save_value": True, "constraint": None}),
+            ("rms",     Test_Transform, {"value_from": "^capture", "constraint": None}),
+            ("peak",    Test_Transform, {"value_from": "audio.capture", "constraint": None}),
+        )),
+        ("kept", Test_Measure, {"value": 2.0, "save_value": True, "constraint": None}),
+    )
+
+    ctx          = Procedure_Context()
+    values       = Procedure_Context_Values(memory_budget=1 << 20)
+    res, errlist = ctx.procedure_run(proc, values=values)
+
+    assert res.result == True
+    assert list(values.values.keys()) == ["kept"] # Released after its last consumer
+    assert values.stats["released"] == 1
+
+
+def test_values_deferred():
+    calls  = list()
+    values = Procedure_Context_Values()
+
+    def spectrum(capture):
+        calls.append(capture)
+        return [2*x for x in capture]
+
+    values.set(["capture"], [1, 2, 3])
+    values.defer(["capture", "spectrum"], spectrum, [1, 2, 3])
+    values.defer(["capture", "unused"], spectrum, [4, 5, 6])
+
+    assert not calls # Nothing computed yet
+    assert values.get("^spectrum", ["capture", "rms"]) == [2, 4, 6]
+    assert values.get("capture.spectrum", []) == [2, 4, 6]
+    assert calls == [[1, 2, 3]] # Computed once
+
+    # Scoped views compute deferred values too
+    values.defer(["sub", "d"], spectrum, [3])
+    assert values.scope(["sub"]).get("d") == [6]
+    assert calls[-1] == [3]
+
+    # Background computation
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        values.defer(["capture", "background"], spectrum, [7], executor=executor)
+        assert values.get("capture.background", []) == [14]
+
 # ┌────────────────────────────────────────┐
 # │ Tests around callbacks                 │
 # └────────────────────────────────────────┘
@@ -210,3 +386,121 @@ def test_procedure_enter_leave_callbacks():
     assert second_enter_callback_ok.is_set() 
     assert leave_callback_ok.is_set()        
     assert second_leave_callback_ok.is_set() 
+
+# ┌────────────────────────────────────────┐
+# │ Tests around step instances reuse      │
+# └────────────────────────────────────────┘
+
+def test_step_reuse():
+    class Counted_Action(Step_Action):
+        built    = 0
+        resets   = 0
+        teardown_count = 0
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            Counted_Action.built += 1
+            self.port_open = True # Some expensive resource
+
+        def _impl(self, ctx, path_stack):
+            assert self.port_open
+
+        def reset(self):
+            Counted_Action.resets += 1
+
+        def teardown(self):
+            Counted_Action.teardown_count += 1
+            self.port_open = False
+
+    sub  = ( ("reused", Counted_Action, {"reusable": True}), )
+    proc = ( ("reused", Counted_Action, {"reusable": True}),
+             ("fresh",  Counted_Action, {}),
+             ("sub1",   sub),
+             ("sub2",   sub) )
+
+    ctx  = Procedure_Context()
+
+    for i in range(3):
+        res, errlist = ctx.procedure_run(proc)
+        assert res.result == True
+
+    # 3 reusable instances built once (keyed by path), 1 built at each run
+    assert Counted_Action.built  == 3 + 3
+    assert Counted_Action.resets == 3 * 2
+
+    ctx.teardown()
+    assert Counted_Action.teardown_count == 3
+
+    # Instances are built again after teardown
+    res, errlist = ctx.procedure_run(proc)
+    assert Counted_Action.built  == 3 + 3 + 4
+
+
+def test_step_reuse_rebuilt_procedure():
+    class Counted_Port(Step_Action):
+        built          = 0
+        teardown_count = 0
+
+        def __init__(self, port="COM1", **kwargs):
+            super().__init__(**kwargs)
+            Counted_Port.built += 1
+            self.port = port
+
+        def _impl(self, ctx, path_stack):
+            pass
+
+        def teardown(self):
+            Counted_Port.teardown_count += 1
+
+    def make_proc(port="COM1"):
+        return ( ("port", Counted_Port, {"reusable": True, "port": port}), )
+
+    ctx = Procedure_Context()
+
+    # Procedure tuple built again at each run
+    for i in range(50):
+        res, errlist = ctx.procedure_run(make_proc())
+        assert res.result == True
+
+    assert Counted_Port.built          == 1
+    assert Counted_Port.teardown_count == 0
+
+    # Other arguments: the kept instance is replaced
+    ctx.procedure_run(make_proc("COM2"))
+    assert Counted_Port.built          == 2
+    assert Counted_Port.teardown_count == 1
+
+    ctx.teardown()
+    assert Counted_Port.teardown_count == 2
+
+
+def test_step_reuse_concurrent():
+    class Counted_Session(Step_Action):
+        built          = 0
+        teardown_count = 0
+        barrier        = Barrier(2, timeout=5)
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            Counted_Session.built += 1
+
+        def _impl(self, ctx, path_stack):
+            Counted_Session.barrier.wait() # Both runs use the step at once
+
+        def teardown(self):
+            Counted_Session.teardown_count += 1
+
+    proc = ( ("session", Counted_Session, {"reusable": True}), )
+    ctx  = Procedure_Context()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(lambda i: ctx.procedure_run(proc)[0], range(2)))
+
+    assert all(res.result for res in results)
+
+    # Extra instance of the concurrent run torn down after it
+    assert Counted_Session.built          == 2
+    assert Counted_Session.teardown_count == 1
+
+    ctx.teardown()
+    assert Counted_Session.teardown_count == 2
@@ -0,0 +1,144 @@
+"""
+┌─────────────────────────┐
+│ Procedure history tests │
+└─────────────────────────┘
+
+ October 2026
+"""
+
+import os
+
+from pyrouet.maestro.procedure.ctx     import Procedure_Context
+from pyrouet.maestro.procedure.history import Procedure_History
+from pyrouet.maestro.procedure.cache   import Procedure_Result_Cache
+from pyrouet.maestro.procedure.plan    import Procedure_Plan
+
+from pyrouet.maestro.procedure.step import (
+    Step_Measure
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Above
+)
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+class My_Measure(Step_Measure):
+    def __init__(self, value, constraint, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+
+    def _measure(self, ctx, path_stack, values):
+        return self.value
+
+
+def _proc(value_cheap=1, after=None):
+    return (
+        ("checks", (
+            ("slow",  My_Measure, {"value": 1, "constraint": Constraint_Above(0), "save_value": True}),
+            ("uses",  My_Measure, {"value": 1, "constraint": Constraint_Above(0),
+                                   "value_from": "^slow"}),
+            ("cheap", My_Measure, {"value": value_cheap, "constraint": Constraint_Above(0)}),
+        ), {"reorderable": True}),
+    )
+
+def _history():
+    hist = Procedure_History()
+
+    for i in range(8):
+        hist.record("checks.slow",  True,      2.0)
+        hist.record("checks.uses",  True,      1.0)
+        hist.record("checks.cheap", (i%2)==0,  0.1)
+
+    return hist
+
+# ┌────────────────────────────────────────┐
+# │ History tests                          │
+# └────────────────────────────────────────┘
+
+def test_history_record(tmp_path):
+    path = os.path.join(tmp_path, "history.json")
+    hist = Procedure_History(path)
+    ctx  = Procedure_Context(history=hist)
+
+    ctx.procedure_run(_proc(value_cheap=-1))
+    ctx.procedure_run(_proc())
+
+    assert hist.stats["checks.cheap"]["runs"]  == 2
+    assert hist.stats["checks.cheap"]["fails"] == 1
+    assert hist.stats["checks.slow"]["fails"]  == 0
+    assert hist.stats["checks"]["fails"]       == 1
+    assert "" not in hist.stats                                    # Root not recorded
+
+    assert hist.fail_rate("checks.cheap") == 0.5
+    assert hist.fail_rate("checks.slow")  == 0.25
+    assert hist.fail_rate("unknown")      == 0.5
+
+    hist.save()
+    assert Procedure_History(path).stats == hist.stats
+
+
+def test_history_order():
+    hist  = _history()
+    proc  = _proc()[0][1]
+
+    order = [entry[0] for entry in hist.order(proc, ["checks"])]
+    assert order == ["cheap", "slow", "uses"]
+
+    # The dependent step is never moved before its source
+    hist.record("checks.uses", False, 0.0)
+    hist.stats["checks.uses"]["duration"] = 0.0
+
+    order = [entry[0] for entry in hist.order(proc, ["checks"])]
+    assert order.index("slow") < order.index("uses")
+
+
+def test_history_reorderable_run():
+    ctx          = Procedure_Context(history=_history())
+    res, errlist = ctx.procedure_run(_proc())
+
+    assert [r.step_id for r in res.tests[0].tests] == ["cheap", "slow", "uses"]
+    assert res.tests[0].result
+
+    # Authored order without the option
+    proc         = ((_proc()[0][0], _proc()[0][1], {}),)
+    res, errlist = ctx.procedure_run(proc)
+
+    assert [r.step_id for r in res.tests[0].tests] == ["slow", "uses", "cheap"]
+
+
+def test_history_reorderable_plan_run():
+    plan         = Procedure_Plan(_proc())
+
+    ctx          = Procedure_Context(history=_history())
+    res, errlist = ctx.plan_run(plan)
+
+    assert [r.step_id for r in res.tests[0].tests] == ["cheap", "slow", "uses"]
+    assert res.tests[0].result
+
+    # Same results as procedure_run
+    res_proc, errlist = ctx.procedure_run(_proc())
+    assert [r.step_id for r in res_proc.tests[0].tests] == ["cheap", "slow", "uses"]
+
+    # Authored order without history
+    res, errlist = Procedure_Context().plan_run(plan)
+    assert [r.step_id for r in res.tests[0].tests] == ["slow", "uses", "cheap"]
+
+
+def test_history_restored_not_recorded(tmp_path):
+    hist  = Procedure_History()
+    cache = Procedure_Result_Cache(str(tmp_path / "cache"), dut_id="SN0001", version="1.0")
+
+    for i in range(3):
+        ctx = Procedure_Context(result_cache=cache, history=hist)
+        res, errlist = ctx.procedure_run(_proc())
+        assert res.result
+
+    # Run once, then restored from the result cache
+    assert res.tests[0].tests[0].options["cached"] == True
+    assert hist.stats["checks.slow"]["runs"] == 1
+    assert hist.stats["checks"]["runs"]      == 1
+
+    cache.close()
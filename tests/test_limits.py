@@ -0,0 +1,119 @@
+"""
+┌────────────────────┐
+│ Limit tables tests │
+└────────────────────┘
+
+ October 2026
+"""
+
+from pyrouet.maestro.procedure.ctx  import Procedure_Context
+from pyrouet.maestro.procedure.plan import Procedure_Plan
+
+from pyrouet.maestro.procedure.step import (
+    Step_Measure
+)
+
+from pyrouet.maestro.constraints import (
+    Limit_Table,
+    Constraint_Above,
+    Constraint_Range
+)
+
+import pytest
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+class My_Measure(Step_Measure):
+    def __init__(self, value, constraint=None, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+
+    def _measure(self, ctx, path_stack, values):
+        return self.value
+
+
+LIMITS_CSV = """path,constraint,ref_value,ref_min,ref_max,tolerance_pcent,unit
+supply.vcc,tolerance,3.3,,,5,V
+supply.icc,below,0.1,,,,A
+audio.rms,range,,0.2,0.4,,V
+audio.snr,above,60,,,,dB
+"""
+
+LIMITS_TOML = """
+[[limits]]
+path       = "supply.vcc"
+constraint = "tolerance"
+ref_value  = 3.3
+tolerance_pcent = 5
+unit       = "V"
+
+[[limits]]
+path       = "audio.rms"
+constraint = "range"
+ref_min    = 0.2
+ref_max    = 0.4
+"""
+
+PROC = (
+    ("supply", ( ("vcc", My_Measure, {"value": 3.31}),
+                 ("icc", My_Measure, {"value": 0.2}), )),
+    ("audio",  ( ("rms", My_Measure, {"value": 0.3}),
+                 ("snr", My_Measure, {"value": 65, "constraint": Constraint_Above(70)}), )), # Explicit
+)
+
+# ┌────────────────────────────────────────┐
+# │ Limit tables tests                     │
+# └────────────────────────────────────────┘
+
+def test_limits_load(tmp_path):
+    (tmp_path / "limits.csv" ).write_text(LIMITS_CSV)
+    (tmp_path / "limits.toml").write_text(LIMITS_TOML)
+
+    table = Limit_Table.from_csv(str(tmp_path / "limits.csv"))
+    assert len(table) == 4
+    assert table.constraint_get("audio.rms") == Constraint_Range(ref_min=0.2, ref_max=0.4)
+    assert table.unit_get("supply.vcc")      == "V"
+    assert table.constraint_get("audio.thd") is None
+
+    table = Limit_Table.from_toml(str(tmp_path / "limits.toml"))
+    assert len(table) == 2
+    assert table.constraint_get("supply.vcc").tolerance_pcent == 5.0
+
+    with pytest.raises(ValueError):
+        Limit_Table([{"path": "a", "constraint": "boolean", "ref_value": 1}])
+
+
+def _plan_run(tmp_path):
+    (tmp_path / "limits.csv").write_text(LIMITS_CSV)
+    table = Limit_Table.from_csv(str(tmp_path / "limits.csv"))
+
+    plan         = Procedure_Plan(PROC, limits=table)
+    res, errlist = Procedure_Context().plan_run(plan)
+
+    return table, res
+
+
+def test_limits_plan(tmp_path):
+    table, res    = _plan_run(tmp_path)
+    supply, audio = res.tests
+
+    assert supply.tests[0].result == True
+    assert supply.tests[0].unit   == "V"
+    assert supply.tests[1].result == False                  # Above 0.1 A
+    assert supply.tests[1].constraint.constraint_class == "below"
+    assert audio.tests[0].result  == True
+    assert audio.tests[1].constraint.options["ref_value"] == 70 # Explicit constraint kept
+
+
+def test_limits_regrade(tmp_path):
+    table, res = _plan_run(tmp_path)
+
+    verdicts = table.regrade(res)
+    assert verdicts == {"supply.vcc": True, "supply.icc": False, "audio.rms": True, "audio.snr": True}
+
+    # Same verdicts as the scalar constraints
+    for path, passed in verdicts.items():
+        value = {"supply.vcc": 3.31, "supply.icc": 0.2, "audio.rms": 0.3, "audio.snr": 65}[path]
+        assert table.constraint_get(path).validate(value) == passed
@@ -0,0 +1,142 @@
+"""
+┌─────────────────────────────┐
+│ Transform memoization tests │
+└─────────────────────────────┘
+
+ October 2026
+"""
+
+import pytest
+
+from threading import Lock
+
+from pyrouet.maestro.procedure.ctx  import Procedure_Context
+from pyrouet.maestro.procedure.memo import Procedure_Transform_Memo, value_key
+
+from pyrouet.maestro.procedure.step import (
+    Step_Measure,
+    Step_Measure_Transform
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Above
+)
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+CALLS = list()
+
+class My_Measure(Step_Measure):
+    def __init__(self, value, constraint, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+
+    def _measure(self, ctx, path_stack, values):
+        return self.value
+
+
+class My_Scale(Step_Measure_Transform):
+    pure = True
+
+    def __init__(self, value_from, constraint, unit="", gain=1, **kwargs):
+        super().__init__(value_from, constraint, unit, **kwargs)
+        self.gain = gain
+
+    def _transform(self, ctx, path_stack, value):
+        CALLS.append(self.gain)
+        return sum(value)*self.gain
+
+
+def _proc(capture, gain=2, pure=True):
+    return (
+        ("capture", My_Measure, {"value": capture, "constraint": None, "save_value": True}),
+        ("scaled",  My_Scale,   {"value_from": "^capture", "gain": gain, "pure": pure,
+                                 "constraint": Constraint_Above(0)}),
+    )
+
+# ┌────────────────────────────────────────┐
+# │ Memoization tests                      │
+# └────────────────────────────────────────┘
+
+def test_memo_hits():
+    CALLS.clear()
+
+    memo = Procedure_Transform_Memo(max_entries=2)
+    ctx  = Procedure_Context(transform_memo=memo)
+
+    for i in range(3):
+        res, errlist = ctx.procedure_run(_proc([1, 2, 3]))
+        assert res.tests[1].value == 12
+
+    assert CALLS == [2]                                            # Computed once
+    assert memo.stats() == {"entries": 1, "hits": 2, "misses": 1}
+
+    # Other parameters and source values are computed
+    ctx.procedure_run(_proc([1, 2, 3], gain=3))
+    ctx.procedure_run(_proc([1, 2, 4]))
+    assert CALLS == [2, 3, 2]
+    assert len(memo) == 2                                          # LRU eviction
+
+    # Not pure
+    ctx.procedure_run(_proc([1, 2, 4], pure=False))
+    assert CALLS == [2, 3, 2, 2]
+
+
+def test_memo_disabled():
+    CALLS.clear()
+
+    ctx = Procedure_Context()
+    for i in range(2):
+        ctx.procedure_run(_proc([1, 2, 3]))
+
+    assert CALLS == [2, 2]
+
+
+def test_memo_keys_digest():
+    capture = bytes(1 << 20)
+    key     = value_key(capture)
+
+    assert key == value_key(bytes(1 << 20))
+    assert key != value_key(bytes(1 << 20) + b"\x01")
+    assert all(len(str(part)) < 64 for part in key)                # Value not kept by the key
+
+    assert value_key(("a", capture)) != value_key(("b", capture))
+    assert value_key(1.5)            == ("float", 1.5)
+
+
+class Unkeyed:
+    __hash__ = None # Neither hashable nor picklable (local lock)
+
+    def __init__(self, values):
+        self.values = values
+        self.lock   = Lock()
+
+    def __iter__(self):
+        return iter(self.values)
+
+
+def test_memo_unkeyed_value():
+    CALLS.clear()
+    ctx = Procedure_Context(transform_memo=Procedure_Transform_Memo())
+
+    for i in range(2):
+        res, errlist = ctx.procedure_run(_proc(Unkeyed([1, 2, 3])))
+        assert res.result
+        assert res.tests[1].value == 12
+
+    assert CALLS == [2, 2] # Computed without caching
+    assert len(ctx.transform_memo) == 0
+
+
+def test_memo_array_readonly():
+    np   = pytest.importorskip("numpy")
+    memo = Procedure_Transform_Memo()
+    step = My_Scale("^capture", None)
+
+    out  = memo.get_or_compute(step, 1, lambda: np.zeros(4))
+    assert memo.get_or_compute(step, 1, lambda: None) is out
+
+    with pytest.raises(ValueError):
+        out[0] = 1.0
@@ -0,0 +1,99 @@
+"""
+┌────────────────────┐
+│ Panel runner tests │
+└────────────────────┘
+
+ October 2026
+"""
+
+from pyrouet.maestro.procedure.panel import Procedure_Panel
+
+from pyrouet.maestro.procedure.step import (
+    Step_Action,
+    Step_Measure
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Below
+)
+
+from pyrouet.maestro.errors import (
+    Procedure_Error
+)
+
+from pprint import pprint
+import time
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+# Steps must be defined at module level to be
+# picklable for the worker processes.
+
+class Flash_Step(Step_Action):
+    def __init__(self, delay=0, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+
+    def _impl(self, ctx, path_stack):
+        if not ctx.params.get("port"):
+            raise Procedure_Error("No serial port for DUT", path_stack)
+
+        time.sleep(self.delay/1000)
+
+
+class Slot_Measure(Step_Measure):
+    def __init__(self, constraint, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+
+    def _measure(self, ctx, path_stack, values):
+        return ctx.params["slot"]
+
+
+PROC = (
+    ("flash", Flash_Step,   {"delay": 300}),
+    ("slot",  Slot_Measure, {"constraint": Constraint_Below(ref_value=2), "save_value": True}),
+)
+
+# ┌────────────────────────────────────────┐
+# │ Panel tests                            │
+# └────────────────────────────────────────┘
+
+def test_panel_run():
+    duts = { f"pcb{i}": {"port": f"/dev/ttyUSB{i}", "slot": i} for i in range(4) }
+
+    panel = Procedure_Panel(PROC)
+
+    t_start         = time.time()
+    res, errlists   = panel.run(duts)
+    t_end           = time.time()
+
+    pprint(res)
+
+    assert (t_end - t_start) < 1.2 # DUTs were tested concurrently
+
+    assert list(res.duts.keys()) == ["pcb0", "pcb1", "pcb2", "pcb3"]
+    assert res.passed == ["pcb0", "pcb1", "pcb2"]
+    assert res.failed == ["pcb3"]
+    assert res.result == False
+
+    # Per-DUT parameters were injected
+    assert res.duts["pcb1"].tests[1].value == 1
+    assert res.duts["pcb3"].tests[1].value == 3
+
+    # Each DUT has its own error list
+    assert errlists["pcb0"] == []
+    assert len(errlists["pcb3"]) == 1
+    assert errlists["pcb3"][0][0] == ("slot",)
+
+
+def test_panel_missing_param():
+    panel         = Procedure_Panel(PROC, max_workers=2)
+    res, errlists = panel.run({"pcb0": {"slot": 0}, "pcb1": {"port": "/dev/ttyUSB1", "slot": 1}})
+
+    assert res.passed == ["pcb1"]
+    assert res.failed == ["pcb0"]
+
+    assert isinstance(res.duts["pcb0"].tests[0].err, Procedure_Error)
+    assert str(res.duts["pcb0"].tests[0].err) == "No serial port for DUT"
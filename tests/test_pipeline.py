@@ -0,0 +1,130 @@
+"""
+┌───────────────────────┐
+│ Pipeline runner tests │
+└───────────────────────┘
+
+ October 2026
+"""
+
+from pyrouet.maestro.procedure.pipeline import Procedure_Pipeline
+
+from pyrouet.maestro.procedure.step import (
+    Step_Action,
+    Step_Measure,
+    Step_Measure_Transform
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Below
+)
+
+from pyrouet.maestro.errors import (
+    Procedure_Error
+)
+
+import pytest
+import time
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+class Flash_Step(Step_Action):
+    def __init__(self, delay=0, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+
+    def _impl(self, ctx, path_stack):
+        if not ctx.params.get("port"):
+            raise Procedure_Error("No serial port for DUT", path_stack)
+
+        time.sleep(self.delay/1000)
+
+
+class Slot_Measure(Step_Measure):
+    def __init__(self, constraint, unit="", delay=0, **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.delay = delay
+
+    def _measure(self, ctx, path_stack, values):
+        time.sleep(self.delay/1000)
+        return ctx.params["slot"]
+
+
+class Same_Transform(Step_Measure_Transform):
+    def __init__(self, value_from, constraint, unit = "", **kwargs):
+        super().__init__(value_from, constraint, unit, **kwargs)
+
+
+PROC = (
+    ("flash",   Flash_Step,     {"delay": 200, "critical": True}),
+    ("slot",    Slot_Measure,   {"constraint": Constraint_Below(ref_value=3), "delay": 200, "save_value": True}),
+    ("check",   Same_Transform, {"value_from": "slot", "constraint": Constraint_Below(ref_value=1)}),
+)
+
+DUTS = {
+    "dut0": {"port": "/dev/ttyUSB0", "slot": 0},
+    "dut1": {"port": "/dev/ttyUSB1", "slot": 1},
+    "dut2": {"port": "/dev/ttyUSB2", "slot": 2},
+}
+
+# ┌────────────────────────────────────────┐
+# │ Pipeline tests                         │
+# └────────────────────────────────────────┘
+
+def test_pipeline_overlap():
+    pipeline = Procedure_Pipeline(PROC, stages={"flashing": ["flash"], "measure": ["slot", "check"]})
+
+    t_start  = time.time()
+    results  = list(pipeline.run(DUTS))
+    t_end    = time.time()
+
+    assert [r[0] for r in results] == ["dut0", "dut1", "dut2"] # Ordered stream
+    assert (t_end - t_start) < 1.0                             # 1.2 s if not pipelined
+
+    res = {dut_id: r for dut_id, r, errors in results}
+
+    assert res["dut0"].result == True
+    assert res["dut1"].result == True
+    assert res["dut2"].result == False                           # Value from the previous stage
+    assert [r.step_id for r in res["dut2"].tests] == ["flash", "slot", "check"]
+    assert res["dut1"].tests[1].value == 1
+
+
+def test_pipeline_critical():
+    duts     = dict(DUTS, dut1 = {"slot": 1}) # No serial port
+    pipeline = Procedure_Pipeline(PROC)
+
+    results  = {dut_id: (r, errors) for dut_id, r, errors in pipeline.run(duts)}
+
+    res, errors = results["dut1"]
+    assert res.result == False
+    assert len(res.tests) == 1 # Next stages skipped
+    assert errors[0][0] == ("flash",)
+
+    assert results["dut2"][0].result == False
+    assert results["dut0"][0].result == True
+
+
+def test_pipeline_invalid_stages():
+    with pytest.raises(ValueError):
+        Procedure_Pipeline(PROC, stages={"measure": ["slot", "check"], "flashing": ["flash"]})
+
+
+def test_pipeline_early_break():
+    duts     = {f"dut{i}": {"port": f"/dev/ttyUSB{i}", "slot": 0} for i in range(10)}
+    pipeline = Procedure_Pipeline(PROC, stages={"flashing": ["flash"], "measure": ["slot", "check"]})
+
+    t_start  = time.time()
+
+    for dut_id, res, errors in pipeline.run(duts):
+        assert dut_id == "dut0"
+        break # Station stop
+
+    t_end    = time.time()
+
+    assert (t_end - t_start) < 1.0 # 2.2 s for all the DUTs
+
+    # The pipeline can run again
+    results = list(pipeline.run(DUTS))
+    assert [r[0] for r in results] == ["dut0", "dut1", "dut2"]
@@ -0,0 +1,214 @@
+"""
+┌─────────────────────────┐
+│ Procedure plans tests   │
+└─────────────────────────┘
+
+ October 2026
+"""
+
+from pyrouet.maestro.procedure.ctx  import Procedure_Context
+from pyrouet.maestro.procedure.plan import (
+    Procedure_Plan,
+    PLAN_STEP,
+    PLAN_ENTER,
+    PLAN_LEAVE
+)
+
+from pyrouet.maestro.procedure.step import (
+    Step_Action,
+    Step_Measure,
+    Step_Measure_Transform
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Above
+)
+
+from pyrouet.maestro.errors import (
+    Procedure_Error,
+    Procedure_Stop_Error
+)
+
+from dataclasses import asdict
+from pprint      import pprint
+
+import pytest
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+class My_Step(Step_Action):
+    def __init__(self, msg, fail=False, **kwargs):
+        super().__init__(**kwargs)
+
+        self.msg   = msg
+        self.fail  = fail
+
+    def _impl(self, ctx, path_stack):
+        if self.fail: raise Procedure_Error("I must fail!", path_stack)
+
+
+class My_Measure(Step_Measure):
+    def __init__(self, value, constraint, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+
+    def _measure(self, ctx, path_stack, values):
+        return self.value
+
+
+class My_Transform(Step_Measure_Transform):
+    def __init__(self, value_from, constraint, unit = "", **kwargs):
+        super().__init__(value_from, constraint, unit, **kwargs)
+
+    def _transform(self, ctx, path_stack, value):
+        return value+1
+
+
+def result_summary(res):
+    """
+    Comparable summary of a result tree
+    """
+
+    dd = asdict(res)
+
+    def strip_err(d):
+        if isinstance(d, dict):
+            return { k: (repr(v) if k == "err" else strip_err(v)) for k,v in d.items() }
+        elif isinstance(d, list):
+            return [strip_err(x) for x in d]
+        else:
+            return d
+
+    return strip_err(dd)
+
+
+def assert_same_results(proc):
+    ctx                        = Procedure_Context()
+    plan                       = Procedure_Plan(proc)
+
+    res_interp, errlist_interp = ctx.procedure_run(proc)
+    res_plan,   errlist_plan   = ctx.plan_run(plan)
+
+    pprint(asdict(res_plan))
+
+    assert result_summary(res_interp) == result_summary(res_plan)
+    assert [p for p,e in errlist_interp] == [p for p,e in errlist_plan]
+
+    return res_plan
+
+# ┌────────────────────────────────────────┐
+# │ Compilation tests                      │
+# └────────────────────────────────────────┘
+
+def test_plan_compile():
+    proc = ( ("test1", My_Step, {"msg": "Hello world 1 !"}),
+             ("sub",   ( ("measure",   My_Measure,   {"value": 1, "constraint": None, "save_value": True}),
+                         ("transform", My_Transform, {"value_from": "^measure", "constraint": None}) )) )
+
+    plan = Procedure_Plan(proc)
+
+    assert [i.op for i in plan.instructions] == [PLAN_STEP, PLAN_ENTER, PLAN_STEP, PLAN_STEP, PLAN_LEAVE]
+    assert plan.instructions[3].path_str == "sub.transform"
+    assert plan.instructions[3].step_args["value_from"] == "sub.measure"
+    assert proc[1][1][1][2]["value_from"] == "^measure" # Definition is left untouched
+
+    assert plan.instructions[1].jump  == 4
+    assert plan.instructions[2].leave == 4
+    assert plan.instructions[4].leave == 5
+
+
+def test_plan_invalid_shape():
+    with pytest.raises(TypeError):
+        Procedure_Plan( ( ("test1", My_Step, {"msg": "Hello world 1 !"}),
+                          ("test2", "12",    {"msg": "Hello world 2 !"}) ) )
+
+    with pytest.raises(TypeError):
+        Procedure_Plan( ( ("sub", ( ("error_subproc", ( ("test1", My_Step, {"msg": "Hi"}), ) ) ) ), ) )
+
+    with pytest.raises(ValueError):
+        Procedure_Plan( ( ("test1", My_Step, {"msg": "Hello world 1 !"}),
+                          ("test1", My_Step, {"msg": "Hello world 2 !"}) ) )
+
+# ┌────────────────────────────────────────┐
+# │ Execution tests                        │
+# └────────────────────────────────────────┘
+
+def test_plan_basic():
+    proc = ( ("test1", My_Step, {"msg": "Hello world 1 !"}),
+             ("test2", My_Step, {"msg": "Hello world 2 !", "fail": True}),
+             ("test3", My_Step, {"msg": "Hello world 3 !"}) )
+
+    res  = assert_same_results( (("subproc1", proc), ("subproc2", proc)) )
+    assert res.result == False
+
+
+def test_plan_flags():
+    subproc1 = ( ("test1", My_Step, {"msg": "Hello world 1 !", "break_if_error": True}),
+                 ("test2", My_Step, {"msg": "Hello world 2 !", "fail": True, "break_if_error": True}),
+                 ("test3", My_Step, {"msg": "Hello world 3 !"}) )
+
+    subproc2 = ( ("test1", My_Step, {"msg": "Hello world 1 !"}),
+                 ("test2", My_Step, {"msg": "Hello world 2 !", "fail": True, "critical": True}),
+                 ("test3", My_Step, {"msg": "Hello world 3 !"}) )
+
+    res = assert_same_results( ( ("subproc1", subproc1),
+                                 ("nested",   ( ("subproc2", subproc2), ("after", My_Step, {"msg": "After"}) )),
+                                 ("subproc3", subproc1) ) )
+
+    assert isinstance(res.err, Procedure_Stop_Error)
+    assert len(res.tests) == 2
+
+
+def test_plan_values():
+    proc = ( ("sub", ( ("measure",   My_Measure,   {"value": 2, "constraint": None, "save_value": True}),
+                       ("transform", My_Transform, {"value_from": "^measure", "constraint": Constraint_Above(3)}) )), )
+
+    res  = assert_same_results(proc)
+    assert res.result == True
+
+
+def test_plan_parallel():
+    channel = ( ("test1", My_Step, {"msg": "Channel test 1"}),
+                ("test2", My_Step, {"msg": "Channel test 2"}) )
+
+    proc    = ( ("channels", ( ("ch1",    channel),
+                               ("single", My_Step, {"msg": "Single step"}),
+                               ("ch2",    channel) ), {"parallel": True}),
+                ("critical", ( ("ch1", ( ("test1", My_Step, {"msg": "Fail", "fail": True, "critical": True}), )),
+                               ("ch2", channel) ), {"parallel": True, "max_workers": 1}),
+                ("after",    My_Step, {"msg": "After"}) )
+
+    res = assert_same_results(proc)
+    assert isinstance(res.err, Procedure_Stop_Error)
+
+
+def test_plan_globerr():
+    proc = ( ("test1", My_Step, {"msg": "Hello world 1 !"}),
+             ("sub",   ( ("test2", My_Step, {"msg": "Hello world 2 !", "unknown": My_Step}), )), )
+
+    ctx      = Procedure_Context()
+    plan     = Procedure_Plan(proc)
+    ctx.step_run = lambda id_,stp,path_stack,errlist,values:None # Break something !!!
+
+    res, errlist = ctx.plan_run(plan)
+
+    assert res.result == False
+    assert isinstance(res.err, TypeError)
+    assert len(res.tests) == 0 # Global error → No tests saved !
+
+
+def test_plan_dataflow():
+    proc = ( ("audio", ( ("capture1",   My_Measure,   {"value": 1, "constraint": None, "save_value": True}),
+                         ("transform1", My_Transform, {"value_from": "^capture1", "constraint": Constraint_Above(2)}),
+                         ("capture2",   ( ("measure", My_Measure, {"value": 2, "constraint": None, "save_value": True}), )),
+                         ("transform2", My_Transform, {"value_from": "audio.capture2.measure", "constraint": Constraint_Above(3)}),
+                         ("check",      My_Step,      {"msg": "Check", "after": ["transform1", "transform2"]}) ),
+               {"dataflow": True}), )
+
+    plan = Procedure_Plan(proc)
+    assert plan.instructions[0].deps == [set(), {0}, set(), {2}, {1, 3}]
+
+    res  = assert_same_results(proc)
+    assert res.result == True
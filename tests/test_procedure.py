@@ -11,26 +11,34 @@ from pyrouet.maestro.procedure.ctx    import Procedure_Context
 
 from pyrouet.maestro.constraints import (
     Constraint_None,
-    Constraint_Above
+    Constraint_Above,
+    Constraint_Below,
+    Constraint_Range
 )
 
 from pyrouet.maestro.procedure.step import (
     Step_Base,
     Step_Action,
     Step_Measure,
-    Step_Measure_Transform
+    Step_Measure_Transform,
+    Step_Measure_Transform_Fused,
+    Step_Measure_Stream,
+    Step_Measure_Averaged
 )
 
 from pyrouet.maestro.errors import (
     Procedure_Error,
     Procedure_Abort_Error,
     Procedure_Stop_Error,
+    Procedure_Timeout_Error,
     Procedure_Constraint_Error
 )
 
 
 from   dataclasses import asdict
 from   pprint      import pprint
+from   threading   import Event, Timer, Lock
+import random
 import pytest
 import time
 
@@ -170,6 +178,8 @@ def test_measure_fail():
         assert res.result == False
         assert isinstance(res.err, Procedure_Constraint_Error)
         assert str(res.err) == "Constraint 'above' with options '{'ref_value': 0.0}' failed for value '-1.0'"
+        assert res.err.constraint is res.constraint
+        assert res.err.msg == str(res.err)
 
 
 def test_measure_broken():
@@ -442,3 +452,402 @@ def test_measure_values():
 
         assert res.result == True
         assert res.err is None
+
+
+
+class My_Stats_Transform(Step_Measure_Transform_Fused):
+    def __init__(self, value_from, outputs, **kwargs):
+        super().__init__(value_from, outputs, **kwargs)
+
+    def _transform(self, ctx, path_stack, value):
+        return {"min": min(value), "max": max(value), "mean": sum(value)/len(value)}
+
+
+def test_measure_fused_transform():
+    proc = (
+        ("capture", My_Measure,         {"value": [1, 2, 6], "constraint": None, "save_value": True}),
+        ("stats",   My_Stats_Transform, {"value_from": "^capture", "save_value": True,
+                                         "outputs": {"min":  Constraint_Above(1),
+                                                     "max":  (Constraint_Below(5), "V"),
+                                                     "mean": None}}),
+        ("check",   My_Transform,       {"value_from": "stats.mean", "constraint": Constraint_Above(3)}),
+    )
+
+    ctx          = Procedure_Context()
+    res, errlist = ctx.procedure_run(proc)
+
+    stats = res.tests[1]
+    assert res.result   == False
+    assert stats.result == False
+    assert [(m.step_id, m.value, m.result) for m in stats.tests] == [("min", 1, True), ("max", 6, False), ("mean", 3, True)]
+    assert stats.tests[1].unit == "V"
+    assert errlist[0][0] == ("stats", "max")
+    assert res.tests[2].result == True # Saved output
+
+
+
+class My_Stream(Step_Measure_Stream):
+    def __init__(self, level, noise=0.0, chunks=100, constraint=None, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.level  = level
+        self.noise  = noise
+        self.chunks = chunks
+
+    def _measure_stream(self, ctx, path_stack, values):
+        for i in range(self.chunks):
+            yield [self.level + self.noise*((-1)**k) for k in range(10)]
+
+
+def test_measure_stream():
+    proc = (
+        ("stable",   My_Stream, {"level": 1.0, "noise": 0.01, "constraint": Constraint_Range(0.9, 1.1)}),
+        ("unstable", My_Stream, {"level": 1.0, "noise": 0.5,  "constraint": Constraint_Range(0.9, 1.1), "aggregate": "max"}),
+        ("low",      My_Stream, {"level": 0.5, "constraint": Constraint_Above(0.9)}),
+        ("full",     My_Stream, {"level": 1.0, "chunks": 5, "constraint": Constraint_Range(0.9, 1.1), "early_exit": False}),
+        ("rms",      My_Stream, {"level": 0.0, "noise": 1.0, "chunks": 5, "aggregate": "rms", "constraint": None}),
+    )
+
+    ctx          = Procedure_Context()
+    res, errlist = ctx.procedure_run(proc)
+
+    stable, unstable, low, full, rms = res.tests
+
+    assert stable.result   == True
+    assert stable.options["samples"]    == 10 # Settled after first chunk
+    assert stable.options["early_exit"] == "pass"
+    assert stable.value    == pytest.approx(1.0)
+
+    assert unstable.result == False
+    assert unstable.options["early_exit"] == "fail"
+    assert unstable.value  == 1.5
+
+    assert low.result      == False
+    assert low.options["samples"] == 10
+
+    assert full.result     == True
+    assert full.options["samples"] == 50
+    assert full.options["early_exit"] is None
+
+    assert rms.value       == pytest.approx(1.0)
+
+
+
+class My_Noisy_Measure(Step_Measure_Averaged):
+    def __init__(self, level, noise, constraint=None, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.level = level
+        self.noise = noise
+        self.rng   = random.Random(42)
+
+    def _sample(self, ctx, path_stack, values):
+        return self.rng.gauss(self.level, self.noise)
+
+
+def test_measure_averaged():
+    proc = (
+        ("inside",   My_Noisy_Measure, {"level": 1.0,  "noise": 0.01, "constraint": Constraint_Range(0.9, 1.1)}),
+        ("outside",  My_Noisy_Measure, {"level": 2.0,  "noise": 0.01, "constraint": Constraint_Range(0.9, 1.1)}),
+        ("marginal", My_Noisy_Measure, {"level": 1.1,  "noise": 0.5,  "constraint": Constraint_Range(0.9, 1.1), "max_samples": 50}),
+        ("fixed",    My_Noisy_Measure, {"level": 1.0,  "noise": 0.01, "constraint": None, "max_samples": 20}),
+    )
+
+    ctx          = Procedure_Context()
+    res, errlist = ctx.procedure_run(proc)
+
+    inside, outside, marginal, fixed = res.tests
+
+    assert inside.result  == True
+    assert inside.options["samples"] == 5   # Verdict settled after min_samples
+    lo, hi = inside.options["interval"]
+    assert 0.9 <= lo <= inside.value <= hi <= 1.1
+
+    assert outside.result == False
+    assert outside.options["samples"] == 5
+
+    assert marginal.options["samples"] == 50 # Capped
+    assert marginal.options["early_exit"] is None
+
+    assert fixed.options["samples"] == 20   # No interval constraint
+
+
+# ┌────────────────────────────────────────┐
+# │ Parallel subprocedures                 │
+# └────────────────────────────────────────┘
+
+def test_parallel_subproc():
+    channel = ( ("test1", My_Step, {"msg": "Channel test 1", "delay": 200, "fail": False}),
+                ("test2", My_Step, {"msg": "Channel test 2", "fail": False}) )
+
+    proc    = ( ("channels", ( ("ch1", channel),
+                               ("ch2", channel),
+                               ("ch3", channel),
+                               ("ch4", channel) ), {"parallel": True}), )
+
+    ctx = Procedure_Context()
+
+    for i in range(2):
+        t_start      = time.time()
+        res, errlist = ctx.procedure_run(proc)
+        t_end        = time.time()
+
+        assert res.result == True
+        assert res.err is None
+        assert (t_end - t_start) < 0.6 # Channels did run concurrently
+
+        # Results are stored in declaration order
+        assert [r.step_id for r in res.tests[0].tests] == ["ch1", "ch2", "ch3", "ch4"]
+        assert all(len(r.tests) == 2 for r in res.tests[0].tests)
+
+
+def test_parallel_critical():
+    proc = ( ("channels", ( ("test1", My_Step, {"msg": "Hello world 1 !", "fail": True, "critical": True}),
+                            ("test2", My_Step, {"msg": "Hello world 2 !", "fail": False}),
+                            ("test3", My_Step, {"msg": "Hello world 3 !", "fail": False}) ),
+                          {"parallel": True, "max_workers": 1}),
+             ("after", My_Step, {"msg": "Hello world 4 !", "fail": False}) )
+
+    ctx = Procedure_Context()
+
+    for i in range(2):
+        res, errlist = ctx.procedure_run(proc)
+
+        pprint(asdict(res))
+
+        assert len(res.tests) == 1                       # Procedure stopped after parallel subproc
+        assert len(res.tests[0].tests) == 1              # Siblings were cancelled
+        assert res.tests[0].tests[0].step_id == "test1"
+
+        assert res.result == False
+        assert isinstance(res.err, Procedure_Stop_Error)
+
+
+def test_parallel_critical_nested():
+    slow = ( ("test1", My_Step, {"msg": "Slow 1", "delay": 200, "fail": False}),
+             ("test2", My_Step, {"msg": "Slow 2", "fail": False}) )
+
+    fast = ( ("test1", My_Step, {"msg": "Fast 1", "fail": True, "critical": True}), )
+
+    proc = ( ("channels", ( ("slow", slow),
+                            ("fast", fast) ), {"parallel": True}), )
+
+    ctx = Procedure_Context()
+
+    for i in range(2):
+        res, errlist = ctx.procedure_run(proc)
+
+        assert res.result == False
+        assert isinstance(res.err, Procedure_Stop_Error)
+
+        # Slow sibling was stopped before its second step
+        assert len(res.tests[0].tests[0].tests) == 1
+        assert isinstance(res.tests[0].tests[0].err, Procedure_Stop_Error)
+
+
+# ┌────────────────────────────────────────┐
+# │ Dataflow subprocedures                 │
+# └────────────────────────────────────────┘
+
+class My_Slow_Transform(Step_Measure_Transform):
+    def __init__(self, value_from, constraint, unit = "", delay=0, **kwargs):
+        super().__init__(value_from, constraint, unit, **kwargs)
+        self.delay = delay
+
+    def _transform(self, ctx, path_stack, value):
+        time.sleep(self.delay/1000)
+        return value
+
+
+class My_Ordered_Step(Step_Action):
+    def __init__(self, delay=0, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+
+    def _impl(self, ctx, path_stack):
+        time.sleep(self.delay/1000)
+        ctx.params.setdefault("order", list()).append(path_stack[-1])
+
+
+def test_dataflow_subproc():
+    proc = ( ("audio", ( ("capture1",   My_Measure,        {"value": 1, "constraint": None, "delay": 200, "save_value": True}),
+                         ("transform1", My_Slow_Transform, {"value_from": "^capture1", "constraint": Constraint_Above(1), "delay": 200}),
+                         ("capture2",   My_Measure,        {"value": 2, "constraint": None, "delay": 200, "save_value": True}),
+                         ("transform2", My_Slow_Transform, {"value_from": "^capture2", "constraint": Constraint_Above(2), "delay": 200}) ),
+               {"dataflow": True}), )
+
+    ctx = Procedure_Context()
+
+    for i in range(2):
+        t_start      = time.time()
+        res, errlist = ctx.procedure_run(proc)
+        t_end        = time.time()
+
+        pprint(asdict(res))
+
+        assert res.result == True               # Transforms did run after their captures
+        assert (t_end - t_start) < 0.7          # Captures, then transforms did run concurrently
+        assert [r.step_id for r in res.tests[0].tests] == ["capture1", "transform1", "capture2", "transform2"]
+
+
+def test_dataflow_hints():
+    proc = ( ("flash", ( ("erase",  My_Ordered_Step, {"delay": 200}),
+                         ("write",  My_Ordered_Step, {"after": ["erase"]}),
+                         ("verify", ( ("check", My_Ordered_Step, {}), ), {"after": "write"}),
+                         ("other",  My_Ordered_Step, {}) ),
+               {"dataflow": True, "max_workers": 2}), )
+
+    ctx          = Procedure_Context()
+    res, errlist = ctx.procedure_run(proc)
+
+    assert res.result == True
+    assert ctx.params["order"] == ["other", "erase", "write", "check"]
+
+
+# ┌────────────────────────────────────────┐
+# │ Timeouts and abort                     │
+# └────────────────────────────────────────┘
+
+class My_Blocking_Step(Step_Action):
+    """
+    Waits for the given delay, or until aborted.
+    """
+
+    def __init__(self, delay=0, **kwargs):
+        super().__init__(**kwargs)
+        self.delay   = delay
+        self.release = Event()
+
+    def _impl(self, ctx, path_stack):
+        self.release.wait(self.delay/1000)
+
+    def abort(self):
+        self.release.set()
+
+
+def test_step_timeout():
+    proc = ( ("hang",  My_Blocking_Step, {"delay": 5000, "timeout": 0.2}),
+             ("after", My_Step,          {"msg": "After"}), )
+
+    ctx          = Procedure_Context()
+
+    t_start      = time.time()
+    res, errlist = ctx.procedure_run(proc)
+    t_end        = time.time()
+
+    assert (t_end - t_start) < 1.0
+    assert res.result == False
+    assert isinstance(res.tests[0].err, Procedure_Timeout_Error)
+    assert res.tests[0].options["timeout"] == 0.2
+    assert len(res.tests) == 1          # Timeout aborts the procedure
+    assert errlist[0][0] == ("hang",)
+
+
+def test_subproc_timeout():
+    proc = ( ("sub", ( ("a", My_Blocking_Step, {"delay": 5000}),
+                       ("b", My_Step,          {"msg": "B"}), ),
+              {"timeout": 0.2}),
+             ("after", My_Step, {"msg": "After"}), )
+
+    ctx          = Procedure_Context()
+    res, errlist = ctx.procedure_run(proc)
+
+    assert res.result == False
+    assert isinstance(res.tests[0].tests[0].err, Procedure_Timeout_Error)
+    assert len(res.tests[0].tests) == 1 # Nothing started after abort
+    assert len(res.tests) == 1
+
+    # Next run is not aborted
+    proc         = ( ("after", My_Step, {"msg": "After"}), )
+    res, errlist = ctx.procedure_run(proc)
+
+    assert res.result == True
+
+
+def test_context_abort():
+    proc = ( ("sub", ( ("a", My_Blocking_Step, {"delay": 5000}),
+                       ("b", My_Blocking_Step, {"delay": 5000}) ),
+              {"parallel": True}), )
+
+    ctx   = Procedure_Context()
+    timer = Timer(0.2, ctx.abort)
+    timer.start()
+
+    t_start      = time.time()
+    res, errlist = ctx.procedure_run(proc)
+    t_end        = time.time()
+
+    assert (t_end - t_start) < 1.0
+    assert res.result == False
+    assert all(isinstance(r.err, Procedure_Abort_Error) for r in res.tests[0].tests)
+
+
+# ┌────────────────────────────────────────┐
+# │ Shared resources                       │
+# └────────────────────────────────────────┘
+
+class My_Tracked_Step(Step_Action):
+    """
+    Records its enter and exit events, with the resources it uses
+    """
+
+    events      = list()
+    events_lock = Lock()
+
+    def __init__(self, delay=0, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+
+    def _impl(self, ctx, path_stack):
+        with My_Tracked_Step.events_lock:
+            My_Tracked_Step.events.append(("enter", self.resources))
+
+        time.sleep(self.delay/1000)
+
+        with My_Tracked_Step.events_lock:
+            My_Tracked_Step.events.append(("exit", self.resources))
+
+
+def test_resources_serialize():
+    proc = ( ("sub", ( ("scope1", My_Tracked_Step, {"delay": 100, "resources": "scope"}),
+                       ("scope2", My_Tracked_Step, {"delay": 100, "resources": ["scope", "uart"]}),
+                       ("scope3", My_Tracked_Step, {"delay": 100, "resources": "scope"}),
+                       ("dmm",    My_Tracked_Step, {"delay": 100, "resources": "dmm"}) ),
+               {"parallel": True}), )
+
+    My_Tracked_Step.events.clear()
+    ctx          = Procedure_Context()
+    res, errlist = ctx.procedure_run(proc)
+
+    assert res.result == True
+
+    # The steps using the scope never overlap
+    active = 0
+    for event, resources in My_Tracked_Step.events:
+        if "scope" in resources:
+            active += 1 if (event == "enter") else -1
+            assert active <= 1
+
+    assert len(My_Tracked_Step.events) == 8
+
+    stats = ctx.resources.stats_get()
+    assert stats["scope"]["acquired"] == 3
+    assert stats["dmm"]["acquired"]   == 1
+    assert stats["dmm"]["contended"]  == 0
+    assert all("resources_wait" in r.options for r in res.tests[0].tests)
+
+
+def test_resources_abort_waiting():
+    proc = ( ("sub", ( ("a", My_Blocking_Step, {"delay": 5000, "resources": "uart"}),
+                       ("b", My_Blocking_Step, {"delay": 5000, "resources": "uart"}) ),
+               {"parallel": True}), )
+
+    ctx   = Procedure_Context()
+    timer = Timer(0.2, ctx.abort)
+    timer.start()
+
+    t_start      = time.time()
+    res, errlist = ctx.procedure_run(proc)
+    t_end        = time.time()
+
+    assert (t_end - t_start) < 1.0
+    assert all(isinstance(r.err, Procedure_Abort_Error) for r in res.tests[0].tests)
+    assert ctx.resources.acquire(["uart"]) is not None # Released
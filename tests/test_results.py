@@ -0,0 +1,119 @@
+"""
+┌──────────────────────┐
+│ Result objects tests │
+└──────────────────────┘
+
+ October 2026
+"""
+
+import gc
+import copy
+import pickle
+import pytest
+
+from dataclasses import asdict
+
+from pyrouet.maestro.procedure.ctx   import Procedure_Context
+from pyrouet.maestro.objects         import options     as options_module
+from pyrouet.maestro.objects         import constraints as constraints_module
+from pyrouet.maestro.objects.options import Frozen_Options, options_intern
+
+from pyrouet.maestro.objects.results import (
+    Result_Measure
+)
+
+from pyrouet.maestro.procedure.step import (
+    Step_Measure
+)
+
+from pyrouet.maestro.objects.constraints import (
+    Constraint_Description
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Above
+)
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+class My_Measure(Step_Measure):
+    def __init__(self, value, constraint, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+
+    def _measure(self, ctx, path_stack, values):
+        return self.value
+
+# ┌────────────────────────────────────────┐
+# │ Result objects tests                   │
+# └────────────────────────────────────────┘
+
+def test_results_slotted():
+    r = Result_Measure(step_id="m", value=1.0)
+
+    assert not hasattr(r, "__dict__")
+    assert r.step_class == "measure"
+    assert r.constraint is Result_Measure().constraint             # Shared immutable default
+
+    with pytest.raises(AttributeError):
+        r.other = 1
+
+    assert pickle.loads(pickle.dumps(r)) == r
+    assert copy.deepcopy(r)              == r
+    assert asdict(r)["step_class"]       == "measure"
+
+
+def test_options_interned():
+    opts = options_intern({"a": 1, "b": [1, 2]})
+
+    assert isinstance(opts, Frozen_Options)
+    assert options_intern({"a": 1, "b": [1, 2]}) is opts
+    assert options_intern({"a": 1.0, "b": [1, 2]}) is not opts     # Types are kept
+    assert pickle.loads(pickle.dumps(opts)) == opts
+
+    with pytest.raises(TypeError):
+        opts["a"] = 2
+
+
+def test_results_shared_options():
+    proc = (
+        ("m1", My_Measure, {"value": 1, "constraint": Constraint_Above(0)}),
+        ("m2", My_Measure, {"value": 2, "constraint": Constraint_Above(0)}),
+    )
+
+    ctx    = Procedure_Context()
+    res1,_ = ctx.procedure_run(proc)
+    res2,_ = ctx.procedure_run(proc)
+
+    assert res1.tests[0].options is res2.tests[1].options
+    assert res1.tests[0].constraint is res2.tests[1].constraint
+    assert res1.tests[0].constraint == Constraint_Description.from_constraint(Constraint_Above(0))
+    assert res1.tests[0].options["critical"] is False
+
+
+def test_options_nested_readonly():
+    opts = options_intern({"resources": ["port"], "limits": {"max": [1, 2]}})
+
+    assert opts["resources"]     == ("port",)
+    assert opts["limits"]["max"] == (1, 2)
+
+    with pytest.raises(TypeError):
+        opts["limits"]["max"] = 3
+
+
+def test_interned_released():
+    gc.collect()
+    n_options      = len(options_module._interned)
+    n_descriptions = len(constraints_module._descriptions)
+
+    # Per-DUT constraints
+    descs = [Constraint_Above(float(i)).description_get() for i in range(1000)]
+    assert len(constraints_module._descriptions) == n_descriptions + 1000
+
+    del descs
+    gc.collect()
+
+    assert len(options_module._interned)         == n_options
+    assert len(constraints_module._descriptions) == n_descriptions
@@ -0,0 +1,130 @@
+"""
+┌───────────────────┐
+│ Skip policy tests │
+└───────────────────┘
+
+ October 2026
+"""
+
+from pyrouet.maestro.procedure.ctx     import Procedure_Context
+from pyrouet.maestro.procedure.history import Procedure_History
+from pyrouet.maestro.procedure.skip    import Procedure_Skip_Policy
+from pyrouet.maestro.objects.results   import Result_Skipped
+
+from pyrouet.maestro.procedure.step import (
+    Step_Measure
+)
+
+from pyrouet.maestro.constraints import (
+    Constraint_Above
+)
+
+# ┌────────────────────────────────────────┐
+# │ Mock step definition                   │
+# └────────────────────────────────────────┘
+
+class My_Measure(Step_Measure):
+    def __init__(self, value, constraint, unit="", **kwargs):
+        super().__init__(constraint, unit, **kwargs)
+        self.value = value
+
+    def _measure(self, ctx, path_stack, values):
+        return self.value
+
+
+def _proc(value_stable=1):
+    return (
+        ("stable", My_Measure, {"value": value_stable, "constraint": Constraint_Above(0)}),
+        ("saved",  My_Measure, {"value": 1, "constraint": Constraint_Above(0), "save_value": True}),
+        ("flaky",  My_Measure, {"value": 1, "constraint": Constraint_Above(0)}),
+    )
+
+def _ctx(audit_fraction=0.0, **kwargs):
+    hist   = Procedure_History()
+    policy = Procedure_Skip_Policy(hist, min_runs=3, audit_fraction=audit_fraction, seed=1, **kwargs)
+
+    hist.record("flaky", False, 0.1)
+    return Procedure_Context(history=hist, skip_policy=policy), policy
+
+def _skipped(res):
+    return [r.step_id for r in res.tests if isinstance(r, Result_Skipped)]
+
+# ┌────────────────────────────────────────┐
+# │ Skip policy tests                      │
+# └────────────────────────────────────────┘
+
+def test_skip_stable_measures():
+    ctx, policy = _ctx()
+
+    for i in range(3):
+        res, errlist = ctx.procedure_run(_proc())
+        assert _skipped(res) == []
+
+    res, errlist = ctx.procedure_run(_proc())
+    assert _skipped(res) == ["stable"]                             # Saved value and failed steps are run
+    assert res.result
+    assert res.tests[0].step_class == "skipped"
+    assert ctx.history.stats["stable"]["runs"] == 3                # Skipped runs not recorded
+
+    # Process change: all measures run until requalified
+    policy.process_change()
+    res, errlist = ctx.procedure_run(_proc())
+    assert _skipped(res) == []
+
+    for i in range(2):
+        ctx.procedure_run(_proc())
+
+    res, errlist = ctx.procedure_run(_proc())
+    assert _skipped(res) == ["stable", "flaky"]                    # Failures before the change are forgotten
+
+
+def test_skip_exclude():
+    ctx, policy = _ctx(exclude=["stable"])
+
+    for i in range(4):
+        res, errlist = ctx.procedure_run(_proc())
+
+    assert _skipped(res) == []
+
+
+def test_skip_audit():
+    ctx, policy = _ctx(audit_fraction=0.5)
+
+    for i in range(3):
+        ctx.procedure_run(_proc())
+
+    audits = 0
+    for i in range(40):
+        res, errlist = ctx.procedure_run(_proc())
+        audits      += int(not _skipped(res))
+
+    assert 5 < audits < 35
+
+    # Failure found on an audit run: the measure is run again
+    res = None
+    while (res is None) or _skipped(res):
+        res, errlist = ctx.procedure_run(_proc(value_stable=-1))
+
+    assert not res.result
+    assert not policy.skippable("stable")
+
+
+def test_skip_process_change_saved(tmp_path):
+    hist_path = str(tmp_path / "history.json")
+    base_path = str(tmp_path / "baseline.json")
+
+    hist   = Procedure_History(hist_path)
+    policy = Procedure_Skip_Policy(hist, min_runs=3, path=base_path)
+
+    for i in range(3):
+        hist.record("m", True, 0.1)
+
+    assert policy.skippable("m")
+
+    policy.process_change()
+    hist.save()
+    assert not policy.skippable("m")
+
+    # Station restart: the process change is kept
+    policy = Procedure_Skip_Policy(Procedure_History(hist_path), min_runs=3, path=base_path)
+    assert not policy.skippable("m")